@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_collector.py
+------------------
+image_collector.ImageCollector 마이크로 벤치마크.
+
+여러 MB 크기의 합성 HTML(텍스트 단락, 속성이 많은 태그, srcset/lazy-loading 이미지,
+picture/source, 인라인 style, 링크가 섞인 페이지)을 만들어, 통합 전 파서
+(download_images.py에 있던 dict(attrs) 기반 구현)와 처리량(pages/s, MB/s)을 비교합니다.
+네트워크나 디스크를 쓰지 않으며, 테스트가 아니라 성능 확인용 스크립트입니다.
+
+사용법:
+    python bench_collector.py                  # 4MB 페이지 3종, 각 5회
+    python bench_collector.py --size-mb 8 --repeat 10
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from image_collector import CSS_URL_RE, DATA_URL_RE, ImageCollector
+
+BASE_URL = "https://example.com/articles/index.html"
+
+
+# --------- 비교 기준: 통합 전 파서 ---------
+def legacy_choose_src_from_srcset(srcset: str, base_url: str) -> str | None:
+    try:
+        candidates = [c.strip() for c in srcset.split(",") if c.strip()]
+        if not candidates:
+            return None
+        return urljoin(base_url, candidates[-1].split()[0])
+    except Exception:
+        return None
+
+
+class LegacyImageCollector(HTMLParser):
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.image_urls: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs):
+        if tag.lower() == "img":
+            self._collect_from_attrs(dict(attrs))
+        else:
+            style = dict(attrs).get("style")
+            if style:
+                for m in CSS_URL_RE.finditer(style):
+                    url = m.group(2)
+                    if not DATA_URL_RE.match(url):
+                        self.image_urls.append(urljoin(self.base_url, url))
+
+    def _collect_from_attrs(self, attr: dict):
+        if attr.get("srcset"):
+            chosen = legacy_choose_src_from_srcset(attr["srcset"], self.base_url)
+            if chosen:
+                self.image_urls.append(chosen)
+                return
+        for key in ("src", "data-src", "data-original", "data-lazy", "data-echo",
+                    "data-image", "data-hires", "data-srcset"):
+            val = attr.get(key)
+            if val:
+                if "srcset" in key:
+                    chosen = legacy_choose_src_from_srcset(val, self.base_url)
+                    if chosen:
+                        self.image_urls.append(chosen)
+                        return
+                if not DATA_URL_RE.match(val):
+                    self.image_urls.append(urljoin(self.base_url, val))
+                    return
+
+
+# --------- 합성 HTML ---------
+WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+         "incididunt ut labore et dolore magna aliqua &amp; &quot;quoted&quot; 한글 본문").split()
+
+
+def _paragraph(rng: random.Random) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(30, 120)))
+    return f'<p class="body-text para-{rng.randint(1, 9)}" data-track="p{rng.randint(1, 9999)}">{text}</p>\n'
+
+
+def _image(rng: random.Random, i: int) -> str:
+    kind = rng.randrange(5)
+    if kind == 0:
+        return f'<img src="/img/{i}.jpg" alt="image {i}" width="640" height="480" loading="lazy">\n'
+    if kind == 1:
+        return (f'<img src="/img/{i}-320.jpg" srcset="/img/{i}-1280.jpg 1280w, /img/{i}-320.jpg 320w, '
+                f'/img/{i}-640.jpg 640w" sizes="(max-width: 600px) 100vw, 50vw" alt="r{i}">\n')
+    if kind == 2:
+        return (f'<img class="lazy" src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" '
+                f'data-src="/img/{i}.png" data-srcset="/img/{i}@2x.png 2x, /img/{i}.png 1x" alt="l{i}">\n')
+    if kind == 3:
+        return (f'<picture><source type="image/avif" srcset="/img/{i}.avif 1x, /img/{i}@2x.avif 2x">'
+                f'<source type="image/webp" srcset="/img/{i}.webp">'
+                f'<img src="/img/{i}.jpg" alt="p{i}"></picture>\n')
+    return f'<div class="hero" style="background-image: url(\'/img/bg-{i}.jpg\'); height: 300px"></div>\n'
+
+
+def make_page(size_bytes: int, seed: int, image_ratio: float) -> str:
+    """size_bytes 이상인 합성 HTML. image_ratio는 블록 중 이미지 블록의 비율"""
+    rng = random.Random(seed)
+    parts = ['<!doctype html><html><head><meta charset="utf-8"><title>bench</title>'
+             '<style>.logo { background: url(/img/logo.svg) no-repeat } .x { color: red }</style>'
+             '</head><body>\n']
+    size = len(parts[0])
+    i = 0
+    while size < size_bytes:
+        r = rng.random()
+        if r < image_ratio:
+            block = _image(rng, i)
+            i += 1
+        elif r < image_ratio + 0.1:
+            block = f'<a href="/articles/{rng.randint(1, 99999)}.html#top" class="nav-link" rel="next">다음 글</a>\n'
+        else:
+            block = _paragraph(rng)
+        parts.append(block)
+        size += len(block)
+    parts.append("</body></html>\n")
+    return "".join(parts)
+
+
+def bench(cls, html: str, repeat: int) -> tuple[float, int]:
+    """가장 빠른 실행 시간(초)과 찾은 이미지 수"""
+    best = float("inf")
+    found = 0
+    for _ in range(repeat):
+        parser = cls(BASE_URL)
+        start = time.perf_counter()
+        parser.feed(html)
+        parser.close()
+        best = min(best, time.perf_counter() - start)
+        found = len(parser.image_urls)
+    return best, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ImageCollector 처리량 벤치마크")
+    parser.add_argument("--size-mb", type=float, default=4.0, help="페이지 하나의 크기(MB, 기본 4)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수(가장 빠른 값 사용, 기본 5)")
+    args = parser.parse_args()
+
+    fixtures = {
+        "text-heavy (이미지 2%)": 0.02,
+        "mixed (이미지 20%)": 0.20,
+        "gallery (이미지 60%)": 0.60,
+    }
+    size = int(args.size_mb * 1024 * 1024)
+    print(f"{'페이지':<24} {'파서':<8} {'pages/s':>9} {'MB/s':>8} {'이미지':>8}")
+    for seed, (name, ratio) in enumerate(fixtures.items()):
+        html = make_page(size, seed, ratio)
+        mb = len(html.encode("utf-8")) / (1024 * 1024)
+        results = {}
+        for label, cls in (("legacy", LegacyImageCollector), ("unified", ImageCollector)):
+            elapsed, found = bench(cls, html, args.repeat)
+            results[label] = elapsed
+            print(f"{name:<24} {label:<8} {1 / elapsed:>9.2f} {mb / elapsed:>8.2f} {found:>8}")
+        print(f"{'':<24} 속도 향상: {results['legacy'] / results['unified']:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
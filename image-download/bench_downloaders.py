@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_downloaders.py
+--------------------
+이미지 다운로더(download_images.py / download_images_async.py) 처리량 벤치마크.
+
+실제 사이트 대신 로컬 합성 이미지 서버를 띄우고, 각 다운로더의 crawl()을
+시나리오별로 실행해 다음을 측정합니다.
+- images/s, MB/s (서버가 보낸 이미지 본문 기준)
+- 최대 메모리(peak RSS, 시나리오마다 별도 프로세스에서 측정)
+- 이미지별 지연 p50/p99 (download_image 호출 시작~끝. 동시성 대기 시간 포함)
+- 서버 쪽 요청 수와 상태 코드 분포(200 / 429 / 500)
+
+합성 서버는 이미지 개수·크기, 응답 지연, 오류(500) 비율, 429(Retry-After) 비율을
+옵션으로 조절하며, 결과는 변경 전후로 diff 할 수 있도록 키를 정렬한 JSON으로 출력합니다
+(-o 로 경로를 주면 그 파일에 저장).
+테스트가 아니라 성능 확인용 스크립트이며, aiohttp가 없으면 비동기 시나리오는 skipped로 기록합니다.
+
+사용법:
+    python bench_downloaders.py                                   # 기본 시나리오 전체
+    python bench_downloaders.py --images 500 --size-kb 128 --latency-ms 50 -o report.json
+    python bench_downloaders.py --scenarios sync-workers8,async --throttle-rate 0.1
+    python bench_downloaders.py --list                            # 시나리오 목록
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import os
+import platform
+import random
+import resource
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 시나리오 이름 -> (모듈, crawl 키워드 인자)
+SCENARIOS = {
+    "sync": ("download_images", {}),
+    "sync-workers8": ("download_images", {"workers": 8}),
+    "async": ("download_images_async", {"concurrency": 10}),
+    "async-stream": ("download_images_async", {"concurrency": 10, "stream": True}),
+    "async-adaptive": ("download_images_async", {"concurrency": 100, "adaptive": True}),
+}
+
+
+# --------- 합성 이미지 서버 ---------
+def make_image(index: int, size: int) -> bytes:
+    """PNG 시그니처/IHDR 뒤에 이미지마다 다른 의사 난수 바이트를 붙인 size 바이트 본문"""
+    header = b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + struct.pack(">II", 640, 480)
+    body = random.Random(index).randbytes(max(0, size - len(header)))
+    return header + body
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # 다운로더가 keep-alive 연결을 끊는 것은 정상 동작이므로 트레이스백을 찍지 않음
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+
+class SyntheticSite:
+    """페이지 하나와 이미지 N개를 제공하는 로컬 HTTP 서버(별도 스레드)"""
+
+    def __init__(self, images: int, size_kb: float, latency_ms: float, error_rate: float,
+                 throttle_rate: float, seed: int = 0):
+        self.images = [make_image(i, int(size_kb * 1024)) for i in range(images)]
+        self.latency = latency_ms / 1000
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset_stats()
+        self._server = _QuietServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def page_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/page.html"
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {"requests": 0, "image_bytes": 0, "status": {}}
+
+    def _count(self, status: int, nbytes: int = 0) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["image_bytes"] += nbytes
+            key = str(status)
+            self.stats["status"][key] = self.stats["status"].get(key, 0) + 1
+
+    def _roll(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def page(self) -> bytes:
+        tags = "".join(f'<img src="/img/{i}.png" alt="{i}">\n' for i in range(len(self.images)))
+        return f"<!doctype html><html><body>\n{tags}</body></html>".encode()
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # 헤더와 본문을 따로 보내므로, Nagle + 지연 ACK로 응답마다 ~40ms가 붙지 않게 함
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == "/page.html":
+                    site._count(200)
+                    return self._send(200, site.page(), "text/html; charset=utf-8")
+                name = self.path.rsplit("/", 1)[-1]
+                index = name.split(".", 1)[0]
+                if not (self.path.startswith("/img/") and index.isdigit() and int(index) < len(site.images)):
+                    site._count(404)
+                    return self._send(404, b"not found", "text/plain")
+                if site.latency:
+                    time.sleep(site.latency)
+                roll = site._roll()
+                if roll < site.throttle_rate:
+                    site._count(429)
+                    return self._send(429, b"", "text/plain", {"Retry-After": "1"})
+                if roll < site.throttle_rate + site.error_rate:
+                    site._count(500)
+                    return self._send(500, b"error", "text/plain")
+                body = site.images[int(index)]
+                site._count(200, len(body))
+                self._send(200, body, "image/png")
+
+        return Handler
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+# --------- 시나리오 실행(자식 프로세스) ---------
+def percentile(values: list[float], pct: float) -> float | None:
+    """nearest-rank 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_child(spec: dict) -> dict:
+    """현재 프로세스에서 시나리오 하나를 실행한다(peak RSS를 시나리오별로 재기 위해 자식 프로세스로 호출됨)."""
+    sys.path.insert(0, HERE)
+    module_name, kwargs = SCENARIOS[spec["scenario"]]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        return {"skipped": f"{module_name}를 불러올 수 없음: {e}"}
+
+    latencies: list[float] = []
+    saved = 0
+    original = module.download_image
+
+    # crawl()은 모듈 전역 download_image를 부르므로, 같은 함수를 시간 측정 래퍼로 감싼다
+    if module_name == "download_images_async":
+        async def timed(*args, **kw):
+            nonlocal saved
+            start = time.perf_counter()
+            try:
+                result = await original(*args, **kw)
+            finally:
+                latencies.append(time.perf_counter() - start)
+            saved += bool(result)
+            return result
+    else:
+        lock = threading.Lock()
+
+        def timed(*args, **kw):
+            nonlocal saved
+            start = time.perf_counter()
+            try:
+                result = original(*args, **kw)
+            finally:
+                elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                saved += bool(result)
+            return result
+    module.download_image = timed
+
+    out_dir = tempfile.mkdtemp(prefix="bench-dl-")
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), \
+                contextlib.redirect_stderr(devnull):
+            start = time.perf_counter()
+            if module_name == "download_images_async":
+                import asyncio
+                asyncio.run(module.crawl(spec["url"], out_dir, **kwargs))
+            else:
+                module.crawl(spec["url"], out_dir, **kwargs)
+            elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    # Linux는 KB, macOS는 바이트 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    return {
+        "elapsed_s": round(elapsed, 4),
+        "attempted": len(latencies),
+        "saved": saved,
+        "peak_rss_mb": round(peak_mb, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+            "p99": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+        },
+    }
+
+
+def run_scenario(site: SyntheticSite, scenario: str, timeout: float) -> dict:
+    site.reset_stats()
+    spec = json.dumps({"scenario": scenario, "url": site.page_url})
+    try:
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", spec],
+                              capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"error": f"{timeout:.0f}초 안에 끝나지 않음"}
+    if proc.returncode != 0 or not proc.stdout.strip():
+        return {"error": (proc.stderr.strip().splitlines() or ["알 수 없는 오류"])[-1]}
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    if "skipped" in result:
+        return result
+    server = dict(site.stats)
+    elapsed = result["elapsed_s"] or 1e-9
+    result["images_per_s"] = round(result["saved"] / elapsed, 2)
+    result["mb_per_s"] = round(server["image_bytes"] / (1024 * 1024) / elapsed, 2)
+    result["server"] = server
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 다운로더 처리량 벤치마크(로컬 합성 서버)")
+    parser.add_argument("--images", type=int, default=200, help="페이지의 이미지 수 (기본 200)")
+    parser.add_argument("--size-kb", type=float, default=64, help="이미지 하나의 크기 KB (기본 64)")
+    parser.add_argument("--latency-ms", type=float, default=20, help="이미지 응답 지연 ms (기본 20)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 0~1 (기본 0)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="429(Retry-After: 1) 응답 비율 0~1 (기본 0)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help=f"쉼표로 구분한 시나리오 (기본 전체: {','.join(SCENARIOS)})")
+    parser.add_argument("--timeout", type=float, default=600, help="시나리오당 제한 시간(초, 기본 600)")
+    parser.add_argument("-o", "--out", default=None, help="JSON 보고서를 저장할 경로 (기본: 표준 출력으로만 출력)")
+    parser.add_argument("--list", action="store_true", help="시나리오 목록만 출력")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(json.loads(args.child))))
+        return
+    if args.list:
+        for name, (module_name, kwargs) in SCENARIOS.items():
+            print(f"{name:<16} {module_name}.crawl({', '.join(f'{k}={v!r}' for k, v in kwargs.items())})")
+        return
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    site = SyntheticSite(args.images, args.size_kb, args.latency_ms, args.error_rate, args.throttle_rate)
+    site.start()
+    results = {}
+    try:
+        print(f"{'시나리오':<16} {'images/s':>9} {'MB/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'RSS MB':>8} {'저장':>6}")
+        for name in scenarios:
+            r = results[name] = run_scenario(site, name, args.timeout)
+            if "skipped" in r or "error" in r:
+                print(f"{name:<16} {r.get('skipped') or r.get('error')}")
+                continue
+            print(f"{name:<16} {r['images_per_s']:>9.1f} {r['mb_per_s']:>8.2f} {r['latency_ms']['p50']:>8.1f} "
+                  f"{r['latency_ms']['p99']:>8.1f} {r['peak_rss_mb']:>8.1f} {r['saved']:>6}")
+    finally:
+        site.stop()
+
+    report = {
+        "parameters": {
+            "images": args.images,
+            "size_kb": args.size_kb,
+            "latency_ms": args.latency_ms,
+            "error_rate": args.error_rate,
+            "throttle_rate": args.throttle_rate,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    if not args.out:
+        print(text, end="")
+        return
+    with open(args.out, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(f"보고서: {os.path.abspath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_import.py
+---------------
+OCR 진입점 모듈의 임포트 시간 예산 확인 (`python -X importtime`).
+
+모듈마다 새 인터프리터에서 `-X importtime -c "import <모듈>"` 을 --repeat 번 실행해
+가장 빠른 누적 임포트 시간을 예산과 비교하고, 추론을 시작하기 전에는 불러오면 안 되는
+무거운 모듈(PaddleOCR, paddle, OpenCV, NumPy)이 임포트되었는지 확인합니다.
+예산을 넘거나 무거운 모듈이 임포트되면 종료 코드 1로 끝나므로 변경 전후 회귀 확인에 쓸 수 있습니다.
+
+사용법:
+    python bench_import.py                         # 기본 진입점, 예산 150ms
+    python bench_import.py --budget-ms 100 --repeat 10
+    python bench_import.py extract_text_from_images
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_MODULES = ("extract_text_from_images", "ocr_server", "process_single_image")
+# --help / --dry-run / 설정 확인 / 서버 클라이언트만으로는 불러오면 안 되는 최상위 모듈
+HEAVY_MODULES = ("paddleocr", "paddle", "cv2", "numpy")
+
+
+def import_profile(module: str) -> tuple[float, set[str]]:
+    """(module의 누적 임포트 시간(초), 임포트된 최상위 모듈 이름 집합)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).parent, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} 임포트 실패:\n{proc.stderr.strip().splitlines()[-1]}")
+
+    cumulative = None
+    imported = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        name = name.strip()
+        if cumulative_us.strip().isdigit():
+            imported.add(name.split(".")[0])
+            if name == module:
+                cumulative = int(cumulative_us) / 1e6
+    if cumulative is None:
+        raise RuntimeError(f"{module} 의 임포트 시간을 찾을 수 없습니다 (이미 임포트된 모듈?)")
+    return cumulative, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 진입점 임포트 시간 예산 확인 (python -X importtime)")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES), help="확인할 모듈 (기본: OCR 진입점)")
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="모듈별 누적 임포트 시간 예산 (기본 150ms)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수(가장 빠른 값 사용, 기본 5)")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'모듈':<28} {'임포트(ms)':>10} {'예산(ms)':>9}  무거운 모듈")
+    for module in args.modules:
+        best = float("inf")
+        heavy = set()
+        for _ in range(max(1, args.repeat)):
+            seconds, imported = import_profile(module)
+            best = min(best, seconds)
+            heavy |= imported & set(HEAVY_MODULES)
+
+        over = best * 1000 > args.budget_ms
+        failed |= over or bool(heavy)
+        print(f"{module:<28} {best * 1000:>10.1f} {args.budget_ms:>9.0f}  "
+              f"{', '.join(sorted(heavy)) or '-'}{'  ← 예산 초과' if over else ''}")
+
+    if failed:
+        print("임포트 시간 예산을 넘었거나 무거운 모듈을 임포트했습니다.")
+        sys.exit(1)
+    print("모두 예산 안입니다.")
+
+
+if __name__ == "__main__":
+    main()
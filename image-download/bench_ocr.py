@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_ocr.py
+------------
+ImageTextExtractor OCR 처리량 벤치마크 (images/ 폴더의 실제 이미지 사용).
+
+- 배치 크기(ocr.batch_size)별로 같은 이미지들을 처리하며 단계별 시간
+  (전처리 / predict / markdown 생성)과 images/s 를 비교
+- --profiles 를 주면 전처리 프로필(none / fast / quality)과 크기 정규화(--max-width / --max-height)별
+  단계 시간(읽기 / 축소 / 노이즈 제거 / 대비 향상 / predict)과 정확도 차이를 비교.
+  정확도는 현재 기본 동작(quality, 축소 없음) 결과를 기준으로 한 텍스트 유사도(difflib)와
+  평균 신뢰도, 인식한 텍스트 박스 수로 표시
+모델 로드와 첫 predict(워밍업)는 측정에서 제외하고, 결과 markdown 파일은 쓰지 않습니다.
+PaddleOCR이 설치된 환경에서 실행하는 성능 확인용 스크립트입니다.
+
+사용법:
+    python bench_ocr.py                          # 배치 크기 1, 4, 8
+    python bench_ocr.py --batch-sizes 1,2,16 --limit 8
+    python bench_ocr.py --profiles none,fast,quality --max-width 1600
+    python bench_ocr.py -o bench_ocr.json        # 결과를 JSON으로도 저장
+"""
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import time
+
+from extract_text_from_images import ImageTextExtractor, config_manager, setup_logging
+
+STAGES = ("preprocess", "predict", "markdown")
+PROFILE_STAGES = ("read", "resize", "denoise", "contrast", "predict")
+
+
+def run_batches(extractor: ImageTextExtractor, image_files: list, batch_size: int) -> dict:
+    """image_files를 batch_size장씩 처리한 단계별 시간(초)"""
+    stages = dict.fromkeys(STAGES, 0.0)
+    for i in range(0, len(image_files), batch_size):
+        batch = image_files[i:i + batch_size]
+
+        start = time.perf_counter()
+        images = [extractor.preprocess_image(path) for path in batch]
+        stages["preprocess"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = extractor.predict_batch(images)
+        stages["predict"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for path, ocr_result in zip(batch, results):
+            extractor.build_markdown(path, ocr_result)
+        stages["markdown"] += time.perf_counter() - start
+    return stages
+
+
+def bench_batches(extractor: ImageTextExtractor, image_files: list, batch_sizes: list) -> list:
+    runs = []
+    print(f"{'batch':>5} {'전처리(s)':>10} {'predict(s)':>11} {'markdown(s)':>12} {'합계(s)':>9} {'images/s':>9}")
+    for batch_size in batch_sizes:
+        stages = run_batches(extractor, image_files, batch_size)
+        total = sum(stages.values())
+        run = {"batch_size": batch_size, "total_s": round(total, 4),
+               "images_per_s": round(len(image_files) / total, 3),
+               **{f"{name}_s": round(seconds, 4) for name, seconds in stages.items()}}
+        runs.append(run)
+        print(f"{batch_size:>5} {stages['preprocess']:>10.2f} {stages['predict']:>11.2f} "
+              f"{stages['markdown']:>12.3f} {total:>9.2f} {run['images_per_s']:>9.2f}")
+    return runs
+
+
+def run_profile(extractor: ImageTextExtractor, image_files: list) -> tuple[dict, dict]:
+    """현재 전처리 설정으로 이미지마다 전처리 + predict. (단계별 시간, 이미지별 결과 항목)"""
+    timings = dict.fromkeys(PROFILE_STAGES, 0.0)
+    results = {}
+    for path in image_files:
+        image, _ = extractor.preprocess_image_scaled(path, timings)
+        start = time.perf_counter()
+        results[path.name] = extractor.predict_batch([image])[0]
+        timings["predict"] += time.perf_counter() - start
+    return timings, results
+
+
+def _joined_text(items: list) -> str:
+    return "\n".join(item["text"] for item in items if item.get("text"))
+
+
+def accuracy_vs_baseline(results: dict, baseline: dict) -> dict:
+    """기준 결과와의 평균 텍스트 유사도, 평균 신뢰도, 텍스트 박스 수"""
+    similarity = [difflib.SequenceMatcher(None, _joined_text(results[name]), _joined_text(baseline[name])).ratio()
+                  for name in baseline]
+    scores = [item["confidence"] for items in results.values() for item in items if item.get("text")]
+    return {
+        "similarity": sum(similarity) / len(similarity) if similarity else 0.0,
+        "mean_confidence": sum(scores) / len(scores) if scores else 0.0,
+        "boxes": len(scores),
+    }
+
+
+def bench_profiles(extractor: ImageTextExtractor, image_files: list, profiles: list,
+                   max_width: int, max_height: int) -> list:
+    img_config = extractor.config.image_processing
+    variants = [("quality", 0, 0)]  # 기준: 현재 기본 동작
+    variants += [(profile, max_width, max_height) for profile in profiles]
+
+    runs = []
+    baseline = None
+    print(f"{'프로필':<8} {'max_w':>6} {'max_h':>6} " + " ".join(f"{s:>9}" for s in PROFILE_STAGES)
+          + f" {'유사도':>7} {'신뢰도':>7} {'박스':>6}")
+    for i, (profile, width, height) in enumerate(variants):
+        if i > 0 and (profile, width, height) == variants[0]:
+            continue  # 기준과 같은 조합은 다시 측정하지 않음
+        img_config.profile, img_config.max_width, img_config.max_height = profile, width, height
+        timings, results = run_profile(extractor, image_files)
+        if baseline is None:
+            baseline = results
+        accuracy = accuracy_vs_baseline(results, baseline)
+        runs.append({"profile": profile, "max_width": width, "max_height": height,
+                     **{f"{stage}_s": round(seconds, 4) for stage, seconds in timings.items()},
+                     **{key: round(value, 4) for key, value in accuracy.items()}})
+        print(f"{profile:<8} {width:>6} {height:>6} " + " ".join(f"{timings[s]:>9.2f}" for s in PROFILE_STAGES)
+              + f" {accuracy['similarity']:>7.3f} {accuracy['mean_confidence']:>7.3f} {accuracy['boxes']:>6}")
+    return runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 처리량 벤치마크 (배치 크기 / 전처리 프로필)")
+    parser.add_argument("--batch-sizes", default="1,4,8", help="비교할 배치 크기(쉼표 구분, 기본 1,4,8)")
+    parser.add_argument("--profiles", help="비교할 전처리 프로필(쉼표 구분, 예: none,fast,quality)")
+    parser.add_argument("--max-width", type=int, default=0, help="프로필 비교 시 적용할 최대 너비(0: 축소 안 함)")
+    parser.add_argument("--max-height", type=int, default=0, help="프로필 비교 시 적용할 최대 높이(0: 축소 안 함)")
+    parser.add_argument("--limit", type=int, default=0, help="사용할 이미지 수(0: 전부)")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",") if b.strip()]
+    config = config_manager.get_config()
+    setup_logging(config)
+    extractor = ImageTextExtractor(config)
+    image_files = extractor.find_image_files()
+    if args.limit > 0:
+        image_files = image_files[:args.limit]
+    if not image_files:
+        print(f"이미지가 없습니다: {extractor.images_dir}")
+        return
+
+    # 모델 로드와 첫 추론(그래프 초기화)은 측정에서 제외
+    extractor.predict_batch([extractor.preprocess_image(image_files[0])])
+
+    report = {"images": len(image_files), "cpu_threads": extractor.cpu_threads}
+    print(f"이미지 {len(image_files)}장, 추론 스레드 {extractor.cpu_threads}개")
+
+    if args.profiles:
+        profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+        report["profiles"] = bench_profiles(extractor, image_files, profiles, args.max_width, args.max_height)
+    else:
+        report["runs"] = bench_batches(extractor, image_files, batch_sizes)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_table.py
+--------------
+table_layout(표 구조 감지 / markdown 표 변환) 마이크로 벤치마크.
+
+ocr/ 폴더의 markdown 결과물을 OCR 박스로 되돌려(한 줄 = 한 행, 표의 칸 = 열 위치에 놓인 박스,
+좌표에 약간의 흔들림과 일부 칸 누락 포함) 페이지를 만들고, 통합 전 구현
+(extract_text_from_images.py에 있던 순수 Python 반복문)과 시간을 비교합니다.
+--copies 로 페이지를 세로로 이어 붙여 박스 수천 개짜리 빽빽한 표도 만들 수 있습니다.
+행 구분이 이전 구현과 같은지, 모든 텍스트가 표에 들어갔는지, 열이 원래 표와 맞는지도 확인합니다.
+PaddleOCR 없이 실행되는 성능 확인용 스크립트입니다.
+
+사용법:
+    python bench_table.py                  # fixture마다 1부, 전체 이어 붙인 페이지
+    python bench_table.py --copies 10 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+import table_layout
+
+ROW_DISTANCE_THRESHOLD = 20  # config.json 기본값
+LINE_HEIGHT = 34
+COLUMN_WIDTH = 240
+CHAR_WIDTH = 14
+
+
+# --------- 비교 기준: 통합 전 구현 ---------
+def legacy_detect_table_structure(ocr_result, row_distance_threshold):
+    if not ocr_result:
+        return {"is_table": False, "rows": []}
+    y_coordinates = []
+    for item in ocr_result:
+        if item.get('text'):
+            box = item['bbox']
+            y_center = sum(point[1] for point in box) / 4
+            y_coordinates.append(y_center)
+    if not y_coordinates:
+        return {"is_table": False, "rows": []}
+    y_coordinates.sort()
+    row_groups = []
+    current_group = [y_coordinates[0]]
+    for y in y_coordinates[1:]:
+        if y - current_group[-1] < row_distance_threshold:
+            current_group.append(y)
+        else:
+            row_groups.append(current_group)
+            current_group = [y]
+    row_groups.append(current_group)
+    return {"is_table": len(row_groups) >= 2, "rows": row_groups}
+
+
+def legacy_format_table_markdown(ocr_result, table_info):
+    if not table_info["is_table"]:
+        return ""
+    text_by_row = {}
+    for item in ocr_result:
+        if item.get('text'):
+            text = item['text']
+            confidence = item['confidence']
+            box = item['bbox']
+            y_center = sum(point[1] for point in box) / 4
+            x_center = sum(point[0] for point in box) / 4
+            min_distance = float('inf')
+            closest_row = 0
+            for i, row_y_coords in enumerate(table_info["rows"]):
+                row_y_avg = sum(row_y_coords) / len(row_y_coords)
+                distance = abs(y_center - row_y_avg)
+                if distance < min_distance:
+                    min_distance = distance
+                    closest_row = i
+            if closest_row not in text_by_row:
+                text_by_row[closest_row] = []
+            text_by_row[closest_row].append((x_center, text, confidence))
+    for row in text_by_row:
+        text_by_row[row].sort(key=lambda x: x[0])
+    markdown_table = ""
+    if 0 in text_by_row:
+        header_cells = [item[1] for item in text_by_row[0]]
+        markdown_table += "| " + " | ".join(header_cells) + " |\n"
+        markdown_table += "| " + " | ".join(["---"] * len(header_cells)) + " |\n"
+    for row_idx in sorted(text_by_row.keys()):
+        if row_idx == 0:
+            continue
+        cells = [item[1] for item in text_by_row[row_idx]]
+        markdown_table += "| " + " | ".join(cells) + " |\n"
+    return markdown_table
+
+
+# --------- markdown -> 합성 OCR 박스 ---------
+def _box(x: float, y: float, text: str) -> list:
+    width = max(CHAR_WIDTH, len(text) * CHAR_WIDTH)
+    return [[x, y], [x + width, y], [x + width, y + 24], [x, y + 24]]
+
+
+def page_from_markdown(lines: list[str], rng: random.Random, y0: float = 0.0) -> tuple[list, list]:
+    """(OCR 결과 항목, 원래 표 칸 (텍스트, 열 번호) 목록)"""
+    items = []
+    cells = []
+    y = y0
+    for line in lines:
+        line = line.strip()
+        if not line or set(line) <= set("|-: "):
+            continue  # 빈 줄, 표 구분선
+        if line.startswith("|"):
+            for col, text in enumerate(c.strip() for c in line.strip("|").split("|")):
+                if not text or rng.random() < 0.1:  # 인식 누락 흉내
+                    continue
+                x = 40 + col * COLUMN_WIDTH + rng.uniform(-12, 12)
+                items.append({'text': text, 'confidence': rng.uniform(0.6, 1.0),
+                              'bbox': _box(x, y + rng.uniform(-3, 3), text)})
+                cells.append((text, col))
+        else:
+            text = line.lstrip("#-* ").replace("**", "")
+            if text:
+                items.append({'text': text, 'confidence': rng.uniform(0.6, 1.0),
+                              'bbox': _box(40 + rng.uniform(-5, 5), y + rng.uniform(-3, 3), text)})
+        y += LINE_HEIGHT
+    return items, cells
+
+
+def bench(func, repeat: int) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def column_agreement(markdown: str, cells: list) -> float:
+    """원래 같은 열이던 칸들이 결과 표에서도 같은 열에 모인 비율 (열 번호별 최빈 열 기준)"""
+    position: dict[str, list[int]] = {}
+    for line in markdown.splitlines()[2:]:
+        for col, cell in enumerate(c.strip() for c in line.strip("|").split(" | ")):
+            if cell:
+                position.setdefault(cell, []).append(col)
+    by_true_col: dict[int, list[int]] = {}
+    for text, true_col in cells:
+        if position.get(text):
+            by_true_col.setdefault(true_col, []).append(position[text][0])
+    agree = total = 0
+    for cols in by_true_col.values():
+        agree += max(cols.count(c) for c in set(cols))
+        total += len(cols)
+    return agree / total if total else 1.0
+
+
+def run_case(name: str, items: list, cells: list, repeat: int):
+    legacy_time, legacy_md = bench(lambda: legacy_format_table_markdown(
+        items, legacy_detect_table_structure(items, ROW_DISTANCE_THRESHOLD)), repeat)
+    new_time, new_md = bench(lambda: table_layout.format_table_markdown(
+        items, table_layout.detect_table_structure(items, ROW_DISTANCE_THRESHOLD)), repeat)
+
+    same_rows = (legacy_detect_table_structure(items, ROW_DISTANCE_THRESHOLD)["rows"]
+                 == table_layout.detect_table_structure(items, ROW_DISTANCE_THRESHOLD)["rows"])
+    missing = sum(1 for item in items if item['text'].replace("|", "\\|") not in new_md)
+    print(f"{name[:36]:<36} {len(items):>6} {legacy_time * 1000:>10.1f} {new_time * 1000:>10.1f} "
+          f"{legacy_time / new_time:>7.1f}배 {'예' if same_rows else '아니오':>6} {missing:>5} "
+          f"{column_agreement(legacy_md, cells):>7.2f} {column_agreement(new_md, cells):>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="표 구조 감지 / markdown 표 변환 벤치마크")
+    parser.add_argument("--fixtures", default=str(Path(__file__).parent / "ocr"), help="markdown fixture 폴더")
+    parser.add_argument("--copies", type=int, default=1, help="전체 페이지를 이어 붙일 횟수(기본 1)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수(가장 빠른 값 사용, 기본 3)")
+    args = parser.parse_args()
+
+    fixtures = sorted(Path(args.fixtures).glob("*.md"))
+    if not fixtures:
+        print(f"fixture가 없습니다: {args.fixtures}")
+        return
+
+    rng = random.Random(0)
+    print(f"{'페이지':<36} {'박스':>6} {'이전(ms)':>10} {'NumPy(ms)':>10} {'속도':>8} {'행 일치':>6} "
+          f"{'누락':>5} {'열(이전)':>7} {'열(NumPy)':>7}")
+    all_items, all_cells = [], []
+    y0 = 0.0
+    for path in fixtures:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        items, cells = page_from_markdown(lines, rng)
+        run_case(path.stem, items, cells, args.repeat)
+        for _ in range(args.copies):
+            page, page_cells = page_from_markdown(lines, rng, y0)
+            all_items += page
+            all_cells += page_cells
+            y0 += (len(lines) + 2) * LINE_HEIGHT
+    run_case(f"전체 이어 붙임 ×{args.copies}", all_items, all_cells, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
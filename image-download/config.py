@@ -24,6 +24,14 @@ class OCRConfig:
     confidence_threshold_table: float = 0.5
     confidence_threshold_text: float = 0.3
     row_distance_threshold: int = 20
+    workers: int = 1  # 병렬 OCR 프로세스 수 (1: 순차 처리, 0: CPU 코어 수)
+    batch_size: int = 1  # predict 한 번에 넣는 이미지 수
+    tile_height: int = 0  # 이보다 높은 이미지는 가로 띠로 나눠 OCR (0: 사용 안 함)
+    tile_overlap: int = 160  # 이웃한 띠가 겹치는 높이 (tile_height의 절반까지)
+
+
+# 전처리 프로필: none(그레이스케일만), fast(median 노이즈 제거 + CLAHE), quality(NLM 노이즈 제거 + CLAHE)
+PREPROCESS_PROFILES = ('none', 'fast', 'quality')
 
 
 @dataclass
@@ -33,6 +41,9 @@ class ImageProcessingConfig:
     tile_grid_size: tuple = (8, 8)
     denoise_enabled: bool = True
     contrast_enhancement_enabled: bool = True
+    profile: str = 'quality'
+    max_width: int = 0  # 이보다 넓은 이미지는 노이즈 제거 전에 축소 (0: 사용 안 함)
+    max_height: int = 0  # 이보다 높은 이미지는 노이즈 제거 전에 축소 (0: 사용 안 함)
 
 
 @dataclass
@@ -78,7 +89,8 @@ class ConfigManager:
             config_file_path: 설정 파일 경로 (선택사항)
         """
         self.config_file_path = config_file_path or "config.json"
-        self._config = self._load_config()
+        # 설정 파일은 처음 get_config()를 부를 때 읽음 (임포트만으로 파일을 읽지 않도록)
+        self._config: Optional[AppConfig] = None
     
     def _load_config(self) -> AppConfig:
         """설정 로드 (환경변수 > 설정파일 > 기본값 순서)"""
@@ -114,6 +126,10 @@ class ConfigManager:
                 config.ocr.confidence_threshold_table = ocr_config.get('confidence_threshold_table', config.ocr.confidence_threshold_table)
                 config.ocr.confidence_threshold_text = ocr_config.get('confidence_threshold_text', config.ocr.confidence_threshold_text)
                 config.ocr.row_distance_threshold = ocr_config.get('row_distance_threshold', config.ocr.row_distance_threshold)
+                config.ocr.workers = ocr_config.get('workers', config.ocr.workers)
+                config.ocr.batch_size = ocr_config.get('batch_size', config.ocr.batch_size)
+                config.ocr.tile_height = ocr_config.get('tile_height', config.ocr.tile_height)
+                config.ocr.tile_overlap = ocr_config.get('tile_overlap', config.ocr.tile_overlap)
             
             # 이미지 처리 설정
             if 'image_processing' in file_config:
@@ -122,6 +138,9 @@ class ConfigManager:
                 config.image_processing.tile_grid_size = tuple(img_config.get('tile_grid_size', config.image_processing.tile_grid_size))
                 config.image_processing.denoise_enabled = img_config.get('denoise_enabled', config.image_processing.denoise_enabled)
                 config.image_processing.contrast_enhancement_enabled = img_config.get('contrast_enhancement_enabled', config.image_processing.contrast_enhancement_enabled)
+                config.image_processing.profile = img_config.get('profile', config.image_processing.profile)
+                config.image_processing.max_width = img_config.get('max_width', config.image_processing.max_width)
+                config.image_processing.max_height = img_config.get('max_height', config.image_processing.max_height)
             
             # 경로 설정
             if 'paths' in file_config:
@@ -155,11 +174,22 @@ class ConfigManager:
         config.ocr.confidence_threshold_table = self._get_float_env('OCR_CONFIDENCE_THRESHOLD_TABLE', config.ocr.confidence_threshold_table)
         config.ocr.confidence_threshold_text = self._get_float_env('OCR_CONFIDENCE_THRESHOLD_TEXT', config.ocr.confidence_threshold_text)
         config.ocr.row_distance_threshold = self._get_int_env('OCR_ROW_DISTANCE_THRESHOLD', config.ocr.row_distance_threshold)
+        config.ocr.workers = self._get_int_env('OCR_WORKERS', config.ocr.workers)
+        config.ocr.batch_size = self._get_int_env('OCR_BATCH_SIZE', config.ocr.batch_size)
+        config.ocr.tile_height = self._get_int_env('OCR_TILE_HEIGHT', config.ocr.tile_height)
+        config.ocr.tile_overlap = self._get_int_env('OCR_TILE_OVERLAP', config.ocr.tile_overlap)
         
         # 이미지 처리 설정
         config.image_processing.clip_limit = self._get_float_env('IMG_CLIP_LIMIT', config.image_processing.clip_limit)
         config.image_processing.denoise_enabled = self._get_bool_env('IMG_DENOISE_ENABLED', config.image_processing.denoise_enabled)
         config.image_processing.contrast_enhancement_enabled = self._get_bool_env('IMG_CONTRAST_ENHANCEMENT_ENABLED', config.image_processing.contrast_enhancement_enabled)
+        config.image_processing.profile = os.getenv('IMG_PROFILE', config.image_processing.profile)
+        config.image_processing.max_width = self._get_int_env('IMG_MAX_WIDTH', config.image_processing.max_width)
+        config.image_processing.max_height = self._get_int_env('IMG_MAX_HEIGHT', config.image_processing.max_height)
+
+        if config.image_processing.profile not in PREPROCESS_PROFILES:
+            logger.warning(f"알 수 없는 전처리 프로필 '{config.image_processing.profile}'. 기본값 quality를 사용합니다.")
+            config.image_processing.profile = 'quality'
         
         # 경로 설정
         config.paths.images_dir = os.getenv('IMAGES_DIR', config.paths.images_dir)
@@ -204,11 +234,13 @@ class ConfigManager:
     
     def get_config(self) -> AppConfig:
         """현재 설정 반환"""
+        if self._config is None:
+            self._config = self._load_config()
         return self._config
     
     def save_config(self, config: Optional[AppConfig] = None) -> None:
         """설정을 파일로 저장"""
-        config_to_save = config or self._config
+        config_to_save = config or self.get_config()
         config_path = Path(self.config_file_path)
         
         try:
@@ -221,12 +253,19 @@ class ConfigManager:
                     'confidence_threshold_table': config_to_save.ocr.confidence_threshold_table,
                     'confidence_threshold_text': config_to_save.ocr.confidence_threshold_text,
                     'row_distance_threshold': config_to_save.ocr.row_distance_threshold,
+                    'workers': config_to_save.ocr.workers,
+                    'batch_size': config_to_save.ocr.batch_size,
+                    'tile_height': config_to_save.ocr.tile_height,
+                    'tile_overlap': config_to_save.ocr.tile_overlap,
                 },
                 'image_processing': {
                     'clip_limit': config_to_save.image_processing.clip_limit,
                     'tile_grid_size': list(config_to_save.image_processing.tile_grid_size),
                     'denoise_enabled': config_to_save.image_processing.denoise_enabled,
                     'contrast_enhancement_enabled': config_to_save.image_processing.contrast_enhancement_enabled,
+                    'profile': config_to_save.image_processing.profile,
+                    'max_width': config_to_save.image_processing.max_width,
+                    'max_height': config_to_save.image_processing.max_height,
                 },
                 'paths': {
                     'images_dir': config_to_save.paths.images_dir,
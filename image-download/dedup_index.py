@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+dedup_index.py
+--------------
+이미지 다운로더(download_images.py / download_images_async.py) 공용 실행 간 중복 제거 인덱스.
+
+SQLite 파일 하나에 다음 두 매핑을 영구 보관합니다.
+- sha256 -> 저장 경로 (내용이 같은 이미지는 한 번만 기록)
+- URL -> sha256 (이미 받은 URL은 요청 자체를 생략)
+
+다른 출력 폴더에서 같은 내용이 다시 나오면 파일을 새로 쓰지 않고 하드링크합니다.
+(하드링크가 불가능한 파일시스템/장치 간에는 복사로 대체)
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import threading
+from typing import Callable
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    sha256 TEXT PRIMARY KEY,
+    path   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url    TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    sha256 TEXT NOT NULL,
+    dir    TEXT NOT NULL,
+    path   TEXT NOT NULL,
+    PRIMARY KEY (sha256, dir)
+);
+"""
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class DedupIndex:
+    """sha256/URL 영구 인덱스 (SQLite)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        parent = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(parent, exist_ok=True)
+        # download_images.py --workers 모드에서 여러 스레드가 같은 연결을 잠금으로 나눠 씀
+        self._db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self.known_urls = 0
+        self.linked = 0
+
+    def path_for_hash(self, sha256: str) -> str | None:
+        """내용 해시로 저장된 파일 경로(파일이 아직 남아 있을 때만)"""
+        with self._lock:
+            row = self._db.execute("SELECT path FROM objects WHERE sha256 = ?", (sha256,)).fetchone()
+        if row and os.path.exists(row[0]):
+            return row[0]
+        return None
+
+    def lookup_url(self, url: str) -> tuple[str, str] | None:
+        """이미 받은 URL이면 (sha256, 저장 경로)"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT o.sha256, o.path FROM urls u JOIN objects o ON o.sha256 = u.sha256 WHERE u.url = ?",
+                (url,),
+            ).fetchone()
+        if row and os.path.exists(row[1]):
+            return row[0], row[1]
+        return None
+
+    def _record_file(self, sha256: str, path: str) -> None:
+        path = os.path.abspath(path)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files (sha256, dir, path) VALUES (?, ?, ?)",
+                (sha256, os.path.dirname(os.path.realpath(path)), path),
+            )
+
+    def add(self, url: str, sha256: str, path: str | None = None) -> None:
+        """URL과 내용을 기록한다. 같은 해시의 기존 저장 경로가 살아 있으면 유지한다."""
+        with self._lock:
+            if path and self.path_for_hash(sha256) is None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO objects (sha256, path) VALUES (?, ?)",
+                    (sha256, os.path.abspath(path)),
+                )
+                self._record_file(sha256, path)
+            self._db.execute("INSERT OR REPLACE INTO urls (url, sha256) VALUES (?, ?)", (url, sha256))
+
+    def place(self, sha256: str, stored_path: str, out_dir: str,
+              allocate: Callable[[str], str]) -> str | None:
+        """이미 저장된 파일을 out_dir에 하드링크한다.
+
+        Args:
+            sha256: 내용 해시
+            stored_path: 인덱스에 기록된 기존 파일
+            out_dir: 이번 실행의 저장 폴더
+            allocate: 확장자를 받아 out_dir 안의 새 파일 경로를 돌려주는 함수
+
+        Returns:
+            새로 만든 링크 경로. 같은 내용이 이미 out_dir에 있으면 None
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT path FROM files WHERE sha256 = ? AND dir = ?",
+                (sha256, os.path.realpath(out_dir)),
+            ).fetchone()
+            if row and os.path.exists(row[0]):
+                return None
+            dst = allocate(os.path.splitext(stored_path)[1])
+            link_or_copy(stored_path, dst)
+            self._record_file(sha256, dst)
+            self.linked += 1
+            return dst
+
+    def close(self) -> None:
+        self._db.close()
+
+    def stats_line(self) -> str:
+        return f"중복 인덱스: 기존 URL {self.known_urls}개 요청 생략, 하드링크 {self.linked}개"
@@ -10,20 +10,47 @@ download_images.py
 - srcset에서 가장 큰 후보 선택
 - 중복(내용 동일) 방지
 - 파일명 충돌 방지 및 확장자 추론
+- 호스트별 keep-alive 연결 재사용, 이미지당 GET 1회
+- --cache-dir 지정 시 ETag/Last-Modified 조건부 요청으로 변경 없는 이미지는 본문 생략
+- --dedup-db 지정 시 실행 간 중복 제거(이미 받은 URL은 요청 생략, 같은 내용은 하드링크)
+- --layout cas 지정 시 ab/cd/<sha256>.<ext> 내용 주소 저장 + manifest.jsonl
+- --stream-html 지정 시 HTML을 받는 대로 파싱해 발견한 이미지부터 바로 다운로드
+- --workers N 지정 시 스레드 N개로 동시 다운로드(진행 상황은 발견 순서대로 출력)
+- --archive out.tar(.zip) 지정 시 이미지마다 파일을 만들지 않고 하나의 아카이브에 이어 붙여 저장
+  (사이드카 인덱스 out.tar.index.jsonl로 압축 해제 없이 멤버를 바로 읽을 수 있음)
+- --min-bytes/--min-width/--min-height 지정 시 Content-Length와 본문 앞부분(이미지 헤더)만 보고
+  작은 이미지는 나머지 본문을 받지 않고 건너뜀
 사용법:
     python download_images.py "https://example.com" -o ./images
+    python download_images.py "https://example.com" -o ./images --cache-dir ./.cache
+    python download_images.py "https://example.com" -o ./images --dedup-db ./images.db
+    python download_images.py "https://example.com" -o ./store --layout cas
+    python download_images.py "https://example.com" -o ./images --workers 8
+    python download_images.py "https://example.com" -o ./images --min-width 64 --min-height 64
+    python download_images.py "https://example.com" --archive ./images.tar
 """
 from __future__ import annotations
 
 import argparse
+import codecs
 import hashlib
+import http.client
 import os
 import re
 import sys
+import threading
 import time
-from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.error import HTTPError
 from urllib.parse import urljoin, urlparse
-from urllib.request import Request, urlopen
+
+from dedup_index import DedupIndex
+from http_cache import HTTPCache
+from image_archive import ImageArchive
+from image_collector import DATA_URL_RE, ImageCollector, collect_images_from_html
+from image_probe import PROBE_BYTES, SizeFilter
+from object_store import ObjectStore
 
 # --------- Utilities ---------
 USER_AGENT = (
@@ -46,9 +73,6 @@ IMAGE_EXTS = {
     "image/avif": ".avif",
 }
 
-DATA_URL_RE = re.compile(r"^data:", re.IGNORECASE)
-CSS_URL_RE = re.compile(r'url\((["\']?)(.+?)\1\)')
-
 def sanitize_filename(name: str) -> str:
     name = re.sub(r"[^\w\-. ]+", "_", name)
     name = name.strip()
@@ -61,72 +85,129 @@ def guess_ext_from_url(url: str) -> str:
         return ext
     return ""
 
-def choose_src_from_srcset(srcset: str, base_url: str) -> str | None:
-    # Pick the last candidate (보통 가장 큰 해상도)
-    # Format: "img1.jpg 320w, img2.jpg 640w, img3.jpg 1024w"
-    try:
-        candidates = [c.strip() for c in srcset.split(",") if c.strip()]
-        if not candidates:
-            return None
-        last = candidates[-1]
-        url_part = last.split()[0]
-        return urljoin(base_url, url_part)
-    except Exception:
-        return None
+# --------- Networking ---------
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+# --stream-html 에서 HTML을 읽어 파서에 넘기는 단위
+HTML_CHUNK_SIZE = 16 * 1024
+
+class ConnectionPool:
+    """호스트별 keep-alive 연결 풀 (http.client 기반)
 
-# --------- HTML Parser ---------
-class ImageCollector(HTMLParser):
-    def __init__(self, base_url: str):
-        super().__init__(convert_charrefs=True)
-        self.base_url = base_url
-        self.image_urls: list[str] = []
+    urlopen은 요청마다 새 TCP/TLS 연결을 맺으므로, 같은 호스트의 이미지를
+    수백 개 받을 때는 연결을 재사용해 핸드셰이크 비용을 없앤다.
+    """
 
-    def handle_starttag(self, tag: str, attrs):
-        if tag.lower() == "img":
-            self._collect_from_attrs(dict(attrs))
+    def __init__(self, timeout: float = 30, maxsize: int = 4):
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()  # --workers 모드에서 여러 스레드가 공유
+
+    @staticmethod
+    def _key(url: str) -> tuple[str, str, int]:
+        parts = urlparse(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"지원하지 않는 URL 스킴: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        return scheme, parts.hostname or "", port
+
+    def _new_conn(self, key: tuple[str, str, int]) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _get_conn(self, key) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_conn(key), False
+
+    def _put_conn(self, key, conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _release(self, key, conn, resp: http.client.HTTPResponse):
+        # 본문을 끝까지 읽은 응답만 연결을 돌려놓을 수 있다
+        if resp.isclosed() and not resp.will_close:
+            self._put_conn(key, conn)
         else:
-            # style="background-image:url(...)" 형태도 수집
-            attr_dict = dict(attrs)
-            style = attr_dict.get("style")
-            if style:
-                for m in CSS_URL_RE.finditer(style):
-                    url = m.group(2)
-                    if not DATA_URL_RE.match(url):
-                        self.image_urls.append(urljoin(self.base_url, url))
-
-    def _collect_from_attrs(self, attr: dict):
-        # 우선순위: srcset(가장 큰 것) -> src -> data-* 후보들
-        for key in ("srcset",):
-            if attr.get(key):
-                chosen = choose_src_from_srcset(attr[key], self.base_url)
-                if chosen:
-                    self.image_urls.append(chosen)
-                    return
-        for key in ("src", "data-src", "data-original", "data-lazy", "data-echo",
-                    "data-image", "data-hires", "data-srcset"):
-            val = attr.get(key)
-            if val:
-                # data-srcset 같은 경우에도 srcset 규칙 적용 시도
-                if "srcset" in key:
-                    chosen = choose_src_from_srcset(val, self.base_url)
-                    if chosen:
-                        self.image_urls.append(chosen)
-                        return
-                if not DATA_URL_RE.match(val):
-                    self.image_urls.append(urljoin(self.base_url, val))
-                    return
+            conn.close()
 
-# --------- Networking ---------
-def fetch(url: str) -> bytes:
-    req = Request(url, headers={"User-Agent": USER_AGENT})
-    with urlopen(req, timeout=30) as resp:
-        return resp.read()
+    def _send(self, key, url: str, headers: dict[str, str]):
+        parts = urlparse(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        conn, reused = self._get_conn(key)
+        try:
+            conn.request("GET", target, headers=headers)
+            return conn, conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+        # 서버가 닫아버린 유휴 연결이었다면 새 연결로 한 번만 재시도
+        conn = self._new_conn(key)
+        conn.request("GET", target, headers=headers)
+        return conn, conn.getresponse()
+
+    @contextmanager
+    def open(self, url: str, headers: dict[str, str] | None = None):
+        """GET 요청을 보내고 응답을 돌려준다(리다이렉트 추적, 4xx/5xx는 HTTPError).
+
+        응답 본문을 끝까지 읽으면 연결은 풀로 반환되고, 중간에 빠져나가면 닫힌다.
+        최종 URL은 ``resp.url`` 에 담긴다.
+        """
+        req_headers = {"User-Agent": USER_AGENT}
+        if headers:
+            req_headers.update(headers)
+        for _ in range(MAX_REDIRECTS + 1):
+            key = self._key(url)
+            conn, resp = self._send(key, url, req_headers)
+            location = resp.getheader("Location")
+            if resp.status in REDIRECT_STATUSES and location:
+                resp.read()
+                self._release(key, conn, resp)
+                url = urljoin(url, location)
+                continue
+            if resp.status >= 400:
+                conn.close()
+                raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+            resp.url = url
+            try:
+                yield resp
+            finally:
+                self._release(key, conn, resp)
+            return
+        raise HTTPError(url, 310, "리다이렉트가 너무 많습니다", None, None)
+
+    def close(self):
+        with self._lock:
+            for idle in self._idle.values():
+                for conn in idle:
+                    conn.close()
+            self._idle.clear()
+
+    def __enter__(self):
+        return self
 
-def fetch_head(url: str):
-    # urllib에는 HEAD 편의가 없어 GET 후 헤더만 참고
-    req = Request(url, headers={"User-Agent": USER_AGENT})
-    with urlopen(req, timeout=30) as resp:
-        return resp.info()
+    def __exit__(self, *exc):
+        self.close()
+
+def fetch(url: str, pool: ConnectionPool | None = None) -> bytes:
+    if pool is None:
+        with ConnectionPool() as tmp_pool:
+            return fetch(url, tmp_pool)
+    with pool.open(url) as resp:
+        return resp.read()
 
 # --------- Download Logic ---------
 def ensure_dir(path: str):
@@ -144,90 +225,302 @@ def unique_path(base_dir: str, base_name: str, ext: str) -> str:
             return candidate
         i += 1
 
-def download_image(url: str, out_dir: str, seen_hashes: set[str]) -> str | None:
+class PathAllocator:
+    """스레드 안전한 파일명 할당기(--workers 모드용)
+
+    unique_path()는 존재 여부만 보므로, 두 스레드가 파일을 만들기 전에 같은 이름을
+    받을 수 있다. 이미 내준 이름을 기억해 두고 잠금 안에서 할당한다.
+    """
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self._lock = threading.Lock()
+        self._reserved: set[str] = set()
+
+    def allocate(self, base_name: str, ext: str) -> str:
+        base = sanitize_filename(base_name)
+        with self._lock:
+            candidate = os.path.join(self.base_dir, base + ext)
+            i = 2
+            while candidate in self._reserved or os.path.exists(candidate):
+                candidate = os.path.join(self.base_dir, f"{base}_{i}{ext}")
+                i += 1
+            self._reserved.add(candidate)
+            return candidate
+
+# seen_hashes 검사와 추가를 한 번에(--workers 모드에서 같은 내용을 두 번 저장하지 않도록)
+_seen_lock = threading.Lock()
+
+def claim_hash(seen_hashes: set[str], h: str) -> bool:
+    """처음 보는 해시면 기록하고 True"""
+    with _seen_lock:
+        if h in seen_hashes:
+            return False
+        seen_hashes.add(h)
+        return True
+
+def url_base_name(url: str) -> str:
+    base_name = os.path.basename(urlparse(url).path) or "image"
+    return os.path.splitext(base_name)[0] or "image"
+
+def place_existing(url: str, h: str, stored_path: str, out_dir: str, allocate,
+                   index: DedupIndex, store: ObjectStore | None) -> str | None:
+    """이미 저장된 같은 내용을 이번 저장 위치에 하드링크한다(이미 있으면 None)."""
+    if store:
+        ext = os.path.splitext(stored_path)[1]
+        path, created = store.link_existing(stored_path, h, ext)
+        store.record(url, sanitize_filename(url_base_name(url)) + ext, path, h)
+        return path if created else None
+    return index.place(h, stored_path, out_dir, allocate)
+
+def download_image(url: str, out_dir: str, seen_hashes: set[str],
+                   pool: ConnectionPool, cache: HTTPCache | None = None,
+                   index: DedupIndex | None = None,
+                   store: ObjectStore | None = None,
+                   allocator: PathAllocator | None = None,
+                   size_filter: SizeFilter | None = None,
+                   archive: ImageArchive | None = None) -> str | None:
     try:
         if DATA_URL_RE.match(url):
             return None
 
-        headers = fetch_head(url)
-        content_type = headers.get_content_type() if headers else None
+        base_name = url_base_name(url)
+        if allocator:
+            allocate = lambda ext: allocator.allocate(base_name, ext)
+        else:
+            allocate = lambda ext: unique_path(out_dir, base_name, ext)
+
+        # 이전 실행에서 받은 URL이면 요청하지 않고 기존 파일을 재사용
+        if index:
+            known = index.lookup_url(url)
+            if known:
+                h, stored_path = known
+                index.known_urls += 1
+                if not claim_hash(seen_hashes, h):
+                    return None
+                return place_existing(url, h, stored_path, out_dir, allocate, index, store)
+
+        # 헤더 확인과 본문 다운로드를 한 번의 GET 응답으로 처리
+        headers = cache.conditional_headers(url) if cache else None
+        with pool.open(url, headers) as resp:
+            if resp.status == 304 and headers:
+                resp.read()
+                entry = cache.hit(url)
+                claim_hash(seen_hashes, entry["sha256"])
+                if index:
+                    index.add(url, entry["sha256"], entry["path"])
+                print(f" -> 변경 없음(캐시): {entry['path']}")
+                return None
+            content_type = resp.headers.get_content_type()
+            response_headers = resp.headers
+            head = b""
+            if size_filter:
+                reason = size_filter.check_length(resp.getheader("Content-Length"))
+                if not reason and size_filter.needs_probe:
+                    # 가로/세로를 읽을 만큼만 먼저 받고, 작으면 나머지는 받지 않고 연결을 닫음
+                    while not size_filter.probe_done(head):
+                        chunk = resp.read1(PROBE_BYTES - len(head))
+                        if not chunk:
+                            break
+                        head += chunk
+                    reason = size_filter.check_head(head)
+                if reason:
+                    size_filter.skip(url, reason)
+                    return None
+            data = head + resp.read()
+        # Content-Length가 없던 응답은 받은 뒤 실제 크기로 판단
+        reason = size_filter.check_length(len(data)) if size_filter else None
+        if reason:
+            size_filter.skip(url, reason)
+            return None
+        if cache:
+            cache.miss()
         ext = IMAGE_EXTS.get(content_type or "", "")
 
         # 확장자 추론 실패 시 URL에서 추정
         if not ext:
             ext = guess_ext_from_url(url) or ".bin"
 
-        # 실제 다운로드
-        data = fetch(url)
-
         # 중복 검사(내용 해시)
         h = hashlib.sha256(data).hexdigest()
-        if h in seen_hashes:
+        if not claim_hash(seen_hashes, h):
+            if index:
+                index.add(url, h)
+            existing = store.find(h) if store else None
+            if existing:
+                store.record(url, sanitize_filename(base_name) + ext, existing, h)
+            if cache:
+                # 이 URL의 검증자도 기존 파일을 가리키게 저장해 다음 실행에서 304로 건너뜀
+                cache.store_duplicate(url, response_headers, h, existing or (index.path_for_hash(h) if index else None))
             return None
-        seen_hashes.add(h)
 
-        # 파일명 결정
-        path_part = urlparse(url).path
-        base_name = os.path.basename(path_part) or "image"
-        base_name = os.path.splitext(base_name)[0] or "image"
-        save_path = unique_path(out_dir, base_name, ext)
+        if archive:
+            # 이전 실행에서 이미 넣은 내용이면 created=False
+            name, created = archive.put_bytes(data, h, sanitize_filename(base_name) + ext, url)
+            return f"{archive.path}:{name}" if created else None
+
+        # 이전 실행에서 같은 내용을 저장했다면 새로 쓰지 않고 하드링크
+        stored_path = index.path_for_hash(h) if index else None
+        if stored_path:
+            index.add(url, h, stored_path)
+            return place_existing(url, h, stored_path, out_dir, allocate, index, store)
 
-        with open(save_path, "wb") as f:
-            f.write(data)
-        return save_path
+        if store:
+            save_path, created = store.put_bytes(data, h, ext)
+            store.record(url, sanitize_filename(base_name) + ext, save_path, h)
+        else:
+            save_path, created = allocate(ext), True
+            with open(save_path, "wb") as f:
+                f.write(data)
+        if cache:
+            cache.store(url, response_headers, save_path, h)
+        if index:
+            index.add(url, h, save_path)
+        return save_path if created else None
     except Exception as e:
         sys.stderr.write(f"[WARN] Failed: {url} -> {e}\n")
         return None
 
-def collect_images_from_html(html: str, base_url: str) -> list[str]:
-    parser = ImageCollector(base_url)
-    parser.feed(html)
-    # 중복 URL 제거(순서 유지)
-    seen = set()
-    uniq = []
-    for u in parser.image_urls:
-        if u not in seen:
-            uniq.append(u)
-            seen.add(u)
-    return uniq
-
-def crawl(url: str, out_dir: str) -> tuple[int, int]:
-    ensure_dir(out_dir)
-    req = Request(url, headers={"User-Agent": USER_AGENT})
-    with urlopen(req, timeout=30) as resp:
-        html_bytes = resp.read()
+def iter_images_streaming(pool: ConnectionPool, url: str):
+    """HTML을 HTML_CHUNK_SIZE 단위로 받으면서 파싱해, 새로 발견한 이미지 URL을 바로 내보낸다.
+
+    페이지 연결은 순회가 끝날 때까지 열려 있으므로, 그 사이 이미지 요청은 풀의
+    다른 연결로 나가고 페이지 전송과 이미지 다운로드가 겹친다.
+    """
+    with pool.open(url) as resp:
         charset = resp.headers.get_content_charset() or "utf-8"
         try:
-            html = html_bytes.decode(charset, errors="replace")
-        except Exception:
-            html = html_bytes.decode("utf-8", errors="replace")
-        base_url = resp.geturl()  # redirects 고려
-
-    img_urls = collect_images_from_html(html, base_url)
-    print(f"발견한 이미지 URL 수: {len(img_urls)}")
-    saved = 0
-    skipped = 0
-    seen_hashes: set[str] = set()
-    for i, img_url in enumerate(img_urls, 1):
-        print(f"[{i}/{len(img_urls)}] 다운로드 중: {img_url}")
-        path = download_image(img_url, out_dir, seen_hashes)
-        if path:
-            saved += 1
-            print(f" -> 저장 완료: {path}")
+            decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        parser = ImageCollector(resp.url)  # redirects 고려
+        seen = set()
+        while True:
+            chunk = resp.read1(HTML_CHUNK_SIZE)
+            if chunk:
+                parser.feed(decoder.decode(chunk))
+            else:
+                parser.feed(decoder.decode(b"", final=True))
+                parser.close()
+            found, parser.image_urls = parser.image_urls, []
+            for u in found:
+                if u not in seen:
+                    seen.add(u)
+                    yield u
+            if not chunk:
+                return
+
+def crawl(url: str, out_dir: str, cache_dir: str | None = None,
+          dedup_db: str | None = None, layout: str = "flat",
+          stream_html: bool = False, workers: int = 1,
+          min_bytes: int = 0, min_width: int = 0, min_height: int = 0,
+          archive_path: str | None = None) -> tuple[int, int]:
+    ensure_dir(out_dir)
+    archive = ImageArchive(archive_path) if archive_path else None
+    size_filter = SizeFilter(min_bytes, min_width, min_height)
+    size_filter = size_filter if size_filter.enabled else None
+    cache = HTTPCache(cache_dir) if cache_dir else None
+    index = DedupIndex(dedup_db) if dedup_db else None
+    store = ObjectStore(out_dir) if layout == "cas" else None
+    with ConnectionPool(maxsize=max(4, workers)) as pool:
+        if stream_html:
+            img_urls = iter_images_streaming(pool, url)
+            total = "?"
+        else:
+            with pool.open(url) as resp:
+                html_bytes = resp.read()
+                charset = resp.headers.get_content_charset() or "utf-8"
+                try:
+                    html = html_bytes.decode(charset, errors="replace")
+                except Exception:
+                    html = html_bytes.decode("utf-8", errors="replace")
+                base_url = resp.url  # redirects 고려
+
+            img_urls = collect_images_from_html(html, base_url)
+            total = len(img_urls)
+            print(f"발견한 이미지 URL 수: {total}")
+        saved = 0
+        skipped = 0
+        seen_hashes: set[str] = set()
+        if workers > 1:
+            allocator = PathAllocator(out_dir)
+
+            def task(img_url: str) -> tuple[str, str | None]:
+                return img_url, download_image(img_url, out_dir, seen_hashes, pool, cache, index, store, allocator,
+                                                 size_filter, archive)
+
+            # map()은 제출 순서대로 결과를 돌려주므로 진행 상황도 발견 순서대로 출력됨
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for i, (img_url, path) in enumerate(executor.map(task, img_urls), 1):
+                    print(f"[{i}/{total}] {img_url}")
+                    if path:
+                        saved += 1
+                        print(f" -> 저장 완료: {path}")
+                    else:
+                        skipped += 1
         else:
-            skipped += 1
+            for i, img_url in enumerate(img_urls, 1):
+                print(f"[{i}/{total}] 다운로드 중: {img_url}")
+                path = download_image(img_url, out_dir, seen_hashes, pool, cache, index, store,
+                                      size_filter=size_filter, archive=archive)
+                if path:
+                    saved += 1
+                    print(f" -> 저장 완료: {path}")
+                else:
+                    skipped += 1
+    if cache:
+        cache.save()
+        print(cache.stats_line())
+    if index:
+        print(index.stats_line())
+        index.close()
+    if size_filter:
+        print(size_filter.stats_line())
+    if archive:
+        archive.close()
+        print(archive.stats_line())
+    if store:
+        store.close()
+        print(f"매니페스트: {store.manifest_path}")
     return saved, skipped
 
 def main():
     parser = argparse.ArgumentParser(description="웹페이지의 모든 이미지를 로컬로 저장합니다.")
     parser.add_argument("url", help="대상 웹페이지 URL")
     parser.add_argument("-o", "--out", default=None, help="저장 폴더(기본: ./images_YYYYmmdd_HHMMSS)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="HTTP 캐시 폴더(지정 시 ETag/Last-Modified로 재검증하여 변경 없는 이미지는 건너뜀)")
+    parser.add_argument("--dedup-db", default=None,
+                        help="실행 간 중복 제거 인덱스(SQLite) 파일. 이미 받은 URL은 건너뛰고 같은 내용은 하드링크")
+    parser.add_argument("--layout", choices=("flat", "cas"), default="flat",
+                        help="저장 방식: flat(원본 파일명, 기본) / cas(ab/cd/<sha256>.<ext> + manifest.jsonl)")
+    parser.add_argument("--stream-html", action="store_true",
+                        help="HTML을 받는 대로 파싱해 발견한 이미지부터 바로 다운로드(큰 페이지용)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="동시 다운로드 스레드 수(기본 1: 순차 다운로드)")
+    parser.add_argument("--min-bytes", type=int, default=0,
+                        help="이 용량(바이트)보다 작은 이미지는 건너뜀(Content-Length로 판단)")
+    parser.add_argument("--min-width", type=int, default=0,
+                        help="가로가 이보다 작은 이미지는 건너뜀(본문 앞부분의 PNG/JPEG/GIF/WebP 헤더로 판단)")
+    parser.add_argument("--min-height", type=int, default=0,
+                        help="세로가 이보다 작은 이미지는 건너뜀")
+    parser.add_argument("--archive", default=None,
+                        help="이미지를 하나의 .tar/.zip 아카이브에 이어 붙여 저장(인덱스: <아카이브>.index.jsonl)")
     args = parser.parse_args()
+    if args.archive and (args.cache_dir or args.dedup_db or args.layout == "cas"):
+        parser.error("--archive는 --cache-dir, --dedup-db, --layout cas와 함께 쓸 수 없습니다")
 
-    out_dir = args.out or f"./images_{time.strftime('%Y%m%d_%H%M%S')}"
-    saved, skipped = crawl(args.url, out_dir)
+    if args.archive:
+        out_dir = args.out or os.path.dirname(os.path.abspath(args.archive))
+    else:
+        out_dir = args.out or f"./images_{time.strftime('%Y%m%d_%H%M%S')}"
+    saved, skipped = crawl(args.url, out_dir, args.cache_dir, args.dedup_db, args.layout, args.stream_html,
+                           args.workers, args.min_bytes, args.min_width, args.min_height, args.archive)
     print("\n===== 결과 =====")
-    print(f"저장 폴더: {os.path.abspath(out_dir)}")
+    if args.archive:
+        print(f"아카이브: {os.path.abspath(args.archive)}")
+    else:
+        print(f"저장 폴더: {os.path.abspath(out_dir)}")
     print(f"저장: {saved}개, 건너뜀: {skipped}개")
 
 if __name__ == "__main__":
@@ -10,19 +10,41 @@ download_images_async.py
 
 사용법:
     python download_images_async.py "https://example.com" -o ./images
+    python download_images_async.py "https://example.com" --stream   # 대용량 이미지: 청크 단위로 디스크에 기록
+    python download_images_async.py "https://example.com" --cache-dir ./.cache   # 변경 없는 이미지는 304로 건너뜀
+    python download_images_async.py "https://example.com" --dedup-db ./images.db # 실행 간 중복 제거(하드링크)
+    python download_images_async.py "https://example.com" -o ./store --layout cas  # ab/cd/<sha256>.<ext> 저장
+    python download_images_async.py "https://example.com" --depth 2 --same-host   # 링크를 따라 사이트 전체 수집
+    python download_images_async.py "https://a.example/1" "https://a.example/2"   # 여러 페이지를 한 번에
+    python download_images_async.py "https://example.com" --stream-html  # HTML 수신과 이미지 다운로드를 겹쳐 진행
+    python download_images_async.py "https://example.com" --adaptive     # 호스트별 동시성 자동 조절(AIMD)
+    python download_images_async.py "https://example.com" --run-manifest run.jsonl  # 중단 후 같은 명령으로 이어받기
+    python download_images_async.py "https://example.com" --min-width 64 --min-height 64  # 아이콘·추적 픽셀 제외
+    python download_images_async.py "https://example.com" --archive images.tar  # 파일 하나(tar/zip)에 이어 붙여 저장
 """
 import argparse
 import asyncio
+import codecs
 import hashlib
 import os
 import re
+import tempfile
+import threading
 import time
-from html.parser import HTMLParser
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 import aiohttp
 import aiofiles
 
+from dedup_index import DedupIndex
+from host_limiter import MAX_RETRIES, RETRY_STATUSES, HostLimiter, parse_retry_after
+from http_cache import HTTPCache
+from image_archive import ImageArchive
+from image_collector import ImageCollector, collect_images_and_links, collect_images_from_html, crawlable_links
+from image_probe import PROBE_BYTES, SizeFilter
+from object_store import ObjectStore
+from run_manifest import RunManifest
+
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
@@ -41,8 +63,14 @@ IMAGE_EXTS = {
     "image/avif": ".avif",
 }
 
-DATA_URL_RE = re.compile(r"^data:", re.IGNORECASE)
-CSS_URL_RE = re.compile(r'url\((["\']?)(.+?)\1\)')
+# 스트리밍 모드에서 한 번에 읽어 디스크에 쓰는 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# --stream-html 에서 HTML을 읽어 파서에 넘기는 단위
+HTML_CHUNK_SIZE = 16 * 1024
+
+# 재귀 크롤링 시 대기 중인 페이지 수 상한(가득 차면 새 링크는 버리고 나중에 다시 발견되면 추가)
+FRONTIER_SIZE = 100_000
 
 def sanitize_filename(name: str) -> str:
     return re.sub(r"[^\w\-.]+", "_", name) or "image"
@@ -54,119 +82,630 @@ def guess_ext_from_url(url: str) -> str:
         return ext
     return ""
 
-def choose_src_from_srcset(srcset: str, base_url: str) -> str | None:
-    try:
-        candidates = [c.strip() for c in srcset.split(",") if c.strip()]
-        if not candidates:
-            return None
-        last = candidates[-1]
-        url_part = last.split()[0]
-        return urljoin(base_url, url_part)
-    except Exception:
-        return None
-
-class ImageCollector(HTMLParser):
-    def __init__(self, base_url: str):
-        super().__init__(convert_charrefs=True)
-        self.base_url = base_url
-        self.image_urls: list[str] = []
-
-    def handle_starttag(self, tag: str, attrs):
-        if tag.lower() == "img":
-            self._collect_from_attrs(dict(attrs))
-        else:
-            style = dict(attrs).get("style")
-            if style:
-                for m in CSS_URL_RE.finditer(style):
-                    self.image_urls.append(urljoin(self.base_url, m.group(2)))
-
-    def _collect_from_attrs(self, attr: dict):
-        if attr.get("srcset"):
-            chosen = choose_src_from_srcset(attr["srcset"], self.base_url)
-            if chosen:
-                self.image_urls.append(chosen)
-                return
-        for key in ("src", "data-src", "data-original", "data-lazy", "data-image"):
-            val = attr.get(key)
-            if val and not DATA_URL_RE.match(val):
-                self.image_urls.append(urljoin(self.base_url, val))
-                return
-
 async def fetch_html(session: aiohttp.ClientSession, url: str) -> str:
     async with session.get(url, timeout=30) as resp:
         html = await resp.text(errors="replace")
         return html
 
-def collect_images_from_html(html: str, base_url: str) -> list[str]:
-    parser = ImageCollector(base_url)
-    parser.feed(html)
-    seen, uniq = set(), []
-    for u in parser.image_urls:
-        if u not in seen:
-            uniq.append(u)
-            seen.add(u)
-    return uniq
-
-async def download_image(session, url: str, out_dir: str, seen_hashes: set[str], sem: asyncio.Semaphore):
-    async with sem:
+async def fetch_page(session: aiohttp.ClientSession, url: str) -> tuple[str, str] | None:
+    """HTML 페이지면 (본문, 리다이렉트 후 최종 URL), 아니면 None"""
+    async with session.get(url, timeout=30) as resp:
+        if resp.status != 200 or resp.content_type not in ("text/html", "application/xhtml+xml"):
+            return None
+        html = await resp.text(errors="replace")
+        return html, str(resp.url)
+
+async def stream_page(session: aiohttp.ClientSession, url: str, on_image) -> tuple[list[str], str] | None:
+    """HTML을 받는 대로 ImageCollector에 넘기고, 새로 발견한 이미지 URL마다 ``await on_image(u)``.
+
+    페이지 전송이 끝나기 전에 다운로드가 시작되도록 하는 파이프라인 모드.
+    HTML 페이지면 (링크 목록, 최종 URL), 아니면 None
+    """
+    async with session.get(url, timeout=30) as resp:
+        if resp.status != 200 or resp.content_type not in ("text/html", "application/xhtml+xml"):
+            return None
         try:
-            async with session.get(url, timeout=30) as resp:
-                if resp.status != 200:
-                    print(f"[WARN] {url} -> HTTP {resp.status}")
-                    return None
+            decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        base_url = str(resp.url)
+        parser = ImageCollector(base_url)
+        seen = set()
 
-                content_type = resp.headers.get("Content-Type", "").split(";")[0]
-                ext = IMAGE_EXTS.get(content_type, "") or guess_ext_from_url(url) or ".bin"
-                data = await resp.read()
+        async def drain():
+            found, parser.image_urls = parser.image_urls, []
+            for u in found:
+                if u not in seen:
+                    seen.add(u)
+                    await on_image(u)
 
-            h = hashlib.sha256(data).hexdigest()
-            if h in seen_hashes:
-                return None
-            seen_hashes.add(h)
+        async for chunk in resp.content.iter_chunked(HTML_CHUNK_SIZE):
+            parser.feed(decoder.decode(chunk))
+            await drain()
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+        await drain()
+
+    return crawlable_links(parser.links), base_url
+
+class URLSeen:
+    """URL 중복 검사용 집합
 
-            base_name = os.path.basename(urlparse(url).path) or "image"
-            base_name = os.path.splitext(base_name)[0] or "image"
-            base_name = sanitize_filename(base_name)
-            save_path = os.path.join(out_dir, base_name + ext)
+    URL 문자열 대신 64비트 해시(blake2b)만 보관해, 수백만 개 URL도 적은 메모리로 기억한다.
+    (충돌 확률은 1억 개 기준 약 0.03%로, 놓친 URL 하나를 건너뛰는 정도의 영향)
+    """
 
+    def __init__(self):
+        self._digests: set[int] = set()
+
+    @staticmethod
+    def _digest(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def __contains__(self, url: str) -> bool:
+        return self._digest(url) in self._digests
+
+    def add(self, url: str) -> bool:
+        """처음 본 URL이면 기록하고 True"""
+        d = self._digest(url)
+        if d in self._digests:
+            return False
+        self._digests.add(d)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+def url_base_name(url: str) -> str:
+    base_name = os.path.basename(urlparse(url).path) or "image"
+    base_name = os.path.splitext(base_name)[0] or "image"
+    return sanitize_filename(base_name)
+
+def allocate_save_path(out_dir: str, url: str, ext: str) -> str:
+    base_name = url_base_name(url)
+    save_path = os.path.join(out_dir, base_name + ext)
+
+    i = 2
+    while os.path.exists(save_path):
+        save_path = os.path.join(out_dir, f"{base_name}_{i}{ext}")
+        i += 1
+    return save_path
+
+class PathAllocator:
+    """스레드 안전한 파일명 할당기
+
+    파일명 결정은 스레드 풀에서 동시에 실행되므로, 파일을 만들기 전에 두 작업이 같은
+    이름을 받지 않도록 이미 내준 이름을 기억해 두고 잠금 안에서 할당한다.
+    """
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self._lock = threading.Lock()
+        self._reserved: set[str] = set()
+
+    def allocate(self, url: str, ext: str) -> str:
+        base_name = url_base_name(url)
+        with self._lock:
+            save_path = os.path.join(self.out_dir, base_name + ext)
             i = 2
-            while os.path.exists(save_path):
-                save_path = os.path.join(out_dir, f"{base_name}_{i}{ext}")
+            while save_path in self._reserved or os.path.exists(save_path):
+                save_path = os.path.join(self.out_dir, f"{base_name}_{i}{ext}")
                 i += 1
+            self._reserved.add(save_path)
+            return save_path
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+async def stream_to_tempfile(resp: aiohttp.ClientResponse, out_dir: str, head: bytes = b"") -> tuple[str, str]:
+    """응답 본문을 청크 단위로 임시 파일에 쓰면서 SHA-256을 함께 계산한다.
+
+    head는 크기 필터가 이미 읽어 둔 본문 앞부분이다.
+
+    Returns:
+        (임시 파일 경로, 해시 hex)
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix=".dl-", suffix=".part")
+    os.close(fd)
+    h = hashlib.sha256()
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            h.update(head)
+            await f.write(head)
+            async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                h.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return tmp_path, h.hexdigest()
+
+async def stream_to_partfile(resp: aiohttp.ClientResponse, part_path: str, offset: int = 0,
+                             head: bytes = b"") -> str:
+    """응답 본문을 이어받기용 .part 파일에 쓰고 전체 내용의 SHA-256을 돌려준다.
+
+    offset > 0 이면 기존 .part 내용을 먼저 해시에 반영한 뒤 그 뒤에 덧붙인다.
+    중간에 실패해도 파일은 남겨 두어 다음 실행에서 이어받을 수 있게 한다.
+    """
+    os.makedirs(os.path.dirname(part_path), exist_ok=True)
+    h = hashlib.sha256()
+    if offset:
+        async with aiofiles.open(part_path, "rb") as f:
+            while chunk := await f.read(STREAM_CHUNK_SIZE):
+                h.update(chunk)
+    async with aiofiles.open(part_path, "ab" if offset else "wb") as f:
+        h.update(head)
+        await f.write(head)
+        async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+            h.update(chunk)
+            await f.write(chunk)
+    return h.hexdigest()
+
+async def probe_head(resp: aiohttp.ClientResponse, size_filter: SizeFilter) -> tuple[bytes, str | None]:
+    """Content-Length와 본문 앞부분(이미지 헤더)만으로 크기 필터를 적용한다.
+
+    Returns:
+        (이미 읽은 본문 앞부분, 건너뛸 사유 또는 None)
+    """
+    head = b""
+    reason = size_filter.check_length(resp.headers.get("Content-Length"))
+    if not reason and size_filter.needs_probe:
+        while not size_filter.probe_done(head):
+            chunk = await resp.content.read(PROBE_BYTES - len(head))
+            if not chunk:
+                break
+            head += chunk
+        reason = size_filter.check_head(head)
+    return head, reason
 
-            async with aiofiles.open(save_path, "wb") as f:
-                await f.write(data)
+def content_range_start(resp: aiohttp.ClientResponse) -> int | None:
+    # "bytes 1000-1999/2000" -> 1000
+    m = re.match(r"bytes (\d+)-", resp.headers.get("Content-Range", ""))
+    return int(m.group(1)) if m else None
 
+def place_existing(url: str, h: str, stored_path: str, out_dir: str, allocate,
+                   index: DedupIndex, store: ObjectStore | None) -> str | None:
+    """이미 저장된 같은 내용을 이번 저장 위치에 하드링크한다(이미 있으면 None)."""
+    if store:
+        ext = os.path.splitext(stored_path)[1]
+        path, created = store.link_existing(stored_path, h, ext)
+        store.record(url, url_base_name(url) + ext, path, h)
+        save_path = path if created else None
+    else:
+        save_path = index.place(h, stored_path, out_dir, allocate)
+    if save_path:
+        print(f"[LINK] {url} -> {save_path}")
+    return save_path
+
+async def download_image(session, url: str, out_dir: str, seen_hashes: set[str], sem: asyncio.Semaphore,
+                         stream: bool = False, cache: HTTPCache | None = None,
+                         index: DedupIndex | None = None, store: ObjectStore | None = None,
+                         limiter: HostLimiter | None = None, manifest: RunManifest | None = None,
+                         allocator: PathAllocator | None = None, size_filter: SizeFilter | None = None,
+                         archive: ImageArchive | None = None):
+    """이미지 하나를 내려받아 저장한다.
+
+    해시 계산, SQLite 조회, 파일명 결정/이동 같은 CPU·파일시스템 작업은
+    asyncio.to_thread로 스레드 풀에서 실행해 이벤트 루프를 막지 않는다.
+    """
+    limiter = limiter or HostLimiter(adaptive=False)
+    host = urlparse(url).hostname or ""
+    loop = asyncio.get_running_loop()
+    # 이어받기는 .part 파일이 있어야 하므로 실행 매니페스트를 쓰면 항상 스트리밍
+    stream = stream or manifest is not None
+    part_path = None
+    try:
+        if allocator:
+            allocate = lambda ext: allocator.allocate(url, ext)
+        else:
+            allocate = lambda ext: allocate_save_path(out_dir, url, ext)
+
+        # 이전 실행에서 완료한 URL은 건너뜀
+        if manifest and manifest.is_done(url):
+            manifest.skipped += 1
+            if manifest.get(url).get("sha256"):
+                seen_hashes.add(manifest.get(url)["sha256"])
+            return None
+
+        # 이전 실행에서 받은 URL이면 요청하지 않고 기존 파일을 재사용
+        if index:
+            known = await asyncio.to_thread(index.lookup_url, url)
+            if known:
+                h, stored_path = known
+                index.known_urls += 1
+                if h in seen_hashes:
+                    return None
+                seen_hashes.add(h)
+                if manifest:
+                    manifest.mark(url, "done", sha256=h, path=stored_path)
+                return await asyncio.to_thread(place_existing, url, h, stored_path, out_dir, allocate, index, store)
+
+        tmp_path = None
+        headers = cache.conditional_headers(url) if cache else None
+        offset, validator = 0, None
+        if manifest:
+            part_path = manifest.part_path(url, out_dir)
+            offset, validator = manifest.resume_offset(url, part_path)
+        req_headers = dict(headers or {})
+        if offset:
+            # 검증자가 그대로면 206으로 나머지만, 바뀌었으면 200으로 전체를 받음
+            req_headers["Range"] = f"bytes={offset}-"
+            req_headers["If-Range"] = validator
+        for attempt in range(MAX_RETRIES + 1):
+            # 호스트 자리를 먼저 잡아, 백오프 중인 호스트가 전체 동시성 자리를 차지하지 않게 함
+            async with limiter.slot(host), sem:
+                started = loop.time()
+                async with session.get(url, timeout=30, headers=req_headers) as resp:
+                    if resp.status in RETRY_STATUSES:
+                        delay = limiter.throttled(host, parse_retry_after(resp.headers.get("Retry-After")), attempt)
+                        if attempt < MAX_RETRIES:
+                            print(f"[RETRY] {url} -> HTTP {resp.status}, {delay:.1f}초 후 재시도")
+                            continue
+                    else:
+                        limiter.success(host, loop.time() - started)
+                    if resp.status == 304 and headers:
+                        entry = cache.hit(url)
+                        seen_hashes.add(entry["sha256"])
+                        if index:
+                            await asyncio.to_thread(index.add, url, entry["sha256"], entry["path"])
+                        print(f"[CACHE] {url} -> 변경 없음: {entry['path']}")
+                        if manifest:
+                            manifest.mark(url, "done", sha256=entry["sha256"], path=entry["path"])
+                        return None
+                    resumed = bool(offset) and resp.status == 206 and content_range_start(resp) == offset
+                    if resp.status != 200 and not resumed:
+                        print(f"[WARN] {url} -> HTTP {resp.status}")
+                        if manifest:
+                            manifest.mark(url, "failed", error=f"HTTP {resp.status}")
+                        return None
+
+                    content_type = resp.headers.get("Content-Type", "").split(";")[0]
+                    ext = IMAGE_EXTS.get(content_type, "") or guess_ext_from_url(url) or ".bin"
+                    head = b""
+                    if size_filter and not resumed:
+                        # 작은 이미지면 나머지 본문은 받지 않고 응답을 닫음
+                        head, reason = await probe_head(resp, size_filter)
+                        if reason:
+                            size_filter.skip(url, reason)
+                            if manifest:
+                                manifest.mark(url, "filtered", reason=reason)
+                            return None
+                    if cache:
+                        cache.miss()
+                    if manifest:
+                        # 본문을 받기 전에 partial로 기록해 두어 강제 종료되어도 이어받을 수 있게 함
+                        manifest.mark(url, "partial", part=part_path,
+                                      etag=resp.headers.get("ETag"),
+                                      last_modified=resp.headers.get("Last-Modified"))
+                        if resumed:
+                            manifest.resumed += 1
+                            print(f"[RESUME] {url} -> {offset}바이트부터 이어받기")
+                        h = await stream_to_partfile(resp, part_path, offset if resumed else 0, head)
+                        tmp_path = part_path
+                    elif stream:
+                        tmp_path, h = await stream_to_tempfile(resp, out_dir, head)
+                    else:
+                        data = head + await resp.read()
+            break
+
+        # Content-Length가 없던 응답은 받은 뒤 실제 크기로 판단
+        if size_filter and size_filter.min_bytes:
+            size = await asyncio.to_thread(os.path.getsize, tmp_path) if tmp_path else len(data)
+            reason = size_filter.check_length(size)
+            if reason:
+                if tmp_path:
+                    await asyncio.to_thread(os.remove, tmp_path)
+                size_filter.skip(url, reason)
+                if manifest:
+                    manifest.mark(url, "filtered", reason=reason)
+                return None
+
+        if not stream:
+            h = await asyncio.to_thread(sha256_hex, data)
+        if h in seen_hashes:
+            if tmp_path:
+                await asyncio.to_thread(os.remove, tmp_path)
+            if index:
+                await asyncio.to_thread(index.add, url, h)
+            existing = await asyncio.to_thread(store.find, h) if store else None
+            if existing:
+                store.record(url, url_base_name(url) + ext, existing, h)
+            if cache:
+                # 이 URL의 검증자도 기존 파일을 가리키게 저장해 다음 실행에서 304로 건너뜀
+                if not existing and index:
+                    existing = await asyncio.to_thread(index.path_for_hash, h)
+                cache.store_duplicate(url, resp.headers, h, existing)
+            if manifest:
+                manifest.mark(url, "done", sha256=h, duplicate=True)
+            return None
+        seen_hashes.add(h)
+
+        if archive:
+            # 이전 실행에서 이미 넣은 내용이면 created=False
+            name = url_base_name(url) + ext
+            if tmp_path:
+                member, created = await asyncio.to_thread(archive.put_file, tmp_path, h, name, url)
+            else:
+                member, created = await asyncio.to_thread(archive.put_bytes, data, h, name, url)
+            save_path = f"{archive.path}:{member}"
+            if manifest:
+                manifest.mark(url, "done", sha256=h, path=save_path)
+            if not created:
+                return None
             print(f"[OK] {url} -> {save_path}")
             return save_path
-        except Exception as e:
-            print(f"[ERROR] {url} -> {e}")
-            return None
 
-async def crawl(url: str, out_dir: str, concurrency: int = 10):
+        # 이전 실행에서 같은 내용을 저장했다면 새로 쓰지 않고 하드링크
+        stored_path = await asyncio.to_thread(index.path_for_hash, h) if index else None
+        if stored_path:
+            if tmp_path:
+                await asyncio.to_thread(os.remove, tmp_path)
+            await asyncio.to_thread(index.add, url, h, stored_path)
+            if manifest:
+                manifest.mark(url, "done", sha256=h, path=stored_path)
+            return await asyncio.to_thread(place_existing, url, h, stored_path, out_dir, allocate, index, store)
+
+        if store:
+            # 임시 파일을 끝까지 쓴 뒤 ab/cd/<sha256><ext>로 배타적 게시(파일명 탐색 없음)
+            if not tmp_path:
+                tmp_path = store.new_tempfile()
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    await f.write(data)
+            save_path, created = await asyncio.to_thread(store.put_file, tmp_path, h, ext)
+            store.record(url, url_base_name(url) + ext, save_path, h)
+            if manifest:
+                manifest.mark(url, "done", sha256=h, path=save_path)
+            if not created:
+                return None
+        else:
+            save_path = await asyncio.to_thread(allocate, ext)
+            if tmp_path:
+                await asyncio.to_thread(os.replace, tmp_path, save_path)
+            else:
+                async with aiofiles.open(save_path, "wb") as f:
+                    await f.write(data)
+        if cache:
+            cache.store(url, resp.headers, save_path, h)
+        if index:
+            await asyncio.to_thread(index.add, url, h, save_path)
+        if manifest and not store:
+            manifest.mark(url, "done", sha256=h, path=save_path)
+
+        print(f"[OK] {url} -> {save_path}")
+        return save_path
+    except Exception as e:
+        print(f"[ERROR] {url} -> {e}")
+        if manifest:
+            rec = manifest.get(url)
+            # 받다 만 본문이 남아 있으면 partial 기록을 유지해 다음 실행에서 이어받음
+            if not (rec and rec.get("status") == "partial" and part_path and os.path.exists(part_path)):
+                manifest.mark(url, "failed", error=str(e))
+        return None
+
+class DownloadQueue:
+    """고정된 수의 워커가 이미지 URL을 처리하는 유한 대기열
+
+    URL마다 코루틴을 미리 만들지 않고 워커 수만큼만 태스크를 두며, 대기열 크기도
+    제한하므로 URL이 수만 개여도 메모리가 늘지 않는다. 결과는 끝나는 대로 saved에 쌓인다.
+    """
+
+    def __init__(self, download, concurrency: int):
+        self._download = download
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 4)
+        self.saved: list[str] = []
+        self.queued = 0
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(concurrency)]
+
+    async def put(self, url: str):
+        """대기열이 가득 차 있으면 자리가 날 때까지 기다린다(생산자 쪽 배압)."""
+        self.queued += 1
+        await self._queue.put(url)
+
+    async def _worker(self):
+        while True:
+            url = await self._queue.get()
+            try:
+                path = await self._download(url)
+                if path:
+                    self.saved.append(path)
+            except Exception as e:
+                # 잘못된 URL 하나 때문에 워커가 죽으면 자리가 줄고 join()이 끝나지 않으므로 기록만 하고 계속
+                print(f"[ERROR] {url} -> {e}")
+            finally:
+                self._queue.task_done()
+
+    async def join(self) -> list[str]:
+        await self._queue.join()
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        return self.saved
+
+async def crawl_frontier(session, start_urls: list[str], depth: int, same_host: bool,
+                         concurrency: int, download, stream_html: bool = False) -> list[str]:
+    """여러 페이지를 링크를 따라(최대 depth 단계) 방문하며 이미지를 내려받는다.
+
+    페이지 대기열은 FRONTIER_SIZE로 제한하고, 이미지 대기열은 동시성의 몇 배로 제한해
+    발견 속도가 다운로드 속도보다 빨라도 메모리가 일정하게 유지된다.
+    """
+    pages: asyncio.Queue = asyncio.Queue(maxsize=FRONTIER_SIZE)
+    images = DownloadQueue(download, concurrency)
+    seen_pages, seen_images = URLSeen(), URLSeen()
+    allowed_hosts = {urlparse(u).hostname for u in start_urls}
+    stats = {"pages": 0, "dropped": 0}
+
+    def enqueue_page(page_url: str, page_depth: int):
+        if page_url in seen_pages:
+            return
+        try:
+            pages.put_nowait((page_url, page_depth))
+        except asyncio.QueueFull:
+            # 대기열이 가득 차면 버리고, 다른 페이지에서 다시 발견되면 그때 추가
+            stats["dropped"] += 1
+            return
+        seen_pages.add(page_url)
+
+    async def push_image(u: str):
+        if seen_images.add(u):
+            await images.put(u)
+
+    async def page_worker():
+        while True:
+            page_url, page_depth = await pages.get()
+            try:
+                if stream_html:
+                    page = await stream_page(session, page_url, push_image)
+                    if page:
+                        print(f"[PAGE] {page_url} (depth {page_depth}): 링크 {len(page[0])}개")
+                else:
+                    page = await fetch_page(session, page_url)
+                    if page:
+                        html, base_url = page
+                        img_urls, links = await asyncio.to_thread(collect_images_and_links, html, base_url)
+                        print(f"[PAGE] {page_url} (depth {page_depth}): 이미지 {len(img_urls)}개, 링크 {len(links)}개")
+                        for u in img_urls:
+                            await push_image(u)
+                        page = links, base_url
+                if page:
+                    links = page[0]
+                    stats["pages"] += 1
+                    if page_depth < depth:
+                        for link in links:
+                            if not same_host or urlparse(link).hostname in allowed_hosts:
+                                enqueue_page(link, page_depth + 1)
+            except Exception as e:
+                print(f"[ERROR] {page_url} -> {e}")
+            finally:
+                pages.task_done()
+
+    for u in start_urls:
+        enqueue_page(u, 0)
+    workers = [asyncio.create_task(page_worker()) for _ in range(min(4, concurrency))]
+    await pages.join()
+    saved = await images.join()
+    for w in workers:
+        w.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+    print(f"방문한 페이지: {stats['pages']}개, 발견된 이미지: {len(seen_images)}개")
+    if stats["dropped"]:
+        print(f"[WARN] 대기열이 가득 차 버린 링크: {stats['dropped']}개")
+    return saved
+
+async def crawl(url: str | list[str], out_dir: str, concurrency: int = 10, stream: bool = False,
+                cache_dir: str | None = None, dedup_db: str | None = None, layout: str = "flat",
+                depth: int = 0, same_host: bool = False, stream_html: bool = False,
+                adaptive: bool = False, max_per_host: int = 32, run_manifest: str | None = None,
+                min_bytes: int = 0, min_width: int = 0, min_height: int = 0,
+                archive_path: str | None = None):
+    start_urls = [url] if isinstance(url, str) else list(url)
     os.makedirs(out_dir, exist_ok=True)
+    cache = HTTPCache(cache_dir) if cache_dir else None
+    index = DedupIndex(dedup_db) if dedup_db else None
+    store = ObjectStore(out_dir) if layout == "cas" else None
+    manifest = RunManifest(run_manifest) if run_manifest else None
+    archive = ImageArchive(archive_path) if archive_path else None
+    size_filter = SizeFilter(min_bytes, min_width, min_height)
+    size_filter = size_filter if size_filter.enabled else None
+    # adaptive가 아니면 호스트별 상한은 전체 동시성과 같게 고정(429/503 백오프·재시도만 적용)
+    limiter = HostLimiter(max_per_host if adaptive else concurrency, adaptive=adaptive)
     connector = aiohttp.TCPConnector(limit=concurrency)
     sem = asyncio.Semaphore(concurrency)
     async with aiohttp.ClientSession(connector=connector, headers={"User-Agent": USER_AGENT}) as session:
-        html = await fetch_html(session, url)
-        img_urls = collect_images_from_html(html, url)
-        print(f"발견된 이미지: {len(img_urls)}개")
-
         seen_hashes: set[str] = set()
-        tasks = [download_image(session, u, out_dir, seen_hashes, sem) for u in img_urls]
-        results = await asyncio.gather(*tasks)
-        saved = [r for r in results if r]
+        allocator = PathAllocator(out_dir)
+        download = lambda u: download_image(session, u, out_dir, seen_hashes, sem, stream, cache, index, store,
+                                            limiter, manifest, allocator, size_filter, archive)
+
+        if depth > 0 or len(start_urls) > 1:
+            # 페이지 수집과 이미지 다운로드가 같은 세션/커넥터를 공유
+            saved = await crawl_frontier(session, start_urls, depth, same_host, concurrency, download, stream_html)
+        elif stream_html:
+            # 발견 즉시 다운로드 대기열에 넣어 HTML 수신/파싱과 다운로드를 겹침
+            queue = DownloadQueue(download, concurrency)
+            await stream_page(session, start_urls[0], queue.put)
+            print(f"발견된 이미지: {queue.queued}개")
+            saved = await queue.join()
+        else:
+            html = await fetch_html(session, start_urls[0])
+            img_urls = await asyncio.to_thread(collect_images_from_html, html, start_urls[0])
+            print(f"발견된 이미지: {len(img_urls)}개")
+
+            queue = DownloadQueue(download, concurrency)
+            for u in img_urls:
+                await queue.put(u)
+            saved = await queue.join()
         print(f"다운로드 완료: {len(saved)}개")
+    if adaptive:
+        print("호스트별 동시성:")
+        print("\n".join(limiter.stats_lines()))
+    if size_filter:
+        print(size_filter.stats_line())
+    if archive:
+        archive.close()
+        print(archive.stats_line())
+    if cache:
+        cache.save()
+        print(cache.stats_line())
+    if index:
+        print(index.stats_line())
+        index.close()
+    if store:
+        store.close()
+        print(f"매니페스트: {store.manifest_path}")
+    if manifest:
+        print(manifest.stats_line())
+        manifest.close()
 
 def main():
     parser = argparse.ArgumentParser(description="웹페이지의 모든 이미지를 비동기 방식으로 로컬 저장")
-    parser.add_argument("url", help="대상 웹페이지 URL")
+    parser.add_argument("url", nargs="+", help="대상 웹페이지 URL (여러 개 지정 가능)")
     parser.add_argument("-o", "--out", default=None, help="저장 폴더 (기본: ./images_날짜)")
-    parser.add_argument("-c", "--concurrency", type=int, default=10, help="동시 다운로드 개수")
+    parser.add_argument("-c", "--concurrency", type=int, default=None,
+                        help="동시 다운로드 개수 (기본 10, --adaptive 사용 시 전체 상한 100)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="호스트별 동시성을 응답 지연과 429/503에 따라 자동 조절 (AIMD)")
+    parser.add_argument("--max-per-host", type=int, default=32,
+                        help="--adaptive 사용 시 호스트당 최대 동시 요청 수 (기본 32)")
+    parser.add_argument("--depth", type=int, default=0,
+                        help="링크를 따라갈 깊이 (기본 0: 지정한 페이지만)")
+    parser.add_argument("--same-host", action="store_true",
+                        help="재귀 크롤링 시 시작 URL과 같은 호스트의 링크만 따라감")
+    parser.add_argument("--stream", action="store_true",
+                        help="본문을 메모리에 올리지 않고 청크 단위로 임시 파일에 기록 (대용량 이미지용)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="HTTP 캐시 폴더 (지정 시 ETag/Last-Modified로 재검증하여 변경 없는 이미지는 건너뜀)")
+    parser.add_argument("--dedup-db", default=None,
+                        help="실행 간 중복 제거 인덱스(SQLite) 파일. 이미 받은 URL은 건너뛰고 같은 내용은 하드링크")
+    parser.add_argument("--layout", choices=("flat", "cas"), default="flat",
+                        help="저장 방식: flat(원본 파일명, 기본) / cas(ab/cd/<sha256>.<ext> + manifest.jsonl)")
+    parser.add_argument("--stream-html", action="store_true",
+                        help="HTML을 받는 대로 파싱해 발견한 이미지부터 바로 다운로드 (큰 페이지용)")
+    parser.add_argument("--run-manifest", default=None,
+                        help="실행 매니페스트(JSONL) 경로. 같은 경로로 다시 실행하면 완료 항목은 건너뛰고 "
+                             "받다 만 파일은 Range 요청으로 이어받음 (--stream 자동 적용)")
+    parser.add_argument("--min-bytes", type=int, default=0,
+                        help="이 용량(바이트)보다 작은 이미지는 건너뜀 (Content-Length로 판단)")
+    parser.add_argument("--min-width", type=int, default=0,
+                        help="가로가 이보다 작은 이미지는 건너뜀 (본문 앞부분의 PNG/JPEG/GIF/WebP 헤더로 판단)")
+    parser.add_argument("--min-height", type=int, default=0,
+                        help="세로가 이보다 작은 이미지는 건너뜀")
+    parser.add_argument("--archive", default=None,
+                        help="이미지를 하나의 .tar/.zip 아카이브에 이어 붙여 저장 (인덱스: <아카이브>.index.jsonl)")
     args = parser.parse_args()
+    if args.archive and (args.cache_dir or args.dedup_db or args.layout == "cas"):
+        parser.error("--archive는 --cache-dir, --dedup-db, --layout cas와 함께 쓸 수 없습니다")
 
-    out_dir = args.out or f"./images_{time.strftime('%Y%m%d_%H%M%S')}"
-    asyncio.run(crawl(args.url, out_dir, args.concurrency))
+    if args.archive:
+        # 아카이브 모드의 -o는 임시 파일(.part) 위치로만 쓰임
+        out_dir = args.out or os.path.dirname(os.path.abspath(args.archive))
+    else:
+        out_dir = args.out or f"./images_{time.strftime('%Y%m%d_%H%M%S')}"
+    concurrency = args.concurrency or (100 if args.adaptive else 10)
+    asyncio.run(crawl(args.url, out_dir, concurrency, args.stream, args.cache_dir, args.dedup_db,
+                      args.layout, args.depth, args.same_host, args.stream_html,
+                      args.adaptive, args.max_per_host, args.run_manifest,
+                      args.min_bytes, args.min_width, args.min_height, args.archive))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,31 +5,58 @@
 한글 인식률이 높은 PaddleOCR 엔진 사용
 """
 
+from __future__ import annotations
+
 import os
 import sys
-import cv2
-import numpy as np
+import argparse
+import importlib.util
+import json
+import time
+from dataclasses import asdict
 from pathlib import Path
 import re
-from typing import List, Dict, Tuple, Optional
+from typing import TYPE_CHECKING, List, Dict, Tuple, Optional
 import logging
 
 # 설정 관리 모듈 임포트
-from config import config_manager, AppConfig
-
-# PaddleOCR 설치 확인 및 설치 안내
-try:
+from config import config_manager, AppConfig, PREPROCESS_PROFILES
+from ocr_manifest import OCRManifest, config_fingerprint, file_sha256, inference_fingerprint
+from ocr_cache import CACHE_DIRNAME, OCRResultCache, cache_key
+import ocr_tiling
+
+# 무거운 모듈(PaddleOCR, OpenCV, NumPy)은 추론을 시작할 때 임포트
+# (--help, --dry-run, --show-config 와 모듈 임포트만으로는 불러오지 않음)
+if TYPE_CHECKING:
+    import numpy as np
     from paddleocr import PaddleOCR
-except ImportError:
+
+
+def _import_image_stack() -> None:
+    """OpenCV / NumPy 임포트 (이미지를 처음 읽을 때)"""
+    global cv2, np
+    import cv2
+    import numpy as np
+
+
+def paddleocr_available() -> bool:
+    """PaddleOCR 설치 여부 (임포트하지 않고 확인)"""
+    return importlib.util.find_spec("paddleocr") is not None
+
+
+def print_paddleocr_install_help() -> None:
     print("PaddleOCR이 설치되지 않았습니다.")
     print("다음 명령어로 설치해주세요:")
     print("pip install paddlepaddle paddleocr")
     print("또는")
     print("pip install paddlepaddle-gpu paddleocr")  # GPU 사용시
-    sys.exit(1)
 
-# 설정 로드
-config = config_manager.get_config()
+
+def __getattr__(name: str):
+    # `from extract_text_from_images import config` 호환: 설정은 처음 접근할 때 로드
+    if name == "config":
+        return config_manager.get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # 로깅 설정
 def setup_logging(config: AppConfig) -> None:
@@ -58,38 +85,75 @@ def setup_logging(config: AppConfig) -> None:
         handlers=handlers
     )
 
-# 로깅 설정 적용
-setup_logging(config)
 logger = logging.getLogger(__name__)
 
+
+def resolve_workers(config: AppConfig) -> int:
+    """설정의 병렬 프로세스 수 (0 이하이면 CPU 코어 수)"""
+    if config.ocr.workers <= 0:
+        return os.cpu_count() or 1
+    return config.ocr.workers
+
+
+def threads_per_worker(workers: int) -> int:
+    """프로세스 수 × 추론 스레드 수가 CPU 코어 수를 넘지 않도록 나눈 값"""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def detect_gpu(config: AppConfig) -> None:
+    """paddle이 CUDA를 지원하면 config.ocr.use_gpu를 켜고, 아니면 끔"""
+    try:
+        import paddle
+        config.ocr.use_gpu = bool(paddle.is_compiled_with_cuda())
+    except Exception:
+        config.ocr.use_gpu = False
+    logger.info("GPU 가속을 사용합니다." if config.ocr.use_gpu else "CPU 모드로 실행합니다.")
+
+
 class ImageTextExtractor:
-    def __init__(self, config: AppConfig):
+    def __init__(self, config: AppConfig, cpu_threads: Optional[int] = None):
         """
         이미지 텍스트 추출기 초기화
 
         Args:
             config: 애플리케이션 설정
+            cpu_threads: OCR 추론 스레드 수 (기본: CPU 코어 수.
+                         프로세스 풀의 작업 프로세스는 CPU 코어 수 / 프로세스 수를 넘겨받음)
         """
         self.config = config
-        
-        # OCR 엔진 초기화
-        self.ocr = PaddleOCR(
-            use_textline_orientation=config.ocr.use_textline_orientation,
-            lang=config.ocr.language
-        )
+        # 이 프로세스에서 처리할 때는 모든 코어 사용 (풀을 띄우지 않는 소량 처리 포함)
+        self.cpu_threads = cpu_threads or os.cpu_count() or 1
+
+        # OCR 엔진은 처음 사용할 때 생성 (병렬 처리 시 부모 프로세스는 모델을 로드하지 않음)
+        self._ocr = None
 
         # 현재 스크립트 디렉토리
         self.script_dir = Path(__file__).parent
         self.images_dir = self.script_dir / config.paths.images_dir
         self.ocr_dir = self.script_dir / config.paths.ocr_dir
+        # OCR 결과 디렉토리는 실제로 결과를 쓸 때 생성 (--dry-run은 파일 시스템을 바꾸지 않음)
 
-        # OCR 결과 디렉토리 생성
-        self.ocr_dir.mkdir(exist_ok=True)
+        # raw OCR 결과 캐시 (임계값 등 markdown 생성 설정만 바꾸면 추론 없이 재생성)
+        self.raw_cache = OCRResultCache(self.ocr_dir / CACHE_DIRNAME)
+        self.inference_fingerprint = inference_fingerprint(config)
 
         logger.info(f"이미지 디렉토리: {self.images_dir}")
         logger.info(f"OCR 결과 디렉토리: {self.ocr_dir}")
         logger.info(f"OCR 언어: {config.ocr.language}")
-        logger.info(f"GPU 사용: {config.ocr.use_gpu}")
+
+    @property
+    def ocr(self) -> PaddleOCR:
+        """OCR 엔진 (프로세스마다 한 번만 생성)"""
+        if self._ocr is None:
+            # GPU 확인도 모델을 만들 때 함 (모든 이미지가 캐시 적중이면 paddle을 임포트하지 않음)
+            detect_gpu(self.config)
+            from paddleocr import PaddleOCR
+            self._ocr = PaddleOCR(
+                use_textline_orientation=self.config.ocr.use_textline_orientation,
+                lang=self.config.ocr.language,
+                cpu_threads=self.cpu_threads
+            )
+        return self._ocr
 
     def preprocess_image(self, image_path: Path) -> np.ndarray:
         """
@@ -101,29 +165,94 @@ class ImageTextExtractor:
         Returns:
             전처리된 이미지 배열
         """
+        return self.preprocess_image_scaled(image_path)[0]
+
+    def preprocess_image_scaled(self, image_path: Path,
+                                timings: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, float]:
+        """
+        이미지 전처리 (읽기 -> 크기 정규화 -> 노이즈 제거 -> 대비 향상)
+
+        Args:
+            image_path: 이미지 파일 경로
+            timings: 주어지면 단계별 소요 시간(초)을 더해 기록 (벤치마크용)
+
+        Returns:
+            (전처리된 이미지 배열, 원본 대비 축소 비율)
+        """
+        gray, scale = self.load_grayscale(image_path, timings)
+        return self.enhance_image(gray, timings), scale
+
+    def load_grayscale(self, image_path: Path, timings: Optional[Dict[str, float]] = None,
+                       data: Optional[bytes] = None) -> Tuple[np.ndarray, float]:
+        """
+        이미지를 읽어 그레이스케일로 바꾸고 설정보다 크면 축소
+
+        Args:
+            image_path: 이미지 파일 경로 (data가 있으면 오류 메시지에만 사용)
+            timings: 주어지면 단계별 소요 시간(초)을 더해 기록 (벤치마크용)
+            data: 주어지면 파일 대신 이 인코딩된 이미지 바이트(PNG, JPEG 등)를 디코딩
+
+        Returns:
+            (그레이스케일 이미지 배열, 원본 대비 축소 비율)
+        """
+        img_config = self.config.image_processing
+        if img_config.profile not in PREPROCESS_PROFILES:
+            raise ValueError(f"알 수 없는 전처리 프로필: {img_config.profile}")
+        _import_image_stack()
+        start = time.perf_counter()
+
         # 이미지 읽기
-        image = cv2.imread(str(image_path))
+        if data is not None:
+            image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        else:
+            image = cv2.imread(str(image_path))
         if image is None:
             raise ValueError(f"이미지를 읽을 수 없습니다: {image_path}")
 
         # 그레이스케일 변환
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-        # 노이즈 제거 (설정에 따라)
-        if self.config.image_processing.denoise_enabled:
+        del image
+        start = _add_timing(timings, "read", start)
+
+        # 크기 정규화: 설정보다 큰 이미지는 노이즈 제거 전에 축소 (이후 단계 비용이 픽셀 수에 비례)
+        height, width = gray.shape[:2]
+        scale = 1.0
+        if img_config.max_width > 0:
+            scale = min(scale, img_config.max_width / width)
+        if img_config.max_height > 0:
+            scale = min(scale, img_config.max_height / height)
+        if scale < 1.0:
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+        _add_timing(timings, "resize", start)
+
+        return gray, scale
+
+    def enhance_image(self, gray: np.ndarray, timings: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """그레이스케일 이미지(또는 세로 조각)에 노이즈 제거와 대비 향상 적용"""
+        img_config = self.config.image_processing
+        _import_image_stack()
+        start = time.perf_counter()
+
+        # 노이즈 제거 (프로필과 설정에 따라)
+        if img_config.profile == 'quality' and img_config.denoise_enabled:
             denoised = cv2.fastNlMeansDenoising(gray)
+        elif img_config.profile == 'fast' and img_config.denoise_enabled:
+            denoised = cv2.medianBlur(gray, 3)
         else:
             denoised = gray
+        start = _add_timing(timings, "denoise", start)
 
-        # 대비 향상 (설정에 따라)
-        if self.config.image_processing.contrast_enhancement_enabled:
+        # 대비 향상 (설정에 따라, none 프로필은 생략)
+        if img_config.profile != 'none' and img_config.contrast_enhancement_enabled:
             clahe = cv2.createCLAHE(
-                clipLimit=self.config.image_processing.clip_limit, 
-                tileGridSize=self.config.image_processing.tile_grid_size
+                clipLimit=img_config.clip_limit, 
+                tileGridSize=img_config.tile_grid_size
             )
             enhanced = clahe.apply(denoised)
         else:
             enhanced = denoised
+        _add_timing(timings, "contrast", start)
 
         return enhanced
 
@@ -137,107 +266,153 @@ class ImageTextExtractor:
         Returns:
             표 구조 정보
         """
-        if not ocr_result:
-            return {"is_table": False, "rows": []}
+        import table_layout
+        return table_layout.detect_table_structure(ocr_result, self.config.ocr.row_distance_threshold)
+
+    def format_table_markdown(self, ocr_result: List, table_info: Dict) -> str:
+        """
+        표를 markdown 형식으로 변환 (행·열에 맞춰 칸 정렬)
 
-        # 텍스트 박스들의 y좌표를 기준으로 그룹화
-        y_coordinates = []
-        for item in ocr_result:
-            if item.get('text'):  # 텍스트가 있는 경우
-                box = item['bbox']
-                y_center = sum(point[1] for point in box) / 4
-                y_coordinates.append(y_center)
+        Args:
+            ocr_result: PaddleOCR 결과
+            table_info: 표 구조 정보
 
-        if not y_coordinates:
-            return {"is_table": False, "rows": []}
+        Returns:
+            markdown 형식의 표
+        """
+        import table_layout
+        return table_layout.format_table_markdown(ocr_result, table_info)
 
-        # y좌표를 정렬하여 행 구분
-        y_coordinates.sort()
+    def predict_batch(self, images: List[np.ndarray]) -> List[List[Dict]]:
+        """
+        전처리된 이미지 여러 장을 한 번의 predict 호출로 OCR
 
-        # 행 간격 분석
-        row_groups = []
-        current_group = [y_coordinates[0]]
+        Args:
+            images: 전처리된 이미지 배열 목록
 
-        for y in y_coordinates[1:]:
-            if y - current_group[-1] < self.config.ocr.row_distance_threshold:  # 설정된 픽셀 이내면 같은 행
-                current_group.append(y)
-            else:
-                row_groups.append(current_group)
-                current_group = [y]
+        Returns:
+            이미지별 OCR 결과 항목 목록 (입력 순서와 같음)
+        """
+        if not images:
+            return []
 
-        row_groups.append(current_group)
+        results = list(self.ocr.predict(images))
+        if len(results) != len(images):
+            raise ValueError(f"OCR 결과 수({len(results)})가 이미지 수({len(images)})와 다릅니다.")
 
-        # 표 여부 판단 (2행 이상이고 일정한 간격을 가진 경우)
-        is_table = len(row_groups) >= 2
+        return [ocr_result_items(result) for result in results]
 
-        return {
-            "is_table": is_table,
-            "rows": row_groups
-        }
+    def needs_tiling(self, gray: np.ndarray) -> bool:
+        """ocr.tile_height보다 높은 이미지인지 (가로 띠로 나눠 OCR)"""
+        tile_height = self.config.ocr.tile_height
+        return tile_height > 0 and gray.shape[0] > tile_height
 
-    def format_table_markdown(self, ocr_result: List, table_info: Dict) -> str:
+    def predict_tiled(self, gray: np.ndarray) -> List[Dict]:
         """
-        표를 markdown 형식으로 변환
+        세로로 긴 그레이스케일 이미지를 겹치는 가로 띠로 나눠 OCR
+
+        띠마다 노이즈 제거·대비 향상을 스레드로 병렬 처리하고(OpenCV는 GIL을 놓음, 최대 두 묶음 분량만 미리 처리),
+        ocr.batch_size개씩 묶어 predict한 뒤 박스를 전체 좌표로 옮겨 겹친 구간의 중복을 제거
 
         Args:
-            ocr_result: PaddleOCR 결과
-            table_info: 표 구조 정보
+            gray: 그레이스케일 이미지 배열 (load_grayscale 결과)
 
         Returns:
-            markdown 형식의 표
+            이미지 전체 기준 OCR 결과 항목 목록
         """
-        if not table_info["is_table"]:
-            return ""
-
-        # 각 텍스트를 y좌표 기준으로 그룹화
-        text_by_row = {}
-
-        for item in ocr_result:
-            if item.get('text'):  # 텍스트가 있는 경우
-                text = item['text']
-                confidence = item['confidence']
-                box = item['bbox']
-                y_center = sum(point[1] for point in box) / 4
-                x_center = sum(point[0] for point in box) / 4
-
-                # 가장 가까운 행 찾기
-                min_distance = float('inf')
-                closest_row = 0
-
-                for i, row_y_coords in enumerate(table_info["rows"]):
-                    row_y_avg = sum(row_y_coords) / len(row_y_coords)
-                    distance = abs(y_center - row_y_avg)
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_row = i
-
-                if closest_row not in text_by_row:
-                    text_by_row[closest_row] = []
-
-                text_by_row[closest_row].append((x_center, text, confidence))
-
-        # 각 행의 텍스트를 x좌표 순으로 정렬
-        for row in text_by_row:
-            text_by_row[row].sort(key=lambda x: x[0])
-
-        # markdown 표 생성
-        markdown_table = ""
-
-        # 헤더 행
-        if 0 in text_by_row:
-            header_cells = [item[1] for item in text_by_row[0]]
-            markdown_table += "| " + " | ".join(header_cells) + " |\n"
-            markdown_table += "| " + " | ".join(["---"] * len(header_cells)) + " |\n"
-
-        # 데이터 행들
-        for row_idx in sorted(text_by_row.keys()):
-            if row_idx == 0:  # 헤더는 이미 처리됨
-                continue
+        ranges = ocr_tiling.strip_ranges(gray.shape[0], self.config.ocr.tile_height, self.config.ocr.tile_overlap)
+        group = max(1, self.config.ocr.batch_size)
+        logger.info(f"가로 띠 {len(ranges)}개로 나눠 OCR (높이 {gray.shape[0]}px)")
+
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        strip_results: List[List[Dict]] = []
+        with ThreadPoolExecutor(max_workers=self.cpu_threads) as executor:
+            # 전처리는 두 묶음 분량만 미리 맡겨 두고(메모리 상한), 앞 묶음을 predict하는 동안
+            # 뒤 띠 전처리를 진행. 띠 하나를 꺼낼 때마다 다음 띠를 맡김
+            remaining = iter(ranges)
+            in_flight = deque()
+
+            def submit_next():
+                next_range = next(remaining, None)
+                if next_range is not None:
+                    start, end = next_range
+                    in_flight.append(executor.submit(self.enhance_image, gray[start:end]))
+
+            for _ in range(2 * group):
+                submit_next()
+            strips = []
+            while in_flight:
+                strips.append(in_flight.popleft().result())
+                submit_next()
+                if len(strips) == group:
+                    strip_results += self.predict_batch(strips)
+                    strips = []
+            strip_results += self.predict_batch(strips)
+
+        return ocr_tiling.merge_strip_results(strip_results, ranges)
+
+    def build_markdown(self, image_path: Path, ocr_result: List[Dict]) -> str:
+        """
+        OCR 결과 항목으로 markdown 생성
+
+        Args:
+            image_path: 이미지 파일 경로
+            ocr_result: 이미지 한 장의 OCR 결과 항목 목록
+
+        Returns:
+            추출된 텍스트 (markdown 형식)
+        """
+        if not ocr_result:
+            logger.warning(f"텍스트를 찾을 수 없습니다: {image_path.name}")
+            return f"# {image_path.stem}\n\n텍스트를 찾을 수 없습니다.\n"
+
+        # 표 구조 감지
+        table_info = self.detect_table_structure(ocr_result)
+
+        # markdown 형식으로 변환
+        markdown_content = f"# {image_path.stem}\n\n"
+
+        if table_info["is_table"]:
+            # 표가 있는 경우
+            table_markdown = self.format_table_markdown(ocr_result, table_info)
+            if table_markdown:
+                markdown_content += "## 표\n\n"
+                markdown_content += table_markdown + "\n"
+
+            # 표 외 텍스트도 추가
+            regular_text = []
+            for item in ocr_result:
+                if item.get('text'):  # 텍스트가 있는 경우
+                    text = item['text']
+                    confidence = item['confidence']
+                    if confidence > self.config.ocr.confidence_threshold_table:  # 설정된 신뢰도 이상인 텍스트만
+                        regular_text.append(text)
+
+            if regular_text:
+                markdown_content += "## 텍스트\n\n"
+                markdown_content += "\n".join(regular_text) + "\n"
+        else:
+            # 일반 텍스트인 경우
+            text_lines = []
+            for item in ocr_result:
+                if item.get('text'):  # 텍스트가 있는 경우
+                    text = item['text']
+                    confidence = item['confidence']
+                    if confidence > self.config.ocr.confidence_threshold_text:  # 설정된 신뢰도 이상인 텍스트만
+                        text_lines.append(text)
+
+            if text_lines:
+                markdown_content += "\n".join(text_lines) + "\n"
+            else:
+                markdown_content += "텍스트를 찾을 수 없습니다.\n"
 
-            cells = [item[1] for item in text_by_row[row_idx]]
-            markdown_table += "| " + " | ".join(cells) + " |\n"
+        return markdown_content
 
-        return markdown_table
+    def _error_markdown(self, image_path: Path, error: Exception) -> str:
+        logger.error(f"텍스트 추출 중 오류 발생: {image_path.name} - {str(error)}")
+        return f"# {image_path.stem}\n\n텍스트 추출 중 오류가 발생했습니다: {str(error)}\n"
 
     def extract_text_from_image(self, image_path: Path) -> str:
         """
@@ -252,66 +427,91 @@ class ImageTextExtractor:
         try:
             logger.info(f"텍스트 추출 중: {image_path.name}")
 
-            # 이미지 전처리
-            processed_image = self.preprocess_image(image_path)
-
-            # OCR 실행 (최신 predict 메서드 사용)
-            ocr_result = self.ocr.predict(processed_image)
-
-            if not ocr_result:
-                logger.warning(f"텍스트를 찾을 수 없습니다: {image_path.name}")
-                return f"# {image_path.stem}\n\n텍스트를 찾을 수 없습니다.\n"
-
-            # 표 구조 감지
-            table_info = self.detect_table_structure(ocr_result)
-
-            # markdown 형식으로 변환
-            markdown_content = f"# {image_path.stem}\n\n"
-
-            if table_info["is_table"]:
-                # 표가 있는 경우
-                table_markdown = self.format_table_markdown(ocr_result, table_info)
-                if table_markdown:
-                    markdown_content += "## 표\n\n"
-                    markdown_content += table_markdown + "\n"
-
-                # 표 외 텍스트도 추가
-                regular_text = []
-                for item in ocr_result:
-                    if item.get('text'):  # 텍스트가 있는 경우
-                        text = item['text']
-                        confidence = item['confidence']
-                        if confidence > self.config.ocr.confidence_threshold_table:  # 설정된 신뢰도 이상인 텍스트만
-                            regular_text.append(text)
-
-                if regular_text:
-                    markdown_content += "## 텍스트\n\n"
-                    markdown_content += "\n".join(regular_text) + "\n"
+            # 이미지 읽기 / 크기 정규화
+            gray, scale = self.load_grayscale(image_path)
+
+            # 전처리 후 OCR 실행 (세로로 긴 이미지는 띠로 나눠서, 좌표는 원본 크기 기준으로)
+            if self.needs_tiling(gray):
+                ocr_result = self.predict_tiled(gray)
             else:
-                # 일반 텍스트인 경우
-                text_lines = []
-                for item in ocr_result:
-                    if item.get('text'):  # 텍스트가 있는 경우
-                        text = item['text']
-                        confidence = item['confidence']
-                        if confidence > self.config.ocr.confidence_threshold_text:  # 설정된 신뢰도 이상인 텍스트만
-                            text_lines.append(text)
-
-                if text_lines:
-                    markdown_content += "\n".join(text_lines) + "\n"
-                else:
-                    markdown_content += "텍스트를 찾을 수 없습니다.\n"
+                ocr_result = self.predict_batch([self.enhance_image(gray)])[0]
+            ocr_result = scale_ocr_items(ocr_result, 1.0 / scale)
 
-            return markdown_content
+            return self.build_markdown(image_path, ocr_result)
 
         except Exception as e:
-            logger.error(f"텍스트 추출 중 오류 발생: {image_path.name} - {str(e)}")
-            return f"# {image_path.stem}\n\n텍스트 추출 중 오류가 발생했습니다: {str(e)}\n"
+            return self._error_markdown(image_path, e)
 
-    def process_all_images(self) -> None:
+    def extract_text_from_images(self, image_paths: List[Path]) -> List[str]:
         """
-        images 폴더의 모든 이미지에서 텍스트 추출
+        이미지 여러 장을 전처리한 뒤 한 번의 predict 호출로 텍스트 추출
+
+        Args:
+            image_paths: 이미지 파일 경로 목록
+
+        Returns:
+            이미지별 markdown (입력 순서와 같음). 실패한 이미지는 오류 내용
         """
+        return [markdown for markdown, _ in self._extract_batch(image_paths)]
+
+    def raw_cache_key(self, image_path: Path, image_sha256: Optional[str] = None) -> str:
+        """raw OCR 결과 캐시 키 (이미지 내용 + 전처리/모델 설정)"""
+        return cache_key(image_sha256 or file_sha256(image_path), self.inference_fingerprint)
+
+    def _extract_batch(self, image_paths: List[Path],
+                       hashes: Optional[Dict[str, str]] = None) -> List[Tuple[str, Optional[str]]]:
+        """이미지별 (markdown, 오류). 실패한 이미지의 markdown은 오류 내용.
+        raw 결과 캐시에 있는 이미지는 추론 없이 markdown만 만들고, 나머지는 한 번의 predict로 처리
+        (ocr.tile_height보다 높은 이미지는 따로 띠로 나눠 처리)"""
+        contents: Dict[Path, Tuple[str, Optional[str]]] = {}
+        hashes = hashes or {}
+        images = []
+        scales = []
+        batch_paths = []
+        keys = []
+
+        for image_path in image_paths:
+            try:
+                logger.info(f"텍스트 추출 중: {image_path.name}")
+                key = self.raw_cache_key(image_path, hashes.get(image_path.name))
+                cached = self.raw_cache.get(key)
+                if cached is not None:
+                    contents[image_path] = (self.build_markdown(image_path, cached), None)
+                    continue
+                gray, scale = self.load_grayscale(image_path)
+                if self.needs_tiling(gray):
+                    ocr_result = self.predict_tiled(gray)
+                    del gray
+                    contents[image_path] = (self._finish_result(image_path, key, scale, ocr_result), None)
+                    continue
+                images.append(self.enhance_image(gray))
+                scales.append(scale)
+                batch_paths.append(image_path)
+                keys.append(key)
+            except Exception as e:
+                contents[image_path] = (self._error_markdown(image_path, e), str(e))
+
+        try:
+            for image_path, key, scale, ocr_result in zip(batch_paths, keys, scales, self.predict_batch(images)):
+                contents[image_path] = (self._finish_result(image_path, key, scale, ocr_result), None)
+        except Exception as e:
+            for image_path in batch_paths:
+                contents[image_path] = (self._error_markdown(image_path, e), str(e))
+
+        return [contents[image_path] for image_path in image_paths]
+
+    def _finish_result(self, image_path: Path, key: str, scale: float, ocr_result: List[Dict]) -> str:
+        """OCR 결과를 원본 좌표로 되돌려 raw 캐시에 저장하고 markdown 생성"""
+        # 축소한 이미지의 박스 좌표를 원본 크기 기준으로 (row_distance_threshold 등이 원본 픽셀 기준)
+        ocr_result = scale_ocr_items(ocr_result, 1.0 / scale)
+        try:
+            self.raw_cache.put(key, ocr_result)
+        except OSError as e:
+            logger.warning(f"raw OCR 결과 캐시 저장 실패: {image_path.name} - {str(e)}")
+        return self.build_markdown(image_path, ocr_result)
+
+    def find_image_files(self) -> List[Path]:
+        """images 폴더에서 지원하는 확장자의 이미지 파일 목록 (정렬됨)"""
         # 지원하는 이미지 확장자 (설정에서 가져오기)
         image_extensions = set(self.config.supported_image_extensions)
 
@@ -321,60 +521,286 @@ class ImageTextExtractor:
             image_files.extend(self.images_dir.glob(f"*{ext}"))
             image_files.extend(self.images_dir.glob(f"*{ext.upper()}"))
 
-        if not image_files:
-            logger.warning("처리할 이미지 파일을 찾을 수 없습니다.")
-            return
+        return sorted(set(image_files))
 
-        logger.info(f"총 {len(image_files)}개의 이미지 파일을 처리합니다.")
+    def process_batch(self, image_paths: List[Path],
+                      hashes: Optional[Dict[str, str]] = None) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """
+        이미지 묶음에서 텍스트를 추출해 각각 markdown 파일로 저장
 
-        # 각 이미지 처리
-        for image_path in sorted(image_files):
-            try:
-                # 텍스트 추출
-                markdown_content = self.extract_text_from_image(image_path)
+        Args:
+            image_paths: 이미지 파일 경로 목록 (한 번의 predict 호출로 처리)
+            hashes: 이미 계산한 이미지 sha256 (이미지 이름 -> 해시, 선택사항)
+
+        Returns:
+            (이미지 이름, 저장한 파일 이름, 오류) 목록.
+            추출에 실패한 이미지도 오류 내용을 markdown으로 저장하고 오류를 함께 돌려줌
+        """
+        results = []
+        contents = self._extract_batch(image_paths, hashes)
+
+        # OCR 결과 디렉토리 생성
+        self.ocr_dir.mkdir(exist_ok=True)
 
+        for image_path, (markdown_content, error) in zip(image_paths, contents):
+            try:
                 # markdown 파일로 저장
-                output_path = self.ocr_dir / f"{image_path.stem}.md"
+                output_path = self.output_path_for(image_path)
 
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(markdown_content)
 
-                logger.info(f"완료: {image_path.name} -> {output_path.name}")
-
+                results.append((image_path.name, output_path.name, error))
             except Exception as e:
-                logger.error(f"처리 실패: {image_path.name} - {str(e)}")
+                results.append((image_path.name, None, str(e)))
+
+        return results
+
+    def output_path_for(self, image_path: Path) -> Path:
+        """이미지의 markdown 결과 파일 경로"""
+        return self.ocr_dir / f"{image_path.stem}.md"
+
+    def process_all_images(self, force: bool = False) -> None:
+        """
+        images 폴더의 모든 이미지에서 텍스트 추출
+        (ocr.batch_size장씩 묶어 predict를 한 번 호출하고,
+         ocr.workers가 2 이상이면 묶음들을 프로세스 풀로 병렬 처리)
+
+        Args:
+            force: True이면 매니페스트와 관계없이 모든 이미지를 다시 처리
+        """
+        image_files = self.find_image_files()
+
+        if not image_files:
+            logger.warning("처리할 이미지 파일을 찾을 수 없습니다.")
+            return
+
+        # OCR 결과 디렉토리 생성 (매니페스트도 여기에 기록)
+        self.ocr_dir.mkdir(exist_ok=True)
+
+        manifest = OCRManifest(self.ocr_dir)
+        fingerprint = config_fingerprint(self.config)
+        cached, uncached, hashes = self.plan_images(image_files, manifest, fingerprint, force)
+
+        logger.info(f"총 {len(image_files)}개의 이미지 파일 중 {len(cached) + len(uncached)}개를 처리합니다.")
 
+        # raw 결과 캐시에 있는 이미지는 이 프로세스에서 바로 markdown만 다시 만들고(모델 로드 없음),
+        # 나머지만 묶음으로 나눠 추론
+        try:
+            if cached:
+                logger.info(f"raw OCR 결과 캐시에서 markdown 재생성: {len(cached)}개")
+                self._record_results(self.process_batch(cached, hashes), manifest, fingerprint)
+
+            if uncached:
+                batch_size = max(1, self.config.ocr.batch_size)
+                batches = [uncached[i:i + batch_size] for i in range(0, len(uncached), batch_size)]
+
+                workers = min(resolve_workers(self.config), len(batches))
+                if workers > 1:
+                    results_iter = self._process_in_pool(batches, workers)
+                else:
+                    results_iter = (self.process_batch(batch, hashes) for batch in batches)
+
+                for results in results_iter:
+                    self._record_results(results, manifest, fingerprint)
+        finally:
+            manifest.close()
+
+        logger.info(manifest.stats_line())
         logger.info("모든 이미지 처리 완료!")
 
+    def plan_images(self, image_files: List[Path], manifest: OCRManifest, fingerprint: str,
+                    force: bool = False) -> Tuple[List[Path], List[Path], Dict[str, str]]:
+        """
+        처리할 이미지를 raw 결과 캐시 여부로 나눔 (이미지와 설정이 그대로이고 결과 파일이 있으면 건너뜀)
+
+        Returns:
+            (캐시에서 markdown만 다시 만들 이미지, 추론할 이미지, 이미지 이름 -> sha256).
+            건너뛴 이미지 수는 manifest.skipped에 더함
+        """
+        pending = []
+        for image_path in image_files:
+            if not force and manifest.is_current(image_path, self.output_path_for(image_path), fingerprint):
+                manifest.skipped += 1
+                continue
+            pending.append(image_path)
+
+        # 처리 전 내용으로 기록하도록 미리 해시
+        hashes = {image_path.name: manifest.image_sha256(image_path) for image_path in pending}
+        cached = [image_path for image_path in pending
+                  if self.raw_cache_key(image_path, hashes[image_path.name]) in self.raw_cache]
+        cached_names = {image_path.name for image_path in cached}
+        uncached = [image_path for image_path in pending if image_path.name not in cached_names]
+        return cached, uncached, hashes
+
+    def dry_run(self, force: bool = False) -> None:
+        """
+        처리하지 않고 처리할 이미지 목록만 출력 (모델, OpenCV를 불러오지 않고 파일 시스템을 바꾸지 않음)
+
+        Args:
+            force: True이면 매니페스트와 관계없이 모든 이미지를 대상으로
+        """
+        image_files = self.find_image_files()
+        manifest = OCRManifest(self.ocr_dir)
+        cached, uncached, _ = self.plan_images(image_files, manifest, config_fingerprint(self.config), force)
+
+        for image_path in uncached:
+            print(f"추론    {image_path.name}")
+        for image_path in cached:
+            print(f"캐시    {image_path.name}")
+        print(f"총 {len(image_files)}개 중 추론 {len(uncached)}개, "
+              f"raw 결과 캐시에서 재생성 {len(cached)}개, 변경 없음 {manifest.skipped}개")
+
+    def _record_results(self, results: List[Tuple[str, Optional[str], Optional[str]]],
+                        manifest: OCRManifest, fingerprint: str) -> None:
+        """처리 결과를 로그로 남기고 성공한 이미지를 매니페스트에 기록"""
+        _log_results(results)
+        for name, output_name, error in results:
+            if not error:
+                manifest.record(self.images_dir / name, self.ocr_dir / output_name, fingerprint)
+
+    def _process_in_pool(self, batches: List[List[Path]], workers: int):
+        """작업 프로세스마다 OCR 엔진을 한 번 만들고 이미지 묶음을 나눠 처리 (묶음별 결과를 차례로 돌려줌)"""
+        cpu_threads = threads_per_worker(workers)
+        logger.info(f"병렬 처리: 프로세스 {workers}개 × 추론 스레드 {cpu_threads}개")
+
+        import multiprocessing as mp
+
+        # paddle은 fork 후 사용이 안전하지 않으므로 spawn 사용
+        ctx = mp.get_context("spawn")
+        with ctx.Pool(workers, initializer=_init_worker, initargs=(self.config, cpu_threads)) as pool:
+            yield from pool.imap_unordered(_process_in_worker, batches)
+
+
+def ocr_result_items(result) -> List[Dict]:
+    """
+    predict 결과(이미지 한 장)를 {'text', 'confidence', 'bbox'} 항목 목록으로 변환
+
+    PaddleOCR 3.x는 이미지마다 rec_texts / rec_scores / rec_polys를 가진 결과를 돌려주고,
+    이미 항목 목록 형식인 결과는 그대로 사용
+    """
+    if result is None:
+        return []
+    if isinstance(result, list):
+        return result
+
+    texts = result.get('rec_texts')
+    if texts is None:
+        return []
+    scores = result.get('rec_scores')
+    polys = result.get('rec_polys')
+    if scores is None:
+        scores = [1.0] * len(texts)
+    if polys is None:
+        polys = result.get('dt_polys')
+
+    items = []
+    for i, text in enumerate(texts):
+        bbox = [[float(x), float(y)] for x, y in polys[i]] if polys is not None else [[0.0, 0.0]] * 4
+        items.append({'text': text, 'confidence': float(scores[i]), 'bbox': bbox})
+    return items
+
+
+def scale_ocr_items(items: List[Dict], factor: float) -> List[Dict]:
+    """OCR 결과 항목의 박스 좌표에 factor를 곱한 새 목록 (factor가 1이면 그대로)"""
+    if factor == 1.0:
+        return items
+    return [dict(item, bbox=[[x * factor, y * factor] for x, y in item['bbox']]) for item in items]
+
+
+def _add_timing(timings: Optional[Dict[str, float]], stage: str, start: float) -> float:
+    """단계 소요 시간을 timings에 더하고 현재 시각을 돌려줌"""
+    now = time.perf_counter()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + now - start
+    return now
+
+
+def _log_results(results: List[Tuple[str, Optional[str], Optional[str]]]) -> None:
+    for name, output_name, error in results:
+        if error:
+            logger.error(f"처리 실패: {name} - {error}")
+        else:
+            logger.info(f"완료: {name} -> {output_name}")
+
+
+# 작업 프로세스에서 추론 스레드 수로 제한하는 수치 연산 라이브러리 환경변수
+WORKER_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+# 작업 프로세스마다 하나씩 만드는 추출기와 초기화 오류
+_worker_extractor: Optional[ImageTextExtractor] = None
+_worker_init_error: Optional[str] = None
+
+
+def _init_worker(config: AppConfig, cpu_threads: int) -> None:
+    """작업 프로세스 초기화: 수치 연산 스레드 수를 제한하고 OCR 엔진을 미리 로드"""
+    global _worker_extractor, _worker_init_error
+    # paddle을 임포트하기 전에 이 프로세스에서만 설정 (이미 지정된 값도 덮어써야
+    # 프로세스 수 × 스레드 수가 CPU 코어 수를 넘지 않음)
+    for var in WORKER_THREAD_ENV_VARS:
+        os.environ[var] = str(cpu_threads)
+    setup_logging(config)
+    try:
+        _worker_extractor = ImageTextExtractor(config, cpu_threads=cpu_threads)
+        _worker_extractor.ocr
+    except Exception as e:
+        # 초기화 함수에서 예외가 나면 풀이 프로세스를 계속 다시 띄우므로 작업 단위로 보고
+        _worker_init_error = f"OCR 엔진 초기화 실패: {e}"
+
+
+def _process_in_worker(batch: List[Path]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """작업 프로세스에서 이미지 묶음 처리. (이미지 이름, 결과 파일 이름, 오류) 목록"""
+    if _worker_init_error:
+        return [(image_path.name, None, _worker_init_error) for image_path in batch]
+    try:
+        return _worker_extractor.process_batch(batch)
+    except Exception as e:
+        return [(image_path.name, None, str(e)) for image_path in batch]
+
+
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="images 폴더의 이미지에서 텍스트를 추출해 markdown으로 저장합니다.")
+    parser.add_argument("--force", action="store_true",
+                        help="변경되지 않은 이미지도 모두 다시 처리 (증분 매니페스트 무시)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="처리하지 않고 추론할 이미지 / 캐시에서 재생성할 이미지 목록만 출력")
+    parser.add_argument("--show-config", action="store_true",
+                        help="설정 파일과 환경변수를 반영한 현재 설정을 JSON으로 출력하고 종료")
+    args = parser.parse_args()
+
+    config = config_manager.get_config()
+
+    if args.show_config:
+        print(json.dumps(asdict(config), indent=2, ensure_ascii=False))
+        return
+
+    if args.dry_run:
+        ImageTextExtractor(config).dry_run(force=args.force)
+        return
+
+    if not paddleocr_available():
+        print_paddleocr_install_help()
+        sys.exit(1)
+
+    setup_logging(config)
+
     print("이미지 텍스트 추출기 시작...")
     print("한글 인식률이 높은 PaddleOCR 엔진을 사용합니다.")
 
-    # GPU 사용 가능 여부 확인 및 설정 업데이트
-    try:
-        import paddle
-        if paddle.is_compiled_with_cuda():
-            config.ocr.use_gpu = True
-            print("GPU 가속을 사용합니다.")
-        else:
-            config.ocr.use_gpu = False
-            print("CPU 모드로 실행합니다.")
-    except:
-        config.ocr.use_gpu = False
-        print("CPU 모드로 실행합니다.")
-
     # 설정 정보 출력
     print(f"OCR 언어: {config.ocr.language}")
     print(f"이미지 디렉토리: {config.paths.images_dir}")
     print(f"결과 디렉토리: {config.paths.ocr_dir}")
     print(f"로그 레벨: {config.logging.level}")
+    print(f"병렬 프로세스 수: {resolve_workers(config)}")
+    print(f"배치 크기: {config.ocr.batch_size}")
 
     # 텍스트 추출기 초기화
     extractor = ImageTextExtractor(config)
 
     # 모든 이미지 처리
-    extractor.process_all_images()
+    extractor.process_all_images(force=args.force)
 
     print("텍스트 추출 완료!")
     print(f"결과는 {extractor.ocr_dir} 폴더에 저장되었습니다.")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+host_limiter.py
+---------------
+download_images_async.py 용 호스트별 동시성 제한기.
+
+- 호스트마다 동시 요청 수 상한을 따로 관리
+- adaptive 모드: AIMD(가산 증가/승산 감소) 방식으로 상한을 자동 조절
+  * 정상 응답마다 상한을 1/상한 만큼 증가(한 왕복당 약 +1)
+  * 429/503 응답이나 응답 지연(EWMA)이 최소 지연의 LATENCY_FACTOR배를 넘으면 상한을 줄임
+- 429/503 응답 시 Retry-After(초 또는 HTTP 날짜)를 따르고, 없으면 지터가 섞인
+  지수 백오프 동안 해당 호스트로의 요청을 멈춤
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+
+# 재시도 대상 상태 코드와 최대 재시도 횟수
+RETRY_STATUSES = {429, 503}
+MAX_RETRIES = 4
+
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+# 응답 지연 EWMA가 최소 지연의 몇 배를 넘으면 혼잡으로 보는지
+LATENCY_FACTOR = 3.0
+EWMA_ALPHA = 0.2
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostState:
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        self.backoff_until = 0.0
+        self.min_latency: float | None = None
+        self.ewma: float | None = None
+        self.last_decrease = 0.0
+        self.throttled = 0
+        self.cond = asyncio.Condition()
+
+
+class HostLimiter:
+    """호스트별 동시성 상한 + 429/503 백오프"""
+
+    def __init__(self, max_per_host: int = 32, initial: int = 4, adaptive: bool = True):
+        self.max_per_host = max_per_host
+        self.initial = min(initial, max_per_host) if adaptive else max_per_host
+        self.adaptive = adaptive
+        self._hosts: dict[str, HostState] = {}
+
+    def _state(self, host: str) -> HostState:
+        st = self._hosts.get(host)
+        if st is None:
+            st = self._hosts[host] = HostState(float(self.initial))
+        return st
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        """해당 호스트의 동시 요청 자리가 나고 백오프가 끝날 때까지 기다린다."""
+        st = self._state(host)
+        loop = asyncio.get_running_loop()
+        async with st.cond:
+            while st.in_flight >= int(st.limit) or loop.time() < st.backoff_until:
+                delay = st.backoff_until - loop.time()
+                try:
+                    await asyncio.wait_for(st.cond.wait(), delay if delay > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+            st.in_flight += 1
+        try:
+            yield
+        finally:
+            async with st.cond:
+                st.in_flight -= 1
+                st.cond.notify_all()
+
+    def _decrease(self, st: HostState, factor: float) -> None:
+        # 한 번의 혼잡 신호에 여러 요청이 동시에 반응해 상한이 급락하지 않도록
+        # 최근 응답 지연 시간 안에는 한 번만 줄인다
+        now = time.monotonic()
+        if now - st.last_decrease < (st.ewma or 0.0):
+            return
+        st.limit = max(1.0, st.limit * factor)
+        st.last_decrease = now
+
+    def success(self, host: str, latency: float) -> None:
+        """정상 응답(429/503 외)의 응답 지연(첫 바이트까지)을 반영한다."""
+        st = self._state(host)
+        st.min_latency = latency if st.min_latency is None else min(st.min_latency, latency)
+        st.ewma = latency if st.ewma is None else (1 - EWMA_ALPHA) * st.ewma + EWMA_ALPHA * latency
+        if not self.adaptive:
+            return
+        if st.ewma > LATENCY_FACTOR * max(st.min_latency, 0.001):
+            self._decrease(st, 0.75)
+        else:
+            st.limit = min(float(self.max_per_host), st.limit + 1.0 / st.limit)
+
+    def throttled(self, host: str, retry_after: float | None, attempt: int) -> float:
+        """429/503 응답: 상한을 절반으로 줄이고 호스트 전체를 잠시 멈춘다.
+
+        Returns:
+            적용한 대기 시간(초)
+        """
+        st = self._state(host)
+        st.throttled += 1
+        if self.adaptive:
+            self._decrease(st, 0.5)
+        if retry_after is not None:
+            delay = retry_after * random.uniform(1.0, 1.2)
+        else:
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+        loop = asyncio.get_running_loop()
+        st.backoff_until = max(st.backoff_until, loop.time() + delay)
+        return delay
+
+    def stats_lines(self) -> list[str]:
+        lines = []
+        for host, st in sorted(self._hosts.items()):
+            latency = f"{st.ewma * 1000:.0f}ms" if st.ewma is not None else "-"
+            lines.append(f"  {host}: 동시성 상한 {int(st.limit)}, 응답 지연 {latency}, 429/503 {st.throttled}회")
+        return lines
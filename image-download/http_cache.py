@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+http_cache.py
+-------------
+이미지 다운로더(download_images.py / download_images_async.py) 공용 HTTP 캐시.
+
+URL별로 검증자(ETag, Last-Modified)와 저장 경로, 내용 해시를 디스크에 보관하고,
+다음 실행에서 조건부 요청(If-None-Match / If-Modified-Since)을 보내
+304 Not Modified 응답이면 본문 다운로드를 건너뜁니다.
+- 표준 라이브러리만 사용
+- 저장 파일이 사라진 항목은 조건부 요청을 보내지 않음(다시 다운로드)
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+
+CACHE_FILENAME = "http_cache.json"
+
+
+class HTTPCache:
+    """URL -> {etag, last_modified, path, sha256} 디스크 캐시"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, CACHE_FILENAME)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # download_images.py --workers 모드용
+        self._entries: dict[str, dict] = self._load()
+        # 내용 해시 -> 저장 경로 (같은 내용의 다른 URL도 같은 파일을 가리키도록)
+        self._paths: dict[str, str] = {e["sha256"]: e["path"] for e in self._entries.values()
+                                       if isinstance(e, dict) and e.get("sha256") and e.get("path")}
+        # 같은 내용의 첫 URL이 아직 저장 중일 때 기다리는 중복 URL의 검증자 (해시 -> [(url, 헤더)])
+        self._pending: dict[str, list[tuple[str, dict]]] = {}
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 캐시 파일을 읽을 수 없어 새로 시작합니다: {self.path} -> {e}")
+            return {}
+
+    def lookup(self, url: str) -> dict | None:
+        """저장 파일이 아직 남아 있는 캐시 항목만 돌려준다."""
+        entry = self._entries.get(url)
+        if entry and entry.get("path") and os.path.exists(entry["path"]):
+            return entry
+        return None
+
+    def path_for_hash(self, sha256: str) -> str | None:
+        """같은 내용으로 캐시에 기록된 저장 파일 경로(파일이 남아 있을 때만)"""
+        with self._lock:
+            path = self._paths.get(sha256)
+        return path if path and os.path.exists(path) else None
+
+    def store_duplicate(self, url: str, headers, sha256: str, existing_path: str | None = None) -> None:
+        """이미 저장한 내용과 같은 본문을 받은 URL의 검증자를 기존 파일 경로로 기록한다.
+
+        경로를 아직 모르면(같은 내용의 첫 URL이 동시에 저장 중) 그 URL을 store()할 때 함께 기록한다.
+        """
+        existing_path = existing_path or self.path_for_hash(sha256)
+        if existing_path:
+            self.store(url, headers, existing_path, sha256)
+            return
+        validators = {k: headers.get(k) for k in ("ETag", "Last-Modified") if headers.get(k)}
+        if validators:
+            with self._lock:
+                self._pending.setdefault(sha256, []).append((url, validators))
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        entry = self.lookup(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def hit(self, url: str) -> dict:
+        """304 응답을 받은 URL의 캐시 항목을 돌려주고 적중으로 집계한다."""
+        with self._lock:
+            self.hits += 1
+            return self._entries[url]
+
+    def miss(self) -> None:
+        """본문을 새로 받은 요청(200)을 미스로 집계한다."""
+        with self._lock:
+            self.misses += 1
+
+    def store(self, url: str, headers, save_path: str, sha256: str) -> None:
+        """새로 저장한 결과를 기록한다.
+
+        검증자가 없는 URL은 캐시 항목을 만들지 않지만, 같은 내용의 중복 URL이 이 파일을 가리킬 수
+        있도록 저장 경로는 항상 기록하고 기다리던 중복 URL도 함께 기록한다.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            if etag or last_modified:
+                self._entries[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "path": os.path.abspath(save_path),
+                    "sha256": sha256,
+                }
+            self._paths[sha256] = os.path.abspath(save_path)
+            pending = self._pending.pop(sha256, [])
+        for dup_url, validators in pending:
+            self.store(dup_url, validators, save_path, sha256)
+
+    def save(self) -> None:
+        """원자적으로(임시 파일 + rename) 캐시 파일을 기록한다."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".http_cache-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f, self._lock:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def stats_line(self) -> str:
+        return f"캐시: 적중(304) {self.hits}개, 미스 {self.misses}개"
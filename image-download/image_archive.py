@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+image_archive.py
+----------------
+이미지 다운로더(download_images.py / download_images_async.py) 공용 아카이브 출력.
+
+`--archive out.tar` (또는 `.zip`) 에서 사용하며, 이미지마다 파일을 만드는 대신
+하나의 아카이브에 이어 붙여 저장합니다(공유 스토리지의 inode/메타데이터 비용 절감).
+- tar: 무압축 ustar/pax, zip: ZIP_STORED(이미지는 이미 압축되어 있으므로)
+- 이어쓰기 전용: 같은 아카이브로 다시 실행하면 기존 멤버 뒤에 덧붙이고,
+  이미 들어 있는 내용(sha256)은 다시 넣지 않음
+- 사이드카 인덱스 `<아카이브>.index.jsonl` 에 멤버마다
+  {name, url, sha256, offset, size}를 한 줄씩 기록. offset은 아카이브 파일 안에서
+  본문이 시작하는 위치이므로 압축을 풀지 않고 seek + read로 바로 읽을 수 있음
+
+읽기 예:
+    reader = ArchiveReader("out.tar")
+    for entry in reader:
+        data = reader.read(entry["name"])
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import tarfile
+import threading
+import time
+import zipfile
+
+INDEX_SUFFIX = ".index.jsonl"
+TAR_BLOCK = tarfile.BLOCKSIZE
+
+
+def index_path_for(archive_path: str) -> str:
+    return archive_path + INDEX_SUFFIX
+
+
+def archive_format(path: str) -> str:
+    """확장자로 tar / zip 판별"""
+    lower = path.lower()
+    if lower.endswith(".tar"):
+        return "tar"
+    if lower.endswith(".zip"):
+        return "zip"
+    raise ValueError(f"지원하지 않는 아카이브 형식(.tar 또는 .zip): {path}")
+
+
+def load_index(archive_path: str) -> list[dict]:
+    entries = []
+    try:
+        with open(index_path_for(archive_path), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue  # 강제 종료로 잘린 마지막 줄
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+class ImageArchive:
+    """tar/zip 이어쓰기 아카이브 + 사이드카 인덱스"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.format = archive_format(path)
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self.index_path = index_path_for(path)
+        entries = load_index(path)
+        self._names = {e["name"] for e in entries}
+        self._hashes = {e["sha256"]: e["name"] for e in entries}
+        if self.format == "tar":
+            self._tar = tarfile.open(path, "a", format=tarfile.PAX_FORMAT)
+        else:
+            self._zip = zipfile.ZipFile(path, "a", compression=zipfile.ZIP_STORED, allowZip64=True)
+        self._index = open(self.index_path, "a", encoding="utf-8")
+        self._lock = threading.Lock()  # download_images.py --workers 모드, 비동기 버전의 스레드 풀용
+        self.added = 0
+
+    def find(self, sha256: str) -> str | None:
+        """같은 내용이 이미 들어 있으면 멤버 이름"""
+        with self._lock:
+            return self._hashes.get(sha256)
+
+    def _unique_name(self, name: str) -> str:
+        base, ext = os.path.splitext(name)
+        candidate = name
+        i = 2
+        while candidate in self._names:
+            candidate = f"{base}_{i}{ext}"
+            i += 1
+        return candidate
+
+    def _append(self, fileobj, size: int, sha256: str, name: str, url: str) -> tuple[str, bool]:
+        with self._lock:
+            existing = self._hashes.get(sha256)
+            if existing:
+                return existing, False
+            name = self._unique_name(name)
+            if self.format == "tar":
+                info = tarfile.TarInfo(name)
+                info.size = size
+                info.mtime = int(time.time())
+                info.mode = 0o644
+                self._tar.addfile(info, fileobj)
+                # 본문은 512바이트 블록 단위로 채워지므로, 현재 위치에서 본문 블록만큼 되돌아간 곳이 시작
+                offset = self._tar.offset - -(-size // TAR_BLOCK) * TAR_BLOCK
+            else:
+                info = zipfile.ZipInfo(name, time.localtime()[:6])
+                info.compress_type = zipfile.ZIP_STORED
+                info.external_attr = 0o644 << 16
+                with self._zip.open(info, "w", force_zip64=size >= zipfile.ZIP64_LIMIT) as dst:
+                    while chunk := fileobj.read(1024 * 1024):
+                        dst.write(chunk)
+                offset = self._zip.start_dir - size
+            entry = {"name": name, "url": url, "sha256": sha256, "offset": offset, "size": size}
+            self._index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._index.flush()
+            self._names.add(name)
+            self._hashes[sha256] = name
+            self.added += 1
+            return name, True
+
+    def put_bytes(self, data: bytes, sha256: str, name: str, url: str) -> tuple[str, bool]:
+        """메모리의 본문을 멤버로 추가한다.
+
+        Returns:
+            (멤버 이름, 새로 추가했는지 여부). 같은 내용이 있으면 기존 멤버 이름
+        """
+        return self._append(io.BytesIO(data), len(data), sha256, name, url)
+
+    def put_file(self, tmp_path: str, sha256: str, name: str, url: str) -> tuple[str, bool]:
+        """임시 파일을 멤버로 추가한다(임시 파일은 항상 삭제)."""
+        try:
+            with open(tmp_path, "rb") as f:
+                return self._append(f, os.fstat(f.fileno()).st_size, sha256, name, url)
+        finally:
+            os.remove(tmp_path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self.format == "tar":
+                self._tar.close()
+            else:
+                self._zip.close()
+            self._index.close()
+
+    def stats_line(self) -> str:
+        return f"아카이브: {self.path} (이번 실행에서 {self.added}개 추가, 인덱스 {self.index_path})"
+
+
+class ArchiveReader:
+    """사이드카 인덱스로 아카이브 멤버를 압축 해제 없이 읽는다."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = {e["name"]: e for e in load_index(path)}
+        self._f = open(path, "rb")
+
+    def __iter__(self):
+        return iter(self.entries.values())
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def read(self, name: str) -> bytes:
+        entry = self.entries[name]
+        self._f.seek(entry["offset"])
+        return self._f.read(entry["size"])
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
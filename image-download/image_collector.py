@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+image_collector.py
+------------------
+이미지 다운로더(download_images.py / download_images_async.py) 공용 HTML 이미지 수집기.
+
+- `<img>`: srcset / data-srcset(가장 큰 후보) -> src -> data-src, data-original,
+  data-lazy, data-echo, data-image, data-hires 순으로 첫 번째 유효 값
+- `<picture>` 안의 `<source srcset>`: 후보 중 가장 큰 것
+- 모든 태그의 `style="...url(...)"` 과 인라인 `<style>` 블록의 `url(...)`
+- `<a href>`, `<area href>` 링크(재귀 크롤링용)
+- data: URL은 건너뜀
+- 표준 라이브러리(html.parser)만 사용
+
+처리량을 위해
+- 관심 없는 태그(p, div, span … 중 style 속성이 없는 것)는 속성을 해석하지 않고 건너뜀
+- 태그마다 `dict(attrs)` 를 만들지 않고 속성 목록을 한 번만 훑음
+- CSS 정규식은 `url(` 이 들어 있는 style 값에만 적용
+- 루트 상대 경로(`/img/a.png`)와 절대 URL은 urljoin 없이 바로 처리
+(bench_collector.py 로 이전 파서와 처리량 비교)
+"""
+from __future__ import annotations
+
+import re
+from html import unescape
+from html.parser import HTMLParser
+from urllib.parse import urldefrag, urljoin, urlparse, urlsplit
+
+DATA_URL_RE = re.compile(r"^data:", re.IGNORECASE)
+CSS_URL_RE = re.compile(r'url\((["\']?)(.+?)\1\)')
+
+# <img>에서 srcset 다음으로 보는 단일 URL 속성(앞쪽이 우선)
+IMG_SRC_ATTRS = ("src", "data-src", "data-original", "data-lazy", "data-echo", "data-image", "data-hires")
+_IMG_SRC_RANK = {name: i for i, name in enumerate(IMG_SRC_ATTRS)}
+
+# 속성을 해석해야 하는 태그. 나머지는 style 속성이 있을 때만 해석
+INTERESTING_TAGS = frozenset(("img", "source", "picture", "a", "area", "style"))
+_TAG_NAME_RE = re.compile(r"<([a-zA-Z][^\t\n\r\f />\x00]*)")
+_STYLE_ATTR_RE = re.compile(r"style", re.IGNORECASE)
+# 속성 이름과 (따옴표 포함) 값. 태그 하나의 속성을 findall 한 번으로 나눔
+_ATTR_RE = re.compile(r"""([^\s/>=][^\s/>=]*)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s>]*))?""")
+
+# srcset 후보: URL(공백이 아닌 문자열, 끝의 쉼표 제외) + 다음 쉼표까지의 설명자
+_SRCSET_CANDIDATE_RE = re.compile(r"[\s,]*(\S*[^,\s])(?:,+|\s+([^,]*),?|$)")
+
+
+def parse_srcset(srcset: str) -> list[tuple[str, str]]:
+    """srcset을 (URL, 설명자) 목록으로 나눈다(HTML 표준의 후보 분리 규칙).
+
+    URL 안의 쉼표(예: CDN 변환 파라미터 ``w_100,h_100``)는 구분자로 보지 않는다.
+    """
+    return [(m.group(1), (m.group(2) or "").strip()) for m in _SRCSET_CANDIDATE_RE.finditer(srcset)]
+
+
+def _descriptor_key(descriptor: str) -> tuple[int, float]:
+    # 너비(w)가 밀도(x)보다 우선, 설명자가 없으면 1x
+    try:
+        if descriptor.endswith("w"):
+            return 1, float(descriptor[:-1])
+        if descriptor.endswith("x"):
+            return 0, float(descriptor[:-1])
+    except ValueError:
+        pass
+    return 0, 1.0
+
+
+def best_srcset_candidate(srcset: str) -> str | None:
+    """가장 큰 w(없으면 x) 설명자의 후보 URL(상대 경로 그대로)"""
+    candidates = [(url, desc) for url, desc in parse_srcset(srcset) if not DATA_URL_RE.match(url)]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda c: _descriptor_key(c[1]))[0]
+
+
+def choose_src_from_srcset(srcset: str, base_url: str) -> str | None:
+    """가장 큰 w(없으면 x) 설명자의 후보를 절대 URL로 돌려준다."""
+    url = best_srcset_candidate(srcset)
+    return urljoin(base_url, url) if url else None
+
+
+class ImageCollector(HTMLParser):
+    """HTML에서 이미지 URL(image_urls)과 링크(links)를 모은다.
+
+    feed()를 여러 번 나눠 호출해도 되며(--stream-html), 호출 사이에
+    image_urls를 비워 새로 발견한 것만 가져갈 수 있다.
+    """
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.image_urls: list[str] = []
+        self.links: list[str] = []
+        self._picture_depth = 0
+        self._style_chunks: list[str] | None = None
+        parts = urlsplit(base_url)
+        self._origin = f"{parts.scheme}://{parts.netloc}" if parts.scheme and parts.netloc else None
+
+    def _resolve(self, url: str) -> str:
+        # 대부분을 차지하는 루트 상대 경로와 절대 URL은 urljoin(상대적으로 느림)을 거치지 않음
+        if url.startswith(("http://", "https://")) and "/." not in url:
+            return url
+        if self._origin and url.startswith("/") and not url.startswith("//") and "/." not in url:
+            return self._origin + url
+        return urljoin(self.base_url, url)
+
+    def _add_css_urls(self, css: str):
+        if "url(" not in css:
+            return
+        for m in CSS_URL_RE.finditer(css):
+            url = m.group(2).strip()
+            if not DATA_URL_RE.match(url):
+                self.image_urls.append(self._resolve(url))
+
+    def _add_srcset(self, srcset: str) -> bool:
+        url = best_srcset_candidate(srcset)
+        if url:
+            self.image_urls.append(self._resolve(url))
+            return True
+        return False
+
+    def parse_starttag(self, i):
+        # 관심 없는 태그는 끝 위치만 찾고 속성 해석과 콜백을 생략하고,
+        # 관심 있는 태그도 속성마다 정규식을 돌리는 대신 findall 한 번으로 나눔
+        endpos = self.check_for_whole_start_tag(i)
+        if endpos < 0:
+            return endpos
+        rawdata = self.rawdata
+        m = _TAG_NAME_RE.match(rawdata, i)
+        tag = m.group(1).lower() if m else ""
+        if (not tag or tag in self.CDATA_CONTENT_ELEMENTS
+                or tag in getattr(self, "RCDATA_CONTENT_ELEMENTS", ())):
+            # <style>/<script>(CDATA), <title>/<textarea>(RCDATA, 최신 CPython): 내용 모드 전환은 기본 구현에 맡김
+            return super().parse_starttag(i)
+        self.lasttag = tag
+        if tag not in INTERESTING_TAGS and not _STYLE_ATTR_RE.search(rawdata, i, endpos):
+            return endpos
+        attrs = []
+        for name, value in _ATTR_RE.findall(rawdata, m.end(), endpos):
+            if value[:1] in ("'", '"'):
+                value = value[1:-1]
+            if "&" in value:
+                value = unescape(value)
+            attrs.append((name.lower(), value))
+        if rawdata.startswith("/>", endpos - 2):
+            self.handle_startendtag(tag, attrs)
+        else:
+            self.handle_starttag(tag, attrs)
+        return endpos
+
+    def handle_starttag(self, tag: str, attrs):
+        # html.parser가 태그/속성 이름을 이미 소문자로 바꿔 줌
+        if tag == "img":
+            self._handle_img(attrs)
+            return
+        for name, value in attrs:
+            if not value:
+                continue
+            if name == "style":
+                self._add_css_urls(value)
+            elif name == "href" and (tag == "a" or tag == "area"):
+                self.links.append(self._resolve(value))
+            elif tag == "source" and self._picture_depth and (name == "srcset" or name == "data-srcset"):
+                self._add_srcset(value)
+        if tag == "picture":
+            self._picture_depth += 1
+        elif tag == "style":
+            self._style_chunks = []
+
+    def handle_startendtag(self, tag: str, attrs):
+        # <img/> 처럼 닫힌 태그는 내용이 없으므로 picture/style 상태를 바꾸지 않음
+        if tag == "picture" or tag == "style":
+            return
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str):
+        if tag == "picture":
+            if self._picture_depth:
+                self._picture_depth -= 1
+        elif tag == "style" and self._style_chunks is not None:
+            # 스트리밍 파싱에서는 <style> 내용이 여러 조각으로 오므로 닫힐 때 한 번에 검사
+            self._add_css_urls("".join(self._style_chunks))
+            self._style_chunks = None
+
+    def handle_data(self, data: str):
+        if self._style_chunks is not None:
+            self._style_chunks.append(data)
+
+    def _handle_img(self, attrs):
+        srcset = None
+        src = None
+        src_rank = len(IMG_SRC_ATTRS)
+        for name, value in attrs:
+            if not value:
+                continue
+            if name == "srcset" or name == "data-srcset":
+                if srcset is None or name == "srcset":
+                    srcset = value
+            elif name == "style":
+                self._add_css_urls(value)
+            else:
+                rank = _IMG_SRC_RANK.get(name)
+                if rank is not None and rank < src_rank and not DATA_URL_RE.match(value):
+                    src, src_rank = value, rank
+        if srcset and self._add_srcset(srcset):
+            return
+        if src:
+            self.image_urls.append(self._resolve(src))
+
+    def close(self):
+        super().close()
+        if self._style_chunks is not None:  # 닫히지 않은 <style>
+            self._add_css_urls("".join(self._style_chunks))
+            self._style_chunks = None
+
+
+def crawlable_links(links: list[str]) -> list[str]:
+    """#fragment를 떼고 http/https 링크만 순서를 유지하며 중복 없이 돌려준다."""
+    uniq: dict[str, None] = {}
+    for link in links:
+        link = urldefrag(link)[0]
+        if urlparse(link).scheme in ("http", "https"):
+            uniq[link] = None
+    return list(uniq)
+
+
+def collect_images_and_links(html: str, base_url: str) -> tuple[list[str], list[str]]:
+    """이미지 URL과 따라갈 링크를 각각 순서를 유지하며 중복 없이 돌려준다."""
+    parser = ImageCollector(base_url)
+    parser.feed(html)
+    parser.close()
+    return list(dict.fromkeys(parser.image_urls)), crawlable_links(parser.links)
+
+
+def collect_images_from_html(html: str, base_url: str) -> list[str]:
+    return collect_images_and_links(html, base_url)[0]
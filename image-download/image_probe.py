@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+image_probe.py
+--------------
+이미지 다운로더(download_images.py / download_images_async.py) 공용 크기 필터.
+
+`--min-bytes` / `--min-width` / `--min-height` 에서 사용하며, 본문 전체를 받기 전에
+1×1 추적 픽셀, 파비콘, 스프라이트 아이콘 같은 작은 장식 이미지를 걸러냅니다.
+- 용량: 응답 헤더의 Content-Length로 판단(없으면 받은 뒤 실제 크기로 판단)
+- 가로/세로: 본문 앞부분(최대 PROBE_BYTES)만 읽어 PNG/JPEG/GIF/WebP 헤더에서 해석
+- 헤더로 크기를 알 수 없는 형식(SVG 등)은 걸러내지 않음
+"""
+from __future__ import annotations
+
+import struct
+import threading
+
+# 가로/세로를 찾기 위해 본문 앞에서 최대로 읽는 바이트 수(JPEG은 EXIF 뒤에 SOF가 옴)
+PROBE_BYTES = 64 * 1024
+# 형식 판별에 필요한 최소 바이트 수
+SNIFF_BYTES = 32
+
+# 크기 정보가 없는 JPEG 마커(SOF가 아님)
+_JPEG_NON_SOF = {0xC4, 0xC8, 0xCC}
+
+
+def sniff_format(head: bytes) -> str | None:
+    """앞부분 매직 바이트로 png / gif / jpeg / webp 판별"""
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if head.startswith(b"\xff\xd8"):
+        return "jpeg"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def _jpeg_size(head: bytes) -> tuple[int, int] | None:
+    i = 2
+    n = len(head)
+    while i + 9 < n:
+        if head[i] != 0xFF:
+            return None  # 마커 위치가 어긋난 손상 파일
+        marker = head[i + 1]
+        if marker == 0xFF:  # 채움 바이트
+            i += 1
+            continue
+        if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:  # 길이 없는 마커
+            i += 2
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in _JPEG_NON_SOF:
+            height, width = struct.unpack(">HH", head[i + 5:i + 9])
+            return width, height
+        i += 2 + struct.unpack(">H", head[i + 2:i + 4])[0]
+    return None
+
+
+def _webp_size(head: bytes) -> tuple[int, int] | None:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and len(head) >= 30 and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and len(head) >= 25 and head[20] == 0x2F:
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X" and len(head) >= 30:
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def image_size(head: bytes) -> tuple[int, int] | None:
+    """본문 앞부분에서 (가로, 세로)를 읽는다. 지원하지 않는 형식이거나 바이트가 모자라면 None"""
+    fmt = sniff_format(head)
+    if fmt == "png":
+        if len(head) >= 24 and head[12:16] == b"IHDR":
+            return struct.unpack(">II", head[16:24])
+    elif fmt == "gif":
+        if len(head) >= 10:
+            return struct.unpack("<HH", head[6:10])
+    elif fmt == "jpeg":
+        return _jpeg_size(head)
+    elif fmt == "webp":
+        return _webp_size(head)
+    return None
+
+
+class SizeFilter:
+    """최소 용량/가로/세로 조건으로 작은 이미지를 건너뛰는 필터"""
+
+    def __init__(self, min_bytes: int = 0, min_width: int = 0, min_height: int = 0):
+        self.min_bytes = min_bytes
+        self.min_width = min_width
+        self.min_height = min_height
+        self.skipped = 0
+        self._lock = threading.Lock()  # download_images.py --workers 모드용
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.min_bytes or self.min_width or self.min_height)
+
+    @property
+    def needs_probe(self) -> bool:
+        """본문 앞부분을 읽어 가로/세로를 확인해야 하는지"""
+        return bool(self.min_width or self.min_height)
+
+    def check_length(self, length) -> str | None:
+        """용량(Content-Length 헤더 값 또는 실제 바이트 수)이 너무 작으면 사유를 돌려준다."""
+        if not self.min_bytes or length is None:
+            return None
+        try:
+            length = int(length)
+        except (TypeError, ValueError):
+            return None
+        if length < self.min_bytes:
+            return f"{length}바이트 < {self.min_bytes}바이트"
+        return None
+
+    def probe_done(self, head: bytes) -> bool:
+        """지금까지 읽은 앞부분으로 판단이 끝났는지(더 읽을 필요가 없는지)"""
+        if len(head) >= PROBE_BYTES or image_size(head) is not None:
+            return True
+        return len(head) >= SNIFF_BYTES and sniff_format(head) is None
+
+    def check_head(self, head: bytes) -> str | None:
+        """앞부분에서 읽은 가로/세로가 너무 작으면 사유를 돌려준다."""
+        size = image_size(head)
+        if size is None:
+            return None
+        width, height = size
+        if width < self.min_width or height < self.min_height:
+            return f"{width}x{height}"
+        return None
+
+    def skip(self, url: str, reason: str) -> None:
+        with self._lock:
+            self.skipped += 1
+        print(f"[SKIP] {url} -> 작은 이미지({reason})")
+
+    def stats_line(self) -> str:
+        return f"크기 필터: 작은 이미지 {self.skipped}개 건너뜀"
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+object_store.py
+---------------
+이미지 다운로더(download_images.py / download_images_async.py) 공용 내용 주소(content-addressed) 저장소.
+
+`--layout cas` 에서 사용하며, 파일을 `<root>/ab/cd/<sha256><ext>` 로 저장합니다.
+- 파일명이 내용 해시로 정해지므로 `_2`, `_3` … 충돌 탐색이 없음(O(1))
+- 샤딩(65536개 하위 폴더)으로 한 폴더에 수백만 개 이미지도 보관 가능
+- 임시 파일을 끝까지 쓴 뒤 하드링크로 게시하므로, 같은 객체를 동시에 쓰는
+  작업이 있어도 한쪽만 생성에 성공하고(O_EXCL과 같은 배타적 생성) 반쯤 쓰인
+  파일이 보이지 않음
+- `manifest.jsonl` 에 원본 URL, 제안 파일명, 저장 경로, sha256을 한 줄씩 기록
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+MANIFEST_FILENAME = "manifest.jsonl"
+
+
+class ObjectStore:
+    """`<root>/ab/cd/<sha256><ext>` 저장소와 manifest.jsonl"""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.manifest_path = os.path.join(root, MANIFEST_FILENAME)
+        self._manifest = open(self.manifest_path, "a", encoding="utf-8")
+        self._lock = threading.Lock()  # download_images.py --workers 모드용
+
+    def shard_dir(self, sha256: str) -> str:
+        return os.path.join(self.root, sha256[:2], sha256[2:4])
+
+    def object_path(self, sha256: str, ext: str) -> str:
+        return os.path.join(self.shard_dir(sha256), sha256 + ext)
+
+    def find(self, sha256: str) -> str | None:
+        """확장자와 무관하게 이미 저장된 객체 경로"""
+        try:
+            names = os.listdir(self.shard_dir(sha256))
+        except FileNotFoundError:
+            return None
+        for name in names:
+            if name.startswith(sha256):
+                return os.path.join(self.shard_dir(sha256), name)
+        return None
+
+    def _publish(self, tmp_path: str, path: str) -> bool:
+        """완성된 임시 파일을 객체 경로에 배타적으로 게시한다. 이미 있으면 False"""
+        try:
+            os.link(tmp_path, path)
+            return True
+        except FileExistsError:
+            return False
+        except OSError:
+            # 하드링크를 지원하지 않는 파일시스템: O_EXCL로 만든 뒤 내용 복사
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                return False
+            with os.fdopen(fd, "wb") as dst, open(tmp_path, "rb") as src:
+                shutil.copyfileobj(src, dst)
+            return True
+
+    def put_file(self, tmp_path: str, sha256: str, ext: str) -> tuple[str, bool]:
+        """임시 파일을 객체로 옮긴다(임시 파일은 항상 삭제).
+
+        Returns:
+            (객체 경로, 새로 만들었는지 여부)
+        """
+        existing = self.find(sha256)
+        if existing:
+            os.remove(tmp_path)
+            return existing, False
+        path = self.object_path(sha256, ext)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            created = self._publish(tmp_path, path)
+        finally:
+            os.remove(tmp_path)
+        return path, created
+
+    def new_tempfile(self) -> str:
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".obj-", suffix=".part")
+        os.close(fd)
+        return tmp_path
+
+    def put_bytes(self, data: bytes, sha256: str, ext: str) -> tuple[str, bool]:
+        existing = self.find(sha256)
+        if existing:
+            return existing, False
+        tmp_path = self.new_tempfile()
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        return self.put_file(tmp_path, sha256, ext)
+
+    def link_existing(self, src: str, sha256: str, ext: str) -> tuple[str, bool]:
+        """다른 곳(이전 실행 등)에 저장된 같은 내용을 객체로 하드링크한다."""
+        existing = self.find(sha256)
+        if existing:
+            return existing, False
+        path = self.object_path(sha256, ext)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path, self._publish(src, path)
+
+    def record(self, url: str, name: str, path: str, sha256: str) -> None:
+        entry = {"url": url, "name": name, "path": os.path.relpath(path, self.root), "sha256": sha256}
+        with self._lock:
+            self._manifest.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._manifest.flush()
+
+    def close(self) -> None:
+        self._manifest.close()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ocr_cache.py
+------------
+extract_text_from_images.py 용 raw OCR 결과 캐시.
+
+predict 결과(박스, 텍스트, 신뢰도)를 `<ocr_dir>/.ocr_cache/<키 앞 2자리>/<키>.npz` 에
+저장합니다. 키는 이미지 sha256 + 전처리/모델 설정 지문(ocr_manifest.inference_fingerprint)이므로,
+신뢰도 임계값이나 row_distance_threshold만 바꾼 경우 모델 추론 없이 캐시에서
+표 구조 감지와 markdown 생성만 다시 합니다.
+
+파일 형식(np.savez_compressed, pickle 사용 안 함):
+- points  : float32 (박스 꼭짓점 수 합계, 2)
+- npoints : int32 (N,)     박스마다 꼭짓점 수
+- scores  : float32 (N,)
+- text    : uint8          UTF-8 텍스트를 이어 붙인 바이트
+- offsets : int64 (N + 1,) 텍스트 경계
+
+NumPy는 캐시 파일을 실제로 읽거나 쓸 때만 임포트합니다 (키 계산과 존재 확인만으로는 불러오지 않음).
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_DIRNAME = ".ocr_cache"
+FORMAT_VERSION = 1
+
+
+def cache_key(image_sha256: str, fingerprint: str) -> str:
+    data = f"{FORMAT_VERSION}:{image_sha256}:{fingerprint}"
+    return hashlib.sha256(data.encode("ascii")).hexdigest()
+
+
+class OCRResultCache:
+    """키 -> OCR 결과 항목 목록({'text', 'confidence', 'bbox'}) 파일 캐시.
+    여러 작업 프로세스가 같은 디렉토리를 써도 되도록 임시 파일 + os.replace로 저장"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.npz"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def get(self, key: str) -> list[dict] | None:
+        import numpy as np
+
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                points = data["points"].tolist()
+                npoints = data["npoints"].tolist()
+                scores = data["scores"].tolist()
+                text = data["text"].tobytes()
+                offsets = data["offsets"].tolist()
+        except FileNotFoundError:
+            return None
+        except Exception:
+            return None  # 손상된 파일은 캐시에 없는 것으로 보고 다시 추론
+
+        items = []
+        start = 0
+        for i, count in enumerate(npoints):
+            items.append({
+                'text': text[offsets[i]:offsets[i + 1]].decode("utf-8"),
+                'confidence': scores[i],
+                'bbox': points[start:start + count],
+            })
+            start += count
+        return items
+
+    def put(self, key: str, items: list[dict]) -> None:
+        import numpy as np
+
+        encoded = [str(item.get('text') or "").encode("utf-8") for item in items]
+        offsets = np.zeros(len(items) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+        boxes = [item.get('bbox') or [] for item in items]
+        points = np.array([point[:2] for box in boxes for point in box], dtype=np.float32).reshape(-1, 2)
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    points=points,
+                    npoints=np.array([len(box) for box in boxes], dtype=np.int32),
+                    scores=np.array([float(item.get('confidence') or 0.0) for item in items], dtype=np.float32),
+                    text=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+                    offsets=offsets,
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
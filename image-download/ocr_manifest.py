@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ocr_manifest.py
+---------------
+extract_text_from_images.py 용 증분 OCR 매니페스트(JSONL).
+
+`<ocr_dir>/.ocr_manifest.jsonl` 에 markdown을 만들 때마다 한 줄씩 덧붙여 기록합니다
+(이미지마다 마지막 줄이 유효).
+    {"image", "sha256", "size", "mtime_ns", "fingerprint", "output", "time"}
+
+다음 실행에서 이미지 내용(sha256), 설정 지문(fingerprint), 결과 파일이 모두 그대로면
+그 이미지는 다시 OCR하지 않습니다. 크기와 mtime이 기록과 같으면 파일을 다시 해시하지 않습니다.
+설정 지문은 결과에 영향을 주는 OCRConfig / ImageProcessingConfig 값과 PaddleOCR 버전으로 만들며,
+병렬 프로세스 수나 배치 크기처럼 결과와 무관한 값은 제외합니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+MANIFEST_FILENAME = ".ocr_manifest.jsonl"
+
+# 결과 markdown에 영향을 주지 않는 OCRConfig 필드
+RUNTIME_ONLY_OCR_FIELDS = frozenset(("use_gpu", "workers", "batch_size"))
+# 인식 결과(박스, 텍스트, 신뢰도)에는 영향을 주지 않고 markdown 생성에만 쓰이는 OCRConfig 필드
+FORMAT_ONLY_OCR_FIELDS = frozenset(("confidence_threshold_table", "confidence_threshold_text",
+                                    "row_distance_threshold"))
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _paddleocr_version() -> str | None:
+    try:
+        from importlib.metadata import version
+        return version("paddleocr")
+    except Exception:
+        return None
+
+
+def config_fingerprint(config, exclude_ocr_fields: frozenset = RUNTIME_ONLY_OCR_FIELDS) -> str:
+    """결과에 영향을 주는 설정 값의 sha256 (앞 16자리)"""
+    ocr = {k: v for k, v in asdict(config.ocr).items() if k not in exclude_ocr_fields}
+    payload = {
+        "ocr": ocr,
+        "image_processing": asdict(config.image_processing),
+        "paddleocr": _paddleocr_version(),
+    }
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=list)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def inference_fingerprint(config) -> str:
+    """OCR 인식 결과에 영향을 주는 설정(전처리, 모델) 값만의 지문 (raw 결과 캐시 키용)"""
+    return config_fingerprint(config, RUNTIME_ONLY_OCR_FIELDS | FORMAT_ONLY_OCR_FIELDS)
+
+
+class OCRManifest:
+    """이미지 이름 -> 마지막으로 만든 markdown의 입력 해시 / 설정 지문 JSONL 기록"""
+
+    def __init__(self, ocr_dir: Path):
+        self.path = Path(ocr_dir) / MANIFEST_FILENAME
+        self._state: dict[str, dict] = self._load()
+        self._current: dict[str, tuple[int, int, str]] = {}  # 이번 실행에서 확인한 (size, mtime_ns, sha256)
+        self._file = None
+        self.skipped = 0
+        self.recorded = 0
+
+    def _load(self) -> dict[str, dict]:
+        state: dict[str, dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # 강제 종료로 잘린 마지막 줄
+                    if isinstance(rec, dict) and "image" in rec:
+                        state[rec["image"]] = rec
+        except FileNotFoundError:
+            pass
+        return state
+
+    def image_sha256(self, image_path: Path) -> str:
+        """이미지 내용 해시. 크기와 mtime이 기록과 같으면 기록된 값을 사용"""
+        st = image_path.stat()
+        rec = self._state.get(image_path.name)
+        if rec and rec.get("size") == st.st_size and rec.get("mtime_ns") == st.st_mtime_ns:
+            sha256 = rec["sha256"]
+        else:
+            sha256 = file_sha256(image_path)
+        self._current[image_path.name] = (st.st_size, st.st_mtime_ns, sha256)
+        return sha256
+
+    def is_current(self, image_path: Path, output_path: Path, fingerprint: str) -> bool:
+        """결과 markdown이 현재 이미지와 설정으로 만든 것인지"""
+        rec = self._state.get(image_path.name)
+        if not rec or rec.get("fingerprint") != fingerprint or rec.get("output") != output_path.name:
+            return False
+        if not output_path.exists():
+            return False
+        return self.image_sha256(image_path) == rec.get("sha256")
+
+    def record(self, image_path: Path, output_path: Path, fingerprint: str) -> None:
+        """markdown을 새로 만든 이미지 기록 (해시는 처리 전에 확인한 값 사용)"""
+        current = self._current.get(image_path.name)
+        if current is None:
+            self.image_sha256(image_path)
+            current = self._current[image_path.name]
+        size, mtime_ns, sha256 = current
+        rec = {"image": image_path.name, "sha256": sha256, "size": size, "mtime_ns": mtime_ns,
+               "fingerprint": fingerprint, "output": output_path.name,
+               "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        self._state[image_path.name] = rec
+        if self._file is None:
+            os.makedirs(self.path.parent, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.recorded += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats_line(self) -> str:
+        return f"증분 처리: 변경 없음 {self.skipped}개 건너뜀, {self.recorded}개 새로 기록 ({self.path})"
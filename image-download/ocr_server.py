@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ocr_server.py
+-------------
+OCR 모델을 한 번만 로드해 두고 로컬 HTTP(localhost 포트 또는 Unix 소켓)로 요청을 받는 OCR 서버와 클라이언트.
+
+- 이미지 읽기·전처리는 요청 스레드마다 하고(OpenCV는 GIL을 놓음), predict는 배치 스레드 하나가
+  동시에 들어온 요청을 최대 --batch-size장, --max-wait-ms까지 모아 한 번에 호출 (micro-batching)
+- 결과는 markdown(extract_text_from_images.py와 같은 설정·형식) 또는 raw 박스 목록
+- raw OCR 결과 캐시(<ocr_dir>/.ocr_cache)를 같이 써서 이미 처리한 이미지는 추론하지 않음
+- 모듈 최상단은 표준 라이브러리만 임포트하므로 클라이언트(OCRClient)는 모델 없이 바로 뜸
+
+API:
+    GET  /health  -> {"status": "ok", "requests", "batches", "images"}
+    POST /ocr     JSON {"path": "/절대/경로.png", "format": "markdown" | "boxes"}
+    POST /ocr?format=boxes&name=파일명.png   본문은 이미지 바이트 (Content-Type: application/octet-stream)
+    응답: {"name", "markdown"} 또는 {"name", "items": [{"text", "confidence", "bbox"}]}, 실패하면 {"error"}
+
+경로 요청은 서버 프로세스 권한으로 파일을 읽으므로 기본값처럼 localhost나 Unix 소켓(소유자 전용 권한)에만 여세요.
+
+사용법:
+    python ocr_server.py                              # 127.0.0.1:8765
+    python ocr_server.py --socket /tmp/ocr.sock       # Unix 소켓
+    python process_single_image.py --server 1fa7af9dea9e1.png
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import http.client
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+from urllib.parse import parse_qs, quote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+FORMATS = ("markdown", "boxes")
+
+
+def parse_address(address: str) -> tuple[str, str | tuple[str, int]]:
+    """'unix:/경로' -> ("unix", 경로), '[http://]호스트:포트' -> ("tcp", (호스트, 포트))"""
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    if "://" in address:
+        address = address.split("://", 1)[1]
+    host, _, port = address.rstrip("/").rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"서버 주소 형식이 잘못되었습니다: {address} (예: {DEFAULT_ADDRESS}, unix:/tmp/ocr.sock)")
+    return "tcp", (host, int(port))
+
+
+# --------- 클라이언트 ---------
+class OCRServerError(RuntimeError):
+    """서버가 오류 응답을 돌려준 경우"""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+class OCRClient:
+    """OCR 서버 클라이언트 (주소 기본값: 환경변수 OCR_SERVER, 없으면 127.0.0.1:8765)"""
+
+    def __init__(self, address: str | None = None, timeout: float = 300.0):
+        self.address = address or os.getenv("OCR_SERVER") or DEFAULT_ADDRESS
+        self.timeout = timeout
+        self._kind, self._target = parse_address(self.address)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._kind == "unix":
+            return _UnixHTTPConnection(self._target, self.timeout)
+        host, port = self._target
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _request(self, method: str, url: str, body: bytes | None = None, headers: dict | None = None) -> dict:
+        conn = self._connection()
+        try:
+            conn.request(method, url, body=body, headers=headers or {})
+            response = conn.getresponse()
+            payload = json.loads(response.read() or b"{}")
+        finally:
+            conn.close()
+        if response.status != 200:
+            raise OCRServerError(payload.get("error") or f"HTTP {response.status}")
+        return payload
+
+    def health(self) -> dict:
+        return self._request("GET", "/health")
+
+    def ocr_path(self, path: Path, fmt: str = "markdown") -> dict:
+        """서버가 읽을 수 있는 이미지 파일 경로로 요청"""
+        body = json.dumps({"path": str(Path(path).resolve()), "format": fmt}).encode("utf-8")
+        return self._request("POST", "/ocr", body, {"Content-Type": "application/json"})
+
+    def ocr_bytes(self, data: bytes, name: str, fmt: str = "markdown") -> dict:
+        """이미지 바이트를 직접 보내 요청 (서버와 파일 시스템을 공유하지 않을 때)"""
+        url = f"/ocr?format={quote(fmt)}&name={quote(name)}"
+        return self._request("POST", url, data, {"Content-Type": "application/octet-stream"})
+
+
+# --------- 서버 ---------
+class MicroBatcher:
+    """여러 요청 스레드가 넣은 이미지를 모아 predict_batch를 배치 스레드 하나에서 호출
+    (Paddle predictor는 스레드 안전하지 않으므로 추론은 항상 이 스레드에서만)"""
+
+    def __init__(self, predict_batch: Callable[[list], list], max_batch: int, max_wait: float):
+        self._predict_batch = predict_batch
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self.batches = 0
+        self.images = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="ocr-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, image) -> Future:
+        """전처리된 이미지 한 장을 맡기고 OCR 결과 항목 목록을 받을 Future"""
+        future: Future = Future()
+        self._queue.put((image, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # 첫 이미지가 들어온 뒤 max_wait 동안 같이 들어온 요청을 모음
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                results = self._predict_batch([image for image, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.images += len(batch)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+class OCRService:
+    """요청 하나를 OCR 결과 항목 목록(원본 좌표)으로 처리"""
+
+    def __init__(self, extractor, batcher: MicroBatcher):
+        self.extractor = extractor
+        self.batcher = batcher
+        self.requests = 0
+
+    def ocr(self, image_path: Path, data: bytes | None = None) -> list[dict]:
+        # 늦게 임포트: 클라이언트로만 쓸 때는 OCR 모듈을 불러오지 않음
+        import ocr_tiling
+        from ocr_cache import cache_key
+        from ocr_manifest import file_sha256
+        from extract_text_from_images import scale_ocr_items
+
+        extractor = self.extractor
+        self.requests += 1
+
+        image_sha256 = hashlib.sha256(data).hexdigest() if data is not None else file_sha256(image_path)
+        key = cache_key(image_sha256, extractor.inference_fingerprint)
+        cached = extractor.raw_cache.get(key)
+        if cached is not None:
+            return cached
+
+        gray, scale = extractor.load_grayscale(image_path, data=data)
+        if extractor.needs_tiling(gray):
+            # 세로로 긴 이미지는 띠마다 따로 맡겨 다른 요청과 같이 배치
+            ranges = ocr_tiling.strip_ranges(gray.shape[0], extractor.config.ocr.tile_height,
+                                             extractor.config.ocr.tile_overlap)
+            futures = [self.batcher.submit(extractor.enhance_image(gray[start:end])) for start, end in ranges]
+            items = ocr_tiling.merge_strip_results([future.result() for future in futures], ranges)
+        else:
+            items = self.batcher.submit(extractor.enhance_image(gray)).result()
+        del gray
+
+        items = scale_ocr_items(items, 1.0 / scale)
+        try:
+            extractor.raw_cache.put(key, items)
+        except OSError as e:
+            logger.warning(f"raw OCR 결과 캐시 저장 실패: {image_path.name} - {str(e)}")
+        return items
+
+    def stats(self) -> dict:
+        return {"status": "ok", "requests": self.requests,
+                "batches": self.batcher.batches, "images": self.batcher.images}
+
+
+class OCRRequestHandler(BaseHTTPRequestHandler):
+    server_version = "OCRServer/1.0"
+
+    def do_GET(self):
+        if urlsplit(self.path).path != "/health":
+            self._send(404, {"error": f"알 수 없는 경로: {self.path}"})
+            return
+        self._send(200, self.server.service.stats())
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/ocr":
+            self._send(404, {"error": f"알 수 없는 경로: {self.path}"})
+            return
+
+        try:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.headers.get_content_type() == "application/json":
+                request = json.loads(body)
+                image_path = Path(request["path"])
+                fmt = request.get("format", "markdown")
+                data = None
+                if not image_path.is_file():
+                    raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
+            else:
+                query = parse_qs(url.query)
+                image_path = Path(Path(query.get("name", ["image"])[0]).name)
+                fmt = query.get("format", ["markdown"])[0]
+                data = body
+                if not data:
+                    raise ValueError("이미지 바이트가 비어 있습니다.")
+            if fmt not in FORMATS:
+                raise ValueError(f"알 수 없는 형식: {fmt} (markdown 또는 boxes)")
+        except (KeyError, TypeError, ValueError, OSError) as e:
+            self._send(400, {"error": str(e)})
+            return
+
+        try:
+            items = self.server.service.ocr(image_path, data)
+        except ValueError as e:  # 읽을 수 없는 이미지 등
+            self._send(400, {"error": str(e)})
+            return
+        except Exception as e:
+            logger.error(f"OCR 처리 중 오류 발생: {image_path.name} - {str(e)}")
+            self._send(500, {"error": str(e)})
+            return
+
+        if fmt == "boxes":
+            self._send(200, {"name": image_path.name, "items": items})
+        else:
+            markdown = self.server.service.extractor.build_markdown(image_path, items)
+            self._send(200, {"name": image_path.name, "markdown": markdown})
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Unix 소켓에는 클라이언트 주소가 없으므로 address_string()을 쓰지 않음
+        logger.debug("%s", format % args)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(address: str, service: OCRService) -> socketserver.BaseServer:
+    kind, target = parse_address(address)
+    if kind == "unix":
+        if os.path.exists(target):
+            os.remove(target)  # 이전 실행이 남긴 소켓 파일
+        server = ThreadingUnixHTTPServer(target, OCRRequestHandler)
+        os.chmod(target, 0o600)
+    else:
+        server = ThreadingHTTPServer(target, OCRRequestHandler)
+    server.service = service
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 모델을 한 번 로드해 두고 로컬 HTTP로 요청을 받는 OCR 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드할 주소 (기본 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="포트 (기본 8765)")
+    parser.add_argument("--socket", help="TCP 대신 사용할 Unix 소켓 경로")
+    parser.add_argument("--batch-size", type=int, default=8, help="predict 한 번에 모을 최대 이미지 수 (기본 8)")
+    parser.add_argument("--max-wait-ms", type=float, default=10.0,
+                        help="첫 요청 뒤 같은 배치로 묶을 요청을 기다리는 시간 (기본 10ms)")
+    args = parser.parse_args()
+
+    from extract_text_from_images import ImageTextExtractor, config, setup_logging
+
+    setup_logging(config)
+    extractor = ImageTextExtractor(config)
+    logger.info("OCR 모델 로드 중...")
+    extractor.ocr
+
+    batcher = MicroBatcher(extractor.predict_batch, args.batch_size, args.max_wait_ms / 1000.0)
+    address = f"unix:{args.socket}" if args.socket else f"{args.host}:{args.port}"
+    server = make_server(address, OCRService(extractor, batcher))
+
+    print(f"OCR 서버 시작: {address} (배치 최대 {batcher.max_batch}장, 대기 {args.max_wait_ms:g}ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("OCR 서버 종료")
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+
+
+if __name__ == "__main__":
+    main()
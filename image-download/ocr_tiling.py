@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ocr_tiling.py
+-------------
+extract_text_from_images.py 용 세로로 긴 이미지의 분할 OCR 보조 함수.
+
+- 높이가 ocr.tile_height보다 큰 이미지를 tile_overlap만큼 겹치는 가로 띠(strip)로 나눔
+  (남은 높이가 tile_overlap 이하이면 띠를 더 만들지 않고 마지막 띠를 늘리고,
+   그보다 크면 마지막 띠를 짧게 두어 이웃 띠와 tile_overlap보다 많이 겹치지 않게 함)
+- 띠별 OCR 결과의 박스를 전체 이미지 좌표로 옮긴 뒤, 겹치는 구간의 가운데 선을 기준으로
+  중심이 자기 구간에 있는 박스만 남김 (띠 경계에 잘린 박스는 이웃 띠의 온전한 박스가 대신함)
+- 그래도 가운데 선 부근에 같은 글자가 두 번 잡힌 경우(IoU가 높은 박스 쌍)는 신뢰도가 높은 것만 남김
+
+겹침 높이가 텍스트 줄 높이의 두 배 이상이면 모든 줄이 적어도 한 띠에 온전히 들어갑니다.
+"""
+from __future__ import annotations
+
+DUPLICATE_IOU = 0.5
+
+
+def strip_ranges(height: int, tile_height: int, overlap: int) -> list[tuple[int, int]]:
+    """[(시작 y, 끝 y), ...]. tile_height 이하이면 띠 하나.
+    띠 높이는 최대 tile_height + overlap, 이웃한 띠는 정확히 overlap만큼 겹침"""
+    if tile_height <= 0 or height <= tile_height:
+        return [(0, height)]
+    overlap = max(0, min(overlap, tile_height // 2))
+
+    ranges = []
+    start = 0
+    while True:
+        end = start + tile_height
+        if height - end <= overlap:
+            # 남은 높이가 겹침 이하이면 띠를 하나 더 만드는 대신 이 띠를 끝까지 늘림
+            ranges.append((start, height))
+            return ranges
+        ranges.append((start, end))
+        start = end - overlap
+
+
+def _bounds(bbox) -> tuple[float, float, float, float]:
+    xs = [point[0] for point in bbox]
+    ys = [point[1] for point in bbox]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _iou(a, b) -> float:
+    ix = min(a[2], b[2]) - max(a[0], b[0])
+    iy = min(a[3], b[3]) - max(a[1], b[1])
+    if ix <= 0 or iy <= 0:
+        return 0.0
+    inter = ix * iy
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def merge_strip_results(strip_results: list[list[dict]], ranges: list[tuple[int, int]]) -> list[dict]:
+    """띠별 OCR 결과 항목을 전체 좌표로 옮겨 합치고 겹치는 구간의 중복을 제거"""
+    if len(ranges) == 1:
+        return list(strip_results[0])
+
+    # 이웃한 띠가 겹치는 구간의 가운데 선
+    cuts = [(ranges[i + 1][0] + ranges[i][1]) / 2 for i in range(len(ranges) - 1)]
+
+    merged = []
+    strip_of = []
+    for i, (items, (y0, _)) in enumerate(zip(strip_results, ranges)):
+        lo = cuts[i - 1] if i > 0 else float("-inf")
+        hi = cuts[i] if i < len(cuts) else float("inf")
+        for item in items:
+            bbox = [[point[0], point[1] + y0] for point in item['bbox']]
+            y_center = sum(point[1] for point in bbox) / len(bbox)
+            if lo <= y_center < hi:
+                merged.append(dict(item, bbox=bbox))
+                strip_of.append(i)
+
+    # 가운데 선에 걸친 박스끼리 비교해 같은 글자를 두 번 잡은 경우 하나만 남김
+    bounds = [_bounds(item['bbox']) for item in merged]
+    dropped = set()
+    for cut in cuts:
+        near = [k for k, b in enumerate(bounds) if b[1] <= cut <= b[3]]
+        for a_pos, a in enumerate(near):
+            for b in near[a_pos + 1:]:
+                if a in dropped or b in dropped or strip_of[a] == strip_of[b]:
+                    continue
+                if _iou(bounds[a], bounds[b]) >= DUPLICATE_IOU:
+                    worse = a if merged[a].get('confidence', 0) < merged[b].get('confidence', 0) else b
+                    dropped.add(worse)
+
+    return [item for k, item in enumerate(merged) if k not in dropped]
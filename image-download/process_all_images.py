@@ -1,14 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-모든 이미지를 순차적으로 처리하는 배치 스크립트
+모든 이미지를 처리하는 배치 스크립트
+
+작업 프로세스 N개를 띄워 두고, 각 프로세스는 시작할 때 PaddleOCR 모델을 한 번만
+로드한 뒤 대기열에서 이미지를 하나씩 가져와 처리합니다.
+(이미지마다 새 프로세스를 띄우고 모델을 다시 로드하던 방식 대체)
+
+사용법:
+    python process_all_images.py              # 작업 프로세스 2개
+    python process_all_images.py --workers 4
 """
 
+import argparse
+import multiprocessing as mp
 import os
 import sys
-import time
 from pathlib import Path
-import subprocess
+
+# 작업 프로세스마다 시작 시 한 번 만드는 처리기(모델 포함)
+_processor = None
+_init_error = None
+
 
 def get_image_files():
     """images 폴더에서 모든 이미지 파일 목록을 가져옴"""
@@ -22,52 +35,75 @@ def get_image_files():
 
     return sorted(image_files)
 
-def process_all_images():
-    """모든 이미지를 순차적으로 처리"""
+
+def _init_worker(threads_per_worker: int):
+    """작업 프로세스 초기화: 추론 스레드 수를 제한하고 모델을 한 번 로드"""
+    global _processor, _init_error
+    # 작업 프로세스 수 × 스레드 수가 코어 수를 넘지 않도록(사용자가 지정한 값은 유지)
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ.setdefault(var, str(threads_per_worker))
+    try:
+        from process_single_image import SingleImageProcessor
+        _processor = SingleImageProcessor()
+    except BaseException as e:  # PaddleOCR 미설치 시 sys.exit(1) 포함
+        _init_error = f"OCR 엔진 초기화 실패: {e!r}"
+
+
+def _process(image_name: str):
+    """작업 프로세스에서 이미지 하나 처리. (파일명, 성공 여부, 메시지)"""
+    if _init_error:
+        return image_name, False, _init_error
+    try:
+        output_path = _processor.process_image(image_name)
+    except Exception as e:
+        return image_name, False, str(e)
+    if output_path is None:
+        return image_name, False, "처리 중 오류 발생(로그 참고)"
+    return image_name, True, f"{image_name} -> {output_path.name}"
+
+
+def process_all_images(workers: int = 2):
+    """모든 이미지를 작업 프로세스 풀로 처리"""
     image_files = get_image_files()
 
     if not image_files:
         print("처리할 이미지 파일을 찾을 수 없습니다.")
         return
 
+    workers = max(1, min(workers, len(image_files)))
+    threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
     print(f"총 {len(image_files)}개의 이미지 파일을 처리합니다.")
+    print(f"작업 프로세스 {workers}개 (프로세스당 추론 스레드 {threads_per_worker}개)")
     print("=" * 50)
 
-    for i, image_path in enumerate(image_files, 1):
-        print(f"\n[{i}/{len(image_files)}] 처리 중: {image_path.name}")
-        print("-" * 30)
-
-        try:
-            # 단일 이미지 처리 스크립트 실행
-            result = subprocess.run([
-                sys.executable,
-                "process_single_image.py",
-                image_path.name
-            ], capture_output=True, text=True, encoding='utf-8')
-
-            if result.returncode == 0:
-                print(f"✅ 완료: {image_path.name}")
-                if result.stdout:
-                    print(result.stdout.strip())
+    # paddle은 fork 후 사용이 안전하지 않으므로 spawn으로 새 인터프리터를 띄움
+    ctx = mp.get_context("spawn")
+    failed = 0
+    with ctx.Pool(workers, initializer=_init_worker, initargs=(threads_per_worker,)) as pool:
+        names = [p.name for p in image_files]
+        for i, (name, ok, message) in enumerate(pool.imap_unordered(_process, names), 1):
+            print(f"\n[{i}/{len(image_files)}] {name}")
+            print("-" * 30)
+            if ok:
+                print(f"✅ 완료: {name}")
+                print(message)
             else:
-                print(f"❌ 실패: {image_path.name}")
-                if result.stderr:
-                    print(f"오류: {result.stderr.strip()}")
-
-        except Exception as e:
-            print(f"❌ 처리 중 오류 발생: {image_path.name} - {str(e)}")
-
-        # 다음 이미지 처리 전 잠시 대기
-        if i < len(image_files):
-            print("다음 이미지 처리 준비 중...")
-            time.sleep(1)
+                failed += 1
+                print(f"❌ 실패: {name}")
+                print(f"오류: {message}")
 
     print("\n" + "=" * 50)
-    print("모든 이미지 처리 완료!")
+    print(f"모든 이미지 처리 완료! (실패 {failed}개)")
     print(f"결과는 ocr 폴더에 저장되었습니다.")
 
+
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="images 폴더의 모든 이미지를 OCR 처리합니다.")
+    parser.add_argument("-w", "--workers", type=int, default=2,
+                        help="작업 프로세스 수(각각 모델을 한 번 로드, 기본 2)")
+    args = parser.parse_args()
+
     print("이미지 배치 처리기 시작...")
 
     # process_single_image.py 파일이 있는지 확인
@@ -77,7 +113,8 @@ def main():
         sys.exit(1)
 
     # 모든 이미지 처리
-    process_all_images()
+    process_all_images(args.workers)
+
 
 if __name__ == "__main__":
     main()
@@ -7,19 +7,15 @@
 
 import os
 import sys
+import argparse
+import json
 from pathlib import Path
 import time
 import subprocess
 import logging
+from typing import Optional
 
-# PaddleOCR 설치 확인 및 설치 안내
-try:
-    from paddleocr import PaddleOCR
-except ImportError:
-    print("PaddleOCR이 설치되지 않았습니다.")
-    print("다음 명령어로 설치해주세요:")
-    print("pip install paddlepaddle paddleocr")
-    sys.exit(1)
+from ocr_server import OCRClient
 
 # 로깅 설정
 logging.basicConfig(
@@ -28,9 +24,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _import_ocr_stack() -> None:
+    """OpenCV / NumPy / PaddleOCR 임포트 (--server 모드에서는 필요 없으므로 처리기를 만들 때만)"""
+    global cv2, np, PaddleOCR
+    import cv2
+    import numpy as np
+
+    # PaddleOCR 설치 확인 및 설치 안내
+    try:
+        from paddleocr import PaddleOCR
+    except ImportError:
+        print("PaddleOCR이 설치되지 않았습니다.")
+        print("다음 명령어로 설치해주세요:")
+        print("pip install paddlepaddle paddleocr")
+        sys.exit(1)
+
+
 class SingleImageProcessor:
     def __init__(self):
         """단일 이미지 처리기 초기화"""
+        _import_ocr_stack()
         self.ocr = PaddleOCR(
             use_textline_orientation=True,
             lang='korean'
@@ -43,7 +57,7 @@ class SingleImageProcessor:
         # OCR 결과 디렉토리 생성
         self.ocr_dir.mkdir(exist_ok=True)
 
-    def preprocess_image(self, image_path: Path) -> np.ndarray:
+    def preprocess_image(self, image_path: Path) -> "np.ndarray":
         """이미지 전처리"""
         image = cv2.imread(str(image_path))
         if image is None:
@@ -99,13 +113,13 @@ class SingleImageProcessor:
             logger.error(f"텍스트 추출 중 오류 발생: {image_path.name} - {str(e)}")
             return f"# {image_path.stem}\n\n텍스트 추출 중 오류가 발생했습니다: {str(e)}\n"
 
-    def process_image(self, image_filename: str) -> None:
-        """단일 이미지 처리"""
+    def process_image(self, image_filename: str) -> Optional[Path]:
+        """단일 이미지 처리. 저장한 markdown 경로, 실패하면 None"""
         image_path = self.images_dir / image_filename
 
         if not image_path.exists():
             logger.error(f"이미지 파일을 찾을 수 없습니다: {image_filename}")
-            return
+            return None
 
         try:
             # 텍스트 추출
@@ -118,23 +132,89 @@ class SingleImageProcessor:
                 f.write(markdown_content)
 
             logger.info(f"완료: {image_path.name} -> {output_path.name}")
+            return output_path
 
         except Exception as e:
 
             logger.error(f"처리 중 오류 발생: {image_path.name} - {str(e)}")
+            return None
+
+def process_image_via_server(image_filename: str, address: Optional[str] = None,
+                             upload: bool = False, fmt: str = "markdown") -> Optional[Path]:
+    """
+    실행 중인 OCR 서버(ocr_server.py)에 단일 이미지 처리를 맡김 (모델 로드 없음)
+
+    Args:
+        image_filename: images 폴더의 이미지 파일명
+        address: 서버 주소 (기본: 환경변수 OCR_SERVER 또는 127.0.0.1:8765)
+        upload: True이면 경로 대신 이미지 바이트를 보냄 (서버와 파일 시스템을 공유하지 않을 때)
+        fmt: "markdown"이면 <이름>.md, "boxes"이면 raw 박스 목록을 <이름>.json으로 ocr 폴더에 저장
+
+    Returns:
+        저장한 파일 경로, 실패하면 None
+    """
+    script_dir = Path(__file__).parent
+    image_path = script_dir / "images" / image_filename
+
+    if not image_path.exists():
+        logger.error(f"이미지 파일을 찾을 수 없습니다: {image_filename}")
+        return None
+
+    client = OCRClient(address)
+    try:
+        if upload:
+            response = client.ocr_bytes(image_path.read_bytes(), image_path.name, fmt)
+        else:
+            response = client.ocr_path(image_path, fmt)
+    except OSError as e:
+        logger.error(f"OCR 서버({client.address})에 연결할 수 없습니다: {e}. "
+                     f"먼저 python ocr_server.py 로 서버를 실행하세요.")
+        return None
+    except Exception as e:
+        logger.error(f"처리 중 오류 발생: {image_path.name} - {str(e)}")
+        return None
+
+    ocr_dir = script_dir / "ocr"
+    ocr_dir.mkdir(exist_ok=True)
+    if fmt == "boxes":
+        output_path = ocr_dir / f"{image_path.stem}.json"
+        content = json.dumps(response["items"], ensure_ascii=False, indent=2)
+    else:
+        output_path = ocr_dir / f"{image_path.stem}.md"
+        content = response["markdown"]
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    logger.info(f"완료: {image_path.name} -> {output_path.name}")
+    return output_path
 
 def main():
 
     """시스템 기동"""
-    if len(sys.argv) != 2:
-        print("사용법: python process_single_image.py <이미지파일명>")
-        print("예시: python process_single_image.py 1fa7af9dea9e1.png")
-        sys.exit(1)
-
-    image_filename = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description="단일 이미지에서 텍스트를 추출해 markdown으로 저장합니다.",
+        epilog="예시: python process_single_image.py 1fa7af9dea9e1.png")
+    parser.add_argument("image_filename", help="images 폴더의 이미지 파일명")
+    parser.add_argument("--server", nargs="?", const="", metavar="주소",
+                        help="모델을 직접 로드하지 않고 실행 중인 OCR 서버에 맡김 "
+                             "(기본: 환경변수 OCR_SERVER 또는 127.0.0.1:8765, unix:/경로 가능)")
+    parser.add_argument("--upload", action="store_true", help="--server 모드에서 경로 대신 이미지 바이트를 보냄")
+    parser.add_argument("--format", choices=("markdown", "boxes"), default="markdown",
+                        help="--server 모드 결과 형식 (boxes: raw 박스 목록을 ocr/<이름>.json으로 저장)")
+    args = parser.parse_args()
+
+    image_filename = args.image_filename
 
     print(f"이미지 처리 시작: {image_filename}")
 
+    if args.server is not None:
+        # 실행 중인 OCR 서버에 맡김 (모델 로드 없음)
+        if process_image_via_server(image_filename, args.server or None, args.upload, args.format) is None:
+            sys.exit(1)
+        print("처리 완료!")
+        return
+
     # 이미지 처리기 초기화
     processor = SingleImageProcessor()
 
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+run_manifest.py
+---------------
+download_images_async.py 용 실행 매니페스트(JSONL).
+
+URL마다 진행 상태를 한 줄씩 덧붙여 기록하고(마지막 줄이 최종 상태), 중단된 실행을
+같은 매니페스트로 다시 시작하면 다음과 같이 이어서 진행합니다.
+- done    : 요청하지 않고 건너뜀
+- partial : `<out>/.partial/` 에 남은 본문 뒤부터 Range 요청으로 이어받기
+            (If-Range로 검증자가 바뀌었으면 서버가 전체를 다시 보냄)
+- failed  : 처음부터 다시 시도
+- filtered: 크기 필터(--min-bytes 등)로 건너뛴 항목. 다음 실행에서 다시 판단
+
+partial 기록은 본문을 받기 시작할 때 미리 남기므로, 프로세스가 강제 종료되어도
+다음 실행에서 이어받을 수 있습니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+
+PARTIAL_DIRNAME = ".partial"
+
+
+class RunManifest:
+    """URL -> 최근 상태(done / partial / failed) JSONL 기록"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._state: dict[str, dict] = self._load()
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self.skipped = 0
+        self.resumed = 0
+
+    def _load(self) -> dict[str, dict]:
+        state: dict[str, dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # 강제 종료로 잘린 마지막 줄
+                    if isinstance(rec, dict) and "url" in rec:
+                        state[rec["url"]] = rec
+        except FileNotFoundError:
+            pass
+        return state
+
+    def get(self, url: str) -> dict | None:
+        return self._state.get(url)
+
+    def is_done(self, url: str) -> bool:
+        rec = self._state.get(url)
+        return bool(rec and rec.get("status") == "done")
+
+    @staticmethod
+    def part_path(url: str, out_dir: str) -> str:
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(out_dir, PARTIAL_DIRNAME, name + ".part")
+
+    def resume_offset(self, url: str, part_path: str) -> tuple[int, str | None]:
+        """이어받을 위치와 If-Range 검증자. 이어받을 수 없으면 (0, None)"""
+        rec = self._state.get(url)
+        if not rec or rec.get("status") != "partial":
+            return 0, None
+        validator = rec.get("etag") or rec.get("last_modified")
+        if not validator or not os.path.exists(part_path):
+            return 0, None
+        return os.path.getsize(part_path), validator
+
+    def mark(self, url: str, status: str, **fields) -> None:
+        rec = {"url": url, "status": status, "time": time.strftime("%Y-%m-%dT%H:%M:%S"), **fields}
+        self._state[url] = rec
+        self._file.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def stats_line(self) -> str:
+        counts: dict[str, int] = {}
+        for rec in self._state.values():
+            counts[rec.get("status", "?")] = counts.get(rec.get("status", "?"), 0) + 1
+        summary = ", ".join(f"{k} {v}개" for k, v in sorted(counts.items()))
+        return f"실행 매니페스트: {summary} (이번 실행에서 건너뜀 {self.skipped}개, 이어받기 {self.resumed}개)"
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+table_layout.py
+---------------
+extract_text_from_images.py 용 OCR 결과 표 구조 감지 / markdown 표 변환 (NumPy).
+
+- 텍스트 박스 중심은 한 번만 (N, 2) 배열로 계산
+- 행: y 중심을 정렬해 간격이 row_distance_threshold 이상인 곳에서 나누고,
+      각 박스는 평균 y가 가장 가까운 행에 배치 (searchsorted)
+- 열: 칸 수가 가장 많은 행들의 x 중심으로 열 중심을 잡은 뒤, 모든 박스의 x 중심으로
+      1차원 k-means를 반복해 다듬고 가장 가까운 열에 배치.
+      같은 행·열의 텍스트는 x 순서로 공백을 넣어 잇고, 해당 열에 텍스트가 없으면 빈 칸으로 둠
+  (모든 행이 같은 열 수를 가지므로 markdown 표의 칸이 맞춰짐)
+
+박스 수 N에 대해 O(N log N) 이며, bench_table.py 로 이전 구현과 비교할 수 있습니다.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+KMEANS_ITERATIONS = 10
+
+
+def box_centers(ocr_result: list) -> tuple[list[str], np.ndarray]:
+    """텍스트가 있는 항목의 (텍스트 목록, 박스 중심 좌표 (N, 2))"""
+    items = [item for item in ocr_result if item.get('text')]
+    texts = [item['text'] for item in items]
+    if not items:
+        return texts, np.empty((0, 2))
+    try:
+        centers = np.asarray([item['bbox'] for item in items], dtype=np.float64).mean(axis=1)
+    except ValueError:
+        # 꼭짓점 수가 다른 박스가 섞여 있으면 박스마다 계산
+        centers = np.array([np.asarray(item['bbox'], dtype=np.float64).mean(axis=0) for item in items])
+    return texts, centers
+
+
+def detect_table_structure(ocr_result: list, row_distance_threshold: float) -> dict:
+    """
+    y 중심 간격으로 행을 나눠 표 구조 감지
+
+    Returns:
+        {"is_table": 2행 이상인지, "rows": 행별 y 중심 목록, "row_centers": 행별 평균 y 배열}
+    """
+    if not ocr_result:
+        return {"is_table": False, "rows": []}
+
+    _, centers = box_centers(ocr_result)
+    if not len(centers):
+        return {"is_table": False, "rows": []}
+
+    ys = np.sort(centers[:, 1])
+    # 이전 y와의 간격이 임계값 이상인 곳에서 새 행 시작
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(ys) >= row_distance_threshold) + 1))
+    counts = np.diff(np.append(starts, len(ys)))
+    row_centers = np.add.reduceat(ys, starts) / counts
+
+    return {
+        "is_table": len(starts) >= 2,
+        "rows": [row.tolist() for row in np.split(ys, starts[1:])],
+        "row_centers": row_centers,
+    }
+
+
+def nearest_sorted(centers: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """정렬된 centers 중 각 값에 가장 가까운 것의 인덱스 (거리가 같으면 앞쪽)"""
+    if len(centers) == 1:
+        return np.zeros(len(values), dtype=np.intp)
+    hi = np.clip(np.searchsorted(centers, values), 1, len(centers) - 1)
+    lo = hi - 1
+    return np.where(np.abs(centers[hi] - values) < np.abs(values - centers[lo]), hi, lo)
+
+
+def cluster_columns(xs: np.ndarray, row_index: np.ndarray, n_rows: int) -> tuple[np.ndarray, int]:
+    """x 중심을 열로 묶음. (박스별 열 인덱스, 열 수)"""
+    counts = np.bincount(row_index, minlength=n_rows)
+    n_cols = int(counts.max()) if len(counts) else 0
+    if n_cols <= 1:
+        return np.zeros(len(xs), dtype=np.intp), max(n_cols, 1)
+
+    # 초기 열 중심: 칸 수가 가장 많은 행들의 x 중심을 위치별로 평균
+    order = np.lexsort((xs, row_index))
+    full = np.isin(row_index[order], np.flatnonzero(counts == n_cols))
+    centers = np.sort(xs[order][full].reshape(-1, n_cols).mean(axis=0))
+
+    # 1차원 k-means
+    for _ in range(KMEANS_ITERATIONS):
+        labels = nearest_sorted(centers, xs)
+        sums = np.bincount(labels, weights=xs, minlength=n_cols)
+        sizes = np.bincount(labels, minlength=n_cols)
+        updated = np.sort(np.where(sizes > 0, sums / np.maximum(sizes, 1), centers))
+        if np.allclose(updated, centers):
+            break
+        centers = updated
+
+    return nearest_sorted(centers, xs), n_cols
+
+
+def format_table_markdown(ocr_result: list, table_info: dict) -> str:
+    """행·열에 맞춘 markdown 표 (첫 행이 헤더)"""
+    if not table_info["is_table"]:
+        return ""
+
+    texts, centers = box_centers(ocr_result)
+    if not texts:
+        return ""
+
+    row_centers = table_info.get("row_centers")
+    if row_centers is None:
+        row_centers = np.array([sum(row) / len(row) for row in table_info["rows"]])
+
+    row_index = nearest_sorted(np.asarray(row_centers), centers[:, 1])
+    col_index, n_cols = cluster_columns(centers[:, 0], row_index, len(row_centers))
+
+    # 행, 열, x 순으로 정렬해 칸을 채움
+    table: dict[int, list[list[str]]] = {}
+    for i in np.lexsort((centers[:, 0], col_index, row_index)).tolist():
+        cells = table.setdefault(int(row_index[i]), [[] for _ in range(n_cols)])
+        cells[col_index[i]].append(texts[i].replace("|", "\\|"))
+
+    lines = []
+    for n, row in enumerate(sorted(table)):
+        lines.append("| " + " | ".join(" ".join(cell) for cell in table[row]) + " |")
+        if n == 0:  # 헤더 행
+            lines.append("| " + " | ".join(["---"] * n_cols) + " |")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_http_cache.py
+------------------
+HTTPCache 중복 내용 URL 검증자 기록 테스트 (python -m pytest test_http_cache.py)
+"""
+from __future__ import annotations
+
+from http_cache import HTTPCache
+
+BASE_URL = "http://example.com/"
+
+
+def make_cache(tmp_path) -> tuple[HTTPCache, str]:
+    saved = tmp_path / "a.png"
+    saved.write_bytes(b"png")
+    return HTTPCache(str(tmp_path / "cache")), str(saved)
+
+
+def test_duplicate_waits_for_first_url(tmp_path):
+    cache, saved = make_cache(tmp_path)
+    cache.store_duplicate(BASE_URL + "dup.png", {"ETag": '"e1"'}, "h1")
+    cache.store(BASE_URL + "a.png", {"ETag": '"e0"'}, saved, "h1")
+
+    assert cache.lookup(BASE_URL + "dup.png")["etag"] == '"e1"'
+    assert cache.lookup(BASE_URL + "a.png")["etag"] == '"e0"'
+
+
+def test_first_url_without_validators_still_records_duplicates(tmp_path):
+    cache, saved = make_cache(tmp_path)
+    cache.store_duplicate(BASE_URL + "dup.png", {"ETag": '"e1"'}, "h1")
+    cache.store(BASE_URL + "a.png", {}, saved, "h1")
+
+    assert cache.lookup(BASE_URL + "a.png") is None
+    entry = cache.lookup(BASE_URL + "dup.png")
+    assert entry is not None and entry["etag"] == '"e1"'
+    assert not cache._pending
+
+    # 이후에 오는 중복 URL은 기다리지 않고 바로 기록
+    cache.store_duplicate(BASE_URL + "dup2.png", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, "h1")
+    assert cache.lookup(BASE_URL + "dup2.png")["path"] == entry["path"]
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_image_collector.py
+-----------------------
+ImageCollector.parse_starttag 가 표준 html.parser 와 같은 태그를 처리하는지 테스트
+(python -m pytest test_image_collector.py)
+"""
+from __future__ import annotations
+
+from html.parser import HTMLParser
+
+from image_collector import ImageCollector
+
+BASE_URL = "http://example.com/"
+RAW_TEXT_HTML = (
+    "<html><head><title>제목 <img src=/in-title.png></title>"
+    "<style>.a { background: url(/bg.png) } <img src=/in-style.png></style>"
+    "<script>document.write('<img src=/in-script.png>')</script></head>"
+    "<body><textarea><img src=/in-textarea.png></textarea>"
+    "<img src=/ok.png><a href=/next.html>다음</a></body></html>"
+)
+
+
+class _StdlibImgParser(HTMLParser):
+    """비교 기준: 기본 parse_starttag 로 모은 <img src>"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.srcs: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "img":
+            self.srcs.extend(value for name, value in attrs if name == "src")
+
+
+def collect(html: str, chunk: int | None = None) -> ImageCollector:
+    collector = ImageCollector(BASE_URL)
+    if chunk:
+        for i in range(0, len(html), chunk):
+            collector.feed(html[i:i + chunk])
+    else:
+        collector.feed(html)
+    collector.close()
+    return collector
+
+
+def test_raw_text_elements_match_stdlib_parser():
+    stdlib = _StdlibImgParser()
+    stdlib.feed(RAW_TEXT_HTML)
+    stdlib.close()
+    expected = [BASE_URL.rstrip("/") + src for src in stdlib.srcs]
+
+    collector = collect(RAW_TEXT_HTML)
+    images = [url for url in collector.image_urls if not url.endswith("/bg.png")]
+    assert images == expected
+    assert collector.links == ["http://example.com/next.html"]
+
+
+def test_script_style_and_rcdata_contents_are_not_markup():
+    collector = collect(RAW_TEXT_HTML)
+    assert "http://example.com/ok.png" in collector.image_urls
+    assert "http://example.com/in-style.png" not in collector.image_urls
+    assert "http://example.com/in-script.png" not in collector.image_urls
+    if "title" in getattr(HTMLParser, "RCDATA_CONTENT_ELEMENTS", ()):
+        # <title>/<textarea> 를 RCDATA 로 다루는 CPython 에서는 안의 <img>를 모으지 않음
+        assert "http://example.com/in-title.png" not in collector.image_urls
+        assert "http://example.com/in-textarea.png" not in collector.image_urls
+
+
+def test_chunked_feed_gives_same_result():
+    assert collect(RAW_TEXT_HTML, chunk=7).image_urls == collect(RAW_TEXT_HTML).image_urls
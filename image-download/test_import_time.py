@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_import_time.py
+-------------------
+OCR 진입점 임포트 시간 예산과 무거운 모듈 지연 임포트 회귀 테스트 (python -m pytest test_import_time.py)
+자세한 수치는 bench_import.py 로 확인합니다.
+"""
+from __future__ import annotations
+
+import pytest
+
+from bench_import import DEFAULT_MODULES, HEAVY_MODULES, import_profile
+
+BUDGET_MS = 150.0
+REPEAT = 3
+
+
+@pytest.mark.parametrize("module", DEFAULT_MODULES)
+def test_entry_point_import_budget(module):
+    best = float("inf")
+    heavy = set()
+    for _ in range(REPEAT):
+        seconds, imported = import_profile(module)
+        best = min(best, seconds)
+        heavy |= imported & set(HEAVY_MODULES)
+
+    assert not heavy, f"{module} 가 무거운 모듈을 임포트함: {sorted(heavy)}"
+    assert best * 1000 <= BUDGET_MS, f"{module} 임포트 {best * 1000:.1f}ms > 예산 {BUDGET_MS:.0f}ms"
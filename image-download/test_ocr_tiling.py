@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_ocr_tiling.py
+------------------
+ocr_tiling.strip_ranges 경계 조건 테스트 (python -m pytest test_ocr_tiling.py)
+"""
+from __future__ import annotations
+
+from ocr_tiling import merge_strip_results, strip_ranges
+
+
+def assert_covers(ranges: list[tuple[int, int]], height: int, overlap: int) -> None:
+    assert ranges[0][0] == 0 and ranges[-1][1] == height
+    for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert end - next_start == overlap
+
+
+def test_not_taller_than_tile():
+    assert strip_ranges(1000, 1000, 160) == [(0, 1000)]
+    assert strip_ranges(500, 0, 160) == [(0, 500)]
+
+
+def test_just_above_tile_height_extends_single_strip():
+    # 1px 남았다고 거의 같은 띠를 하나 더 OCR하지 않음
+    assert strip_ranges(1001, 1000, 160) == [(0, 1001)]
+    assert strip_ranges(1160, 1000, 160) == [(0, 1160)]
+
+
+def test_remainder_within_overlap_extends_last_strip():
+    # 두 번째 띠(840~1840) 뒤로 100px(< 160) 남음
+    ranges = strip_ranges(1940, 1000, 160)
+    assert ranges == [(0, 1000), (840, 1940)]
+    assert_covers(ranges, 1940, 160)
+
+
+def test_remainder_beyond_overlap_keeps_overlap():
+    # 마지막 띠를 끝에 맞춰 당기지 않고 짧게 두어 겹침이 overlap을 넘지 않음
+    ranges = strip_ranges(1161, 1000, 160)
+    assert ranges == [(0, 1000), (840, 1161)]
+    assert_covers(ranges, 1161, 160)
+
+    ranges = strip_ranges(5000, 1000, 160)
+    assert_covers(ranges, 5000, 160)
+    assert all(end - start <= 1000 + 160 for start, end in ranges)
+
+
+def test_overlap_clamped_to_half_tile():
+    ranges = strip_ranges(301, 100, 400)
+    assert_covers(ranges, 301, 50)
+
+
+def test_merge_keeps_one_copy_of_line_in_overlap():
+    ranges = strip_ranges(1161, 1000, 160)
+    line = {'text': '가', 'confidence': 0.9, 'bbox': [[0, 900], [50, 900], [50, 930], [0, 930]]}
+    shifted = dict(line, bbox=[[x, y - 840] for x, y in line['bbox']])
+    merged = merge_strip_results([[line], [shifted]], ranges)
+    assert [item['bbox'] for item in merged] == [line['bbox']]